@@ -3,13 +3,15 @@ import streamlit as st
 from openai import OpenAI
 import os
 import re
-import hashlib
 from datetime import datetime
 from collections import Counter
 import requests
 import json
 import pandas as pd
 
+from chat_context import DEFAULT_BUDGET, ContextBuilder, navigator_summary
+from response_cache import DEFAULT_PATH, ResponseCache, conversation_key
+
 # --- PAGE SETUP ---
 st.set_page_config(page_title="UK Health Data Assistant", page_icon=":microscope:", layout="centered")
 
@@ -66,6 +68,16 @@ def load_system_prompt():
 ✅ REMEMBER:
 - You are here to enable faster, fairer, more responsible use of UK health data for public benefit."""
 
+@st.cache_resource
+def get_context_builder():
+    """Shared prompt builder: caches the system prefix and per-message token counts"""
+    return ContextBuilder()
+
+@st.cache_resource
+def get_response_cache():
+    """Response cache shared by every session, persisted across restarts"""
+    return ResponseCache(os.environ.get("RESPONSE_CACHE_PATH", DEFAULT_PATH))
+
 # --- DATASET LINKS DATABASE ---
 DATASET_LINKS = {
     "HDR UK": "https://www.hdruk.ac.uk/",
@@ -116,11 +128,6 @@ def export_conversation_md():
 
     return md_content
 
-def get_cache_key(prompt, model, temperature):
-    """Generate cache key for a query"""
-    key_string = f"{prompt}_{model}_{temperature}"
-    return hashlib.md5(key_string.encode()).hexdigest()
-
 # --- HDR UK GATEWAY API INTEGRATION ---
 HDR_API_BASE = "https://api.www.healthdatagateway.org/api/v1"
 HDR_WEB_BASE = "https://www.healthdatagateway.org"
@@ -263,9 +270,6 @@ if "api_key" not in st.session_state:
 if "feedback" not in st.session_state:
     st.session_state.feedback = {}
 
-if "response_cache" not in st.session_state:
-    st.session_state.response_cache = {}
-
 if "usage_stats" not in st.session_state:
     st.session_state.usage_stats = {
         "total_queries": 0,
@@ -335,15 +339,32 @@ with st.sidebar:
     st.header("🤖 Model Settings")
     model = st.selectbox("Model", ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo"], index=0)
     temperature = st.slider("Temperature", 0.0, 1.0, 0.3, 0.1, help="Lower = more focused, Higher = more creative")
+    context_budget = st.slider(
+        "Context budget (tokens)", 2000, 32000, DEFAULT_BUDGET, 1000,
+        help="Older messages beyond this are summarised to keep long chats fast and cheap",
+    )
 
     # ENABLE CACHING
-    use_cache = st.checkbox("Enable smart caching", value=True, help="Cache responses to reduce API calls")
+    use_cache = st.checkbox("Enable smart caching", value=True, help="Reuse answers to identical conversations across all sessions")
+    if use_cache:
+        cache_stats = get_response_cache().stats()
+        if cache_stats["lifetime_hits"] + cache_stats["lifetime_misses"]:
+            st.caption(
+                f"Cache: {cache_stats['entries']:,} answers, "
+                f"{cache_stats['lifetime_hit_rate']:.0%} hit rate"
+            )
 
     # USAGE STATISTICS
     st.divider()
     st.header("📊 Usage Stats")
     total_queries = st.session_state.usage_stats["total_queries"]
     st.metric("Total Queries", total_queries)
+    if "last_context" in st.session_state:
+        last_context = st.session_state.last_context
+        st.caption(
+            f"Last prompt: ~{last_context['tokens']:,} tokens"
+            + (f" ({last_context['trimmed']} older messages summarised)" if last_context["trimmed"] else "")
+        )
 
     if st.session_state.usage_stats["topics"]:
         topic_counts = Counter(st.session_state.usage_stats["topics"])
@@ -501,12 +522,6 @@ if prompt := st.chat_input("Ask your health data question..."):
         topic = " ".join(prompt.split()[:4])
         st.session_state.usage_stats["topics"].append(topic)
 
-        # Check cache
-        cache_key = get_cache_key(prompt, model, temperature)
-        cached_response = None
-        if use_cache and cache_key in st.session_state.response_cache:
-            cached_response = st.session_state.response_cache[cache_key]
-
         # Add user message to chat
         st.session_state.messages.append({"role": "user", "content": prompt})
         with st.chat_message("user"):
@@ -519,6 +534,27 @@ if prompt := st.chat_input("Ask your health data question..."):
                 st.dataframe(comparison_df, use_container_width=True, hide_index=True)
                 st.info("💡 The assistant will provide additional context below.")
 
+        # Prepare messages for API: system prompt, Navigator context and as
+        # much recent conversation as fits the token budget
+        navigator = None
+        if "navigator_results" in st.session_state and st.session_state.navigator_results:
+            navigator = navigator_summary(st.session_state.navigator_results)
+
+        context = get_context_builder().build(
+            st.session_state.messages, load_system_prompt(), navigator,
+            model=model, budget=context_budget,
+        )
+        st.session_state.last_context = {
+            "tokens": context.tokens, "trimmed": context.trimmed,
+        }
+
+        # Check the shared cache, keyed on exactly what would be sent
+        cached_response = None
+        if use_cache:
+            response_cache = get_response_cache()
+            cache_key = conversation_key(context.messages, model, temperature)
+            cached_response = response_cache.get(cache_key)
+
         # Generate assistant response with streaming
         with st.chat_message("assistant"):
             message_placeholder = st.empty()
@@ -532,34 +568,11 @@ if prompt := st.chat_input("Ask your health data question..."):
                 # Generate new response
                 try:
                     client = OpenAI(api_key=st.session_state.api_key)
-                    system_prompt = load_system_prompt()
-
-                    # Prepare messages for API
-                    api_messages = [{"role": "system", "content": system_prompt}]
-
-                    # Inject Navigator context if available
-                    if "navigator_results" in st.session_state and st.session_state.navigator_results:
-                        nav_recs = st.session_state.navigator_results
-                        nav_summary = "\n".join(
-                            f"- {r.custodian.short_name} ({r.overall_score:.0f}% match, "
-                            f"~{r.estimated_total_weeks}wk, {r.estimated_cost_range})"
-                            for r in nav_recs[:6]
-                        )
-                        api_messages.append({
-                            "role": "system",
-                            "content": (
-                                "The user has completed the Data Access Navigator. "
-                                "Their top pathway recommendations:\n" + nav_summary + "\n"
-                                "Reference these when answering their questions about data access."
-                            ),
-                        })
-
-                    api_messages.extend(st.session_state.messages)
 
                     # Stream the response
                     stream = client.chat.completions.create(
                         model=model,
-                        messages=api_messages,
+                        messages=context.messages,
                         temperature=temperature,
                         stream=True
                     )
@@ -573,7 +586,7 @@ if prompt := st.chat_input("Ask your health data question..."):
 
                     # Cache the response
                     if use_cache:
-                        st.session_state.response_cache[cache_key] = full_response
+                        response_cache.put(cache_key, model, full_response)
 
                 except Exception as e:
                     error_message = str(e)
@@ -0,0 +1,241 @@
+"""Token-budgeted prompt context for the chat assistant.
+
+Every OpenAI call sends the system prompt, the Navigator summary (if the
+user has run the Navigator) and the conversation so far. ``ContextBuilder``
+keeps that within a token budget: the system prefix is built and counted
+once per distinct prompt/summary, each message is counted once, and the
+newest turns are kept verbatim while older ones are folded into a short
+extractive summary, so long sessions stop growing in cost and latency.
+
+Token counts use ``tiktoken`` when it is installed and a characters-per-
+token estimate otherwise.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import tiktoken
+except ImportError:  # token counts fall back to an estimate
+    tiktoken = None
+
+
+DEFAULT_BUDGET = 6000          # prompt tokens per call, excluding the reply
+DEFAULT_SUMMARY_TOKENS = 400   # cap on the summary of trimmed turns
+DEFAULT_KEEP_RECENT = 2        # newest messages always sent verbatim
+CHARS_PER_TOKEN = 4            # estimate used without tiktoken
+MESSAGE_OVERHEAD = 4           # per-message framing tokens in the chat format
+NAVIGATOR_TOP_N = 6
+QUESTION_TOKENS = 60            # cap per earlier question in the summary
+MIN_QUESTION_TOKENS = 8         # shorter than this, a question is left out
+
+Message = Dict[str, str]
+
+_ENCODINGS: Dict[str, Any] = {}
+
+
+def _encoding(model: str):
+    if tiktoken is None:
+        return None
+    if model not in _ENCODINGS:
+        try:
+            _ENCODINGS[model] = tiktoken.encoding_for_model(model)
+        except KeyError:
+            _ENCODINGS[model] = tiktoken.get_encoding("o200k_base")
+    return _ENCODINGS[model]
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    """Number of tokens in ``text`` for ``model`` (estimated without tiktoken)."""
+    encoding = _encoding(model)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _truncate(text: str, tokens: int, model: str) -> str:
+    """Cut ``text`` to at most ``tokens`` tokens, ending with an ellipsis if cut."""
+    if count_tokens(text, model) <= tokens:
+        return text
+    encoding = _encoding(model)
+    if encoding is None:
+        return text[: max(tokens - 1, 0) * CHARS_PER_TOKEN].rstrip() + "…"
+    return encoding.decode(encoding.encode(text, disallowed_special=())[: max(tokens - 1, 0)]).rstrip() + "…"
+
+
+def navigator_summary(recommendations: Sequence[Any], top_n: int = NAVIGATOR_TOP_N) -> str:
+    """System message text describing the user's top Navigator recommendations."""
+    lines = "\n".join(
+        f"- {r.custodian.short_name} ({r.overall_score:.0f}% match, "
+        f"~{r.estimated_total_weeks}wk, {r.estimated_cost_range})"
+        for r in list(recommendations)[:top_n]
+    )
+    return (
+        "The user has completed the Data Access Navigator. "
+        "Their top pathway recommendations:\n" + lines + "\n"
+        "Reference these when answering their questions about data access."
+    )
+
+
+@dataclass
+class ChatContext:
+    """Messages for one API call and how they were fitted to the budget."""
+    messages: List[Message]
+    tokens: int                   # estimated prompt tokens
+    prefix_tokens: int            # system prompt plus Navigator summary
+    trimmed: int = 0              # older messages folded into the summary
+    summary: Optional[str] = None
+    over_budget: bool = False     # even the minimal context exceeds the budget
+
+
+class ContextBuilder:
+    """Builds budgeted message lists, caching the system prefix and token counts.
+
+    The newest ``keep_recent`` messages are always sent. Older messages are
+    added newest first while they fit; the rest are replaced by one system
+    message listing the earlier user questions, capped at ``summary_tokens``.
+    One builder can be shared across sessions and threads.
+    """
+
+    def __init__(
+        self,
+        budget: int = DEFAULT_BUDGET,
+        summary_tokens: int = DEFAULT_SUMMARY_TOKENS,
+        keep_recent: int = DEFAULT_KEEP_RECENT,
+        model: str = "gpt-4o",
+        maxsize: int = 4096,
+    ):
+        self.budget = budget
+        self.summary_tokens = summary_tokens
+        self.keep_recent = keep_recent
+        self.model = model
+        self.maxsize = maxsize
+        self._counts: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._prefixes: "OrderedDict[Tuple[str, str, str], Tuple[Tuple[Message, ...], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # -- cached pieces --
+
+    def message_tokens(self, message: Message, model: Optional[str] = None) -> int:
+        """Tokens for one message including framing, counted once per content."""
+        model = model or self.model
+        key = (model, hashlib.sha1(f"{message['role']}\0{message['content']}".encode("utf-8")).hexdigest())
+        with self._lock:
+            cached = self._counts.get(key)
+            if cached is not None:
+                self._counts.move_to_end(key)
+                return cached
+        tokens = MESSAGE_OVERHEAD + count_tokens(message["content"], model)
+        with self._lock:
+            self._counts[key] = tokens
+            while len(self._counts) > self.maxsize:
+                self._counts.popitem(last=False)
+        return tokens
+
+    def prefix(self, system_prompt: str, navigator: Optional[str] = None,
+               model: Optional[str] = None) -> Tuple[List[Message], int]:
+        """System prompt and Navigator summary messages with their token count.
+
+        The prefix is kept byte-identical across calls, which also lets the
+        API's own prompt caching reuse it.
+        """
+        model = model or self.model
+        key = (model, system_prompt, navigator or "")
+        with self._lock:
+            cached = self._prefixes.get(key)
+            if cached is not None:
+                self._prefixes.move_to_end(key)
+                return list(cached[0]), cached[1]
+        messages: List[Message] = [{"role": "system", "content": system_prompt}]
+        if navigator:
+            messages.append({"role": "system", "content": navigator})
+        tokens = sum(self.message_tokens(m, model) for m in messages)
+        with self._lock:
+            self._prefixes[key] = (tuple(messages), tokens)
+            while len(self._prefixes) > 16:
+                self._prefixes.popitem(last=False)
+        return messages, tokens
+
+    # -- assembly --
+
+    def _summarise(self, dropped: Sequence[Message], tokens: int, model: str) -> Optional[str]:
+        """List the dropped user questions within ``tokens``, keeping the newest.
+
+        A question longer than the space left is shortened to fit. Returns
+        None when not even one question fits, rather than a bare header.
+        """
+        header = f"Summary of {len(dropped)} earlier messages omitted for length. The user previously asked:"
+        remaining = tokens - count_tokens(header, model)
+        questions: List[str] = []
+        for message in reversed(dropped):
+            if message["role"] != "user":
+                continue
+            # One token each for the newline and the bullet
+            room = min(QUESTION_TOKENS, remaining - 2)
+            if room < MIN_QUESTION_TOKENS:
+                break
+            line = "- " + _truncate(" ".join(message["content"].split()), room, model)
+            cost = count_tokens(line, model) + 1
+            if cost > remaining:
+                break
+            questions.append(line)
+            remaining -= cost
+        if not questions:
+            return None
+        return _truncate("\n".join([header] + questions[::-1]), tokens, model)
+
+    def build(
+        self,
+        history: Sequence[Message],
+        system_prompt: str,
+        navigator: Optional[str] = None,
+        model: Optional[str] = None,
+        budget: Optional[int] = None,
+    ) -> ChatContext:
+        """Fit the prefix and as much recent ``history`` as possible into ``budget`` tokens."""
+        model = model or self.model
+        budget = self.budget if budget is None else budget
+        prefix, prefix_tokens = self.prefix(system_prompt, navigator, model)
+
+        history = [{"role": m["role"], "content": m["content"]} for m in history]
+        costs = [self.message_tokens(m, model) for m in history]
+        recent = max(len(history) - self.keep_recent, 0)
+        used = prefix_tokens + sum(costs[recent:])
+
+        start = recent
+        reserve = self.summary_tokens + MESSAGE_OVERHEAD if recent else 0
+        while start > 0 and used + costs[start - 1] + (reserve if start > 1 else 0) <= budget:
+            start -= 1
+            used += costs[start]
+
+        summary = None
+        messages = list(prefix)
+        allowance = min(self.summary_tokens, budget - used - MESSAGE_OVERHEAD)
+        if start and allowance > 0:
+            summary = self._summarise(history[:start], allowance, model)
+        if summary is not None:
+            summary_message = {"role": "system", "content": summary}
+            messages.append(summary_message)
+            used += self.message_tokens(summary_message, model)
+        messages.extend(history[start:])
+
+        return ChatContext(
+            messages=messages,
+            tokens=used,
+            prefix_tokens=prefix_tokens,
+            trimmed=start,
+            summary=summary,
+            over_budget=used > budget,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "counted_messages": len(self._counts),
+            "prefixes": len(self._prefixes),
+            "tokenizer": "tiktoken" if tiktoken is not None else "estimate",
+        }
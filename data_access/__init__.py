@@ -6,14 +6,34 @@ from data_access.models import (
     GovernanceBody, GovernanceTier, DataCustodian,
     ResearcherProfile, PathwayRecommendation,
 )
-from data_access.loader import load_all_custodians, load_governance_bodies, get_custodian
-from data_access.navigator import rank_pathways
+from data_access.costs import CostModel, FeeAmount
+from data_access.loader import load_all_custodians, load_governance_bodies, get_custodian, data_fingerprint
+from data_access.features import CustodianFeatures, compile_features
+from data_access.navigator import GovernanceResolver, rank_pathways, rank_pathways_batch
+from data_access.cache import RecommendationCache, profile_fingerprint
+from data_access.registry import CustodianRegistry, RegistrySnapshot, get_registry
+from data_access.api import RecommenderAPI
+from data_access.snapshot import CatalogueSnapshot, build_snapshot, load_snapshot
+from data_access.planner import CombinationPlan, plan_combinations
+from data_access.reports import ReportGenerator, render_report
+from data_access.sensitivity import SensitivityReport, weight_sensitivity
+from data_access.timeline import TimelineDistribution, simulate_timelines, simulate_recommendation_timelines
 
 __all__ = [
     "AccessModel", "Region", "EntityType",
     "TimelineEstimate", "CostEstimate", "AccessRequirement", "AccessStep",
     "GovernanceBody", "GovernanceTier", "DataCustodian",
     "ResearcherProfile", "PathwayRecommendation",
-    "load_all_custodians", "load_governance_bodies", "get_custodian",
-    "rank_pathways",
+    "CostModel", "FeeAmount",
+    "load_all_custodians", "load_governance_bodies", "get_custodian", "data_fingerprint",
+    "CustodianFeatures", "compile_features",
+    "GovernanceResolver", "rank_pathways", "rank_pathways_batch",
+    "RecommendationCache", "profile_fingerprint",
+    "CustodianRegistry", "RegistrySnapshot", "get_registry",
+    "RecommenderAPI",
+    "CatalogueSnapshot", "build_snapshot", "load_snapshot",
+    "CombinationPlan", "plan_combinations",
+    "ReportGenerator", "render_report",
+    "SensitivityReport", "weight_sensitivity",
+    "TimelineDistribution", "simulate_timelines", "simulate_recommendation_timelines",
 ]
@@ -0,0 +1,358 @@
+"""Headless JSON API for the pathway recommender.
+
+A dependency-free ASGI application over the shared in-memory registry::
+
+    GET  /health                      registry version and cache statistics
+    GET  /custodians[?region=&data_type=&tag=]
+    GET  /custodians/{id}
+    GET  /governance
+    GET  /governance/{id}
+    POST /rank                        {"profile": {...}, "top_k": 5, ...}
+
+Serve it with any ASGI server, e.g. ``uvicorn data_access.api:app`` (or
+``python -m data_access.api`` when uvicorn is installed).
+
+Catalogue responses are serialised once per registry version. Rankings go
+through a ``RecommendationCache`` and their encoded responses are cached
+per canonical profile and options; identical requests already in flight
+share one computation, which runs in a thread pool off the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, fields
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from data_access.cache import RecommendationCache, profile_fingerprint
+from data_access.models import PathwayRecommendation, ResearcherProfile
+from data_access.registry import CustodianRegistry, RegistrySnapshot, get_registry
+
+
+# Largest request body accepted, in bytes
+MAX_BODY = 64 * 1024
+
+# Profile fields that change the ranking and must be supplied
+_REQUIRED_PROFILE_FIELDS = (
+    "researcher_type", "data_needs", "geographic_scope",
+    "study_type", "timeline_priority", "budget_range",
+)
+_BOOL_PROFILE_FIELDS = ("needs_data_extraction", "needs_repeat_access", "needs_section_251")
+_PROFILE_FIELDS = {f.name for f in fields(ResearcherProfile)}
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class ApiError(Exception):
+    """An error reported to the client as ``{"error": message}``."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _encode(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Request parsing
+# ---------------------------------------------------------------------------
+
+def parse_profile(data: Any) -> ResearcherProfile:
+    """Build a ``ResearcherProfile`` from a JSON object, or raise ``ApiError(400)``."""
+    if not isinstance(data, dict):
+        raise ApiError(400, "'profile' must be an object")
+    missing = [name for name in _REQUIRED_PROFILE_FIELDS if name not in data]
+    if missing:
+        raise ApiError(400, f"profile is missing {', '.join(missing)}")
+    unknown = sorted(set(data) - _PROFILE_FIELDS)
+    if unknown:
+        raise ApiError(400, f"unknown profile fields: {', '.join(unknown)}")
+    for name in ("data_needs", "geographic_scope"):
+        if not isinstance(data[name], list) or not all(isinstance(v, str) for v in data[name]):
+            raise ApiError(400, f"profile.{name} must be a list of strings")
+    for name in _BOOL_PROFILE_FIELDS:
+        if name in data and not isinstance(data[name], bool):
+            raise ApiError(400, f"profile.{name} must be true or false")
+    for name in sorted(_PROFILE_FIELDS - set(_BOOL_PROFILE_FIELDS) - {"data_needs", "geographic_scope"}):
+        if name in data and not isinstance(data[name], str):
+            raise ApiError(400, f"profile.{name} must be a string")
+
+    values = {name: "" for name in ("institution_country", "ethics_status", "funding_status", "population_size")}
+    values.update(data)
+    return ResearcherProfile(**values)
+
+
+def _option(body: Dict[str, Any], name: str, kind: type, minimum: float = 0) -> Optional[Any]:
+    value = body.get(name)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ApiError(400, f"'{name}' must be {'an integer' if kind is int else 'a number'}")
+    if not math.isfinite(value):
+        raise ApiError(400, f"'{name}' must be a finite number")
+    if kind is int and value != int(value):
+        raise ApiError(400, f"'{name}' must be an integer")
+    if value < minimum:
+        raise ApiError(400, f"'{name}' must be at least {minimum}")
+    return kind(value)
+
+
+def recommendation_json(rec: PathwayRecommendation, explain: bool = True) -> Dict[str, Any]:
+    """JSON-ready view of one recommendation."""
+    out: Dict[str, Any] = {
+        "custodian_id": rec.custodian.id,
+        "custodian": rec.custodian.short_name,
+        "overall_score": rec.overall_score,
+        "dimension_scores": rec.dimension_scores,
+        "estimated_total_weeks": rec.estimated_total_weeks,
+        "estimated_cost_range": rec.estimated_cost_range,
+        "access_model": rec.custodian.access_model,
+        "required_governance": [g.id for g in rec.required_governance],
+        "url": rec.custodian.url,
+    }
+    if rec.timeline_percentiles is not None:
+        out["timeline_percentiles"] = rec.timeline_percentiles
+    if explain:
+        out["match_reasons"] = rec.match_reasons
+        out["concerns"] = rec.concerns
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Application
+# ---------------------------------------------------------------------------
+
+class RecommenderAPI:
+    """ASGI application serving rankings and the catalogue as JSON."""
+
+    def __init__(
+        self,
+        registry: Optional[CustodianRegistry] = None,
+        cache_size: int = 1024,
+        workers: int = 4,
+    ):
+        self._registry = registry
+        self.cache_size = cache_size
+        self.recommendations = RecommendationCache(maxsize=cache_size)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rank")
+        self._responses: "OrderedDict[Tuple[Any, ...], bytes]" = OrderedDict()
+        self._responses_version: Optional[int] = None
+        self._inflight: Dict[Tuple[Any, ...], "asyncio.Future[bytes]"] = {}
+        self._catalogue: Dict[str, bytes] = {}
+        self._catalogue_version: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def registry(self) -> CustodianRegistry:
+        if self._registry is None:
+            self._registry = get_registry()
+        return self._registry
+
+    # -- ASGI entry point --
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        try:
+            status, body = await self._dispatch(scope, receive)
+        except ApiError as exc:
+            status, body = exc.status, _encode({"error": exc.message})
+        except Exception as exc:  # never leak a traceback to the client
+            print(f"[api] Error handling {scope.get('path')}: {exc}")
+            status, body = 500, _encode({"error": "internal error"})
+
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json; charset=utf-8"),
+                (b"content-length", str(len(body)).encode("ascii")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _lifespan(self, receive: Receive, send: Send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.registry.snapshot()  # load the catalogue before serving
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self._executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _dispatch(self, scope: Scope, receive: Receive) -> Tuple[int, bytes]:
+        method = scope["method"]
+        parts = [p for p in scope["path"].split("/") if p]
+        snapshot = self.registry.snapshot()
+
+        if parts == ["rank"]:
+            if method != "POST":
+                raise ApiError(405, "use POST for /rank")
+            return 200, await self._rank(snapshot, await self._read_json(receive))
+
+        if method != "GET":
+            raise ApiError(405, f"{method} not allowed")
+        if parts == ["health"]:
+            return 200, _encode({
+                "status": "ok",
+                "version": snapshot.version,
+                "custodians": len(snapshot.custodians),
+                "cache": self.recommendations.stats(),
+                "responses_cached": len(self._responses),
+            })
+        if parts and parts[0] == "custodians" and len(parts) <= 2:
+            return 200, self._custodians(snapshot, parts[1:], scope.get("query_string", b""))
+        if parts and parts[0] == "governance" and len(parts) <= 2:
+            return 200, self._governance(snapshot, parts[1:])
+        raise ApiError(404, "not found")
+
+    async def _read_json(self, receive: Receive) -> Dict[str, Any]:
+        chunks: List[bytes] = []
+        size = 0
+        while True:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY:
+                raise ApiError(413, "request body too large")
+            chunks.append(chunk)
+            if not message.get("more_body"):
+                break
+        try:
+            body = json.loads(b"".join(chunks) or b"{}")
+        except ValueError:
+            raise ApiError(400, "request body is not valid JSON")
+        if not isinstance(body, dict):
+            raise ApiError(400, "request body must be a JSON object")
+        return body
+
+    # -- catalogue --
+
+    def _catalogue_bytes(self, snapshot: RegistrySnapshot, key: str, build: Callable[[], Any]) -> bytes:
+        """Encoded catalogue listings, rebuilt only when the registry version changes."""
+        with self._lock:
+            if snapshot.version != self._catalogue_version:
+                self._catalogue.clear()
+                self._catalogue_version = snapshot.version
+            cached = self._catalogue.get(key)
+        if cached is None:
+            cached = _encode(build())
+            with self._lock:
+                if snapshot.version == self._catalogue_version:
+                    self._catalogue[key] = cached
+        return cached
+
+    def _custodians(self, snapshot: RegistrySnapshot, rest: List[str], query_string: bytes) -> bytes:
+        if rest:
+            custodian = snapshot.custodian(rest[0])
+            if custodian is None:
+                raise ApiError(404, f"unknown custodian {rest[0]!r}")
+            return self._catalogue_bytes(snapshot, f"custodian:{custodian.id}", lambda: asdict(custodian))
+
+        query = parse_qs(query_string.decode("latin-1"))
+        if not query:
+            return self._catalogue_bytes(
+                snapshot, "custodians", lambda: [asdict(c) for c in snapshot.custodians],
+            )
+        selected = snapshot.filter(
+            regions=query.get("region"), data_types=query.get("data_type"), tags=query.get("tag"),
+        )
+        return _encode([asdict(c) for c in selected])
+
+    def _governance(self, snapshot: RegistrySnapshot, rest: List[str]) -> bytes:
+        if rest:
+            body = snapshot.governance_body(rest[0])
+            if body is None:
+                raise ApiError(404, f"unknown governance body {rest[0]!r}")
+            return self._catalogue_bytes(snapshot, f"governance:{body.id}", lambda: asdict(body))
+        return self._catalogue_bytes(
+            snapshot, "governance", lambda: [asdict(b) for b in snapshot.governance_bodies],
+        )
+
+    # -- ranking --
+
+    async def _rank(self, snapshot: RegistrySnapshot, body: Dict[str, Any]) -> bytes:
+        profile = parse_profile(body.get("profile"))
+        top_k = _option(body, "top_k", int)
+        min_score = _option(body, "min_score", float)
+        timeline_percentile = _option(body, "timeline_percentile", int, minimum=1)
+        if timeline_percentile is not None and timeline_percentile > 99:
+            raise ApiError(400, "'timeline_percentile' must be between 1 and 99")
+        explain = body.get("explain", True)
+        if not isinstance(explain, bool):
+            raise ApiError(400, "'explain' must be true or false")
+
+        key = (snapshot.version, profile_fingerprint(profile), top_k, min_score, timeline_percentile, explain)
+        with self._lock:
+            # Responses for an older registry version can never be served again
+            if snapshot.version != self._responses_version:
+                self._responses.clear()
+                self._responses_version = snapshot.version
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._responses.move_to_end(key)
+                return cached
+
+        # Identical requests already being ranked share the one computation
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self._executor, self._rank_sync, snapshot, profile, top_k, min_score, timeline_percentile, explain,
+        )
+        self._inflight[key] = future
+        try:
+            encoded = await asyncio.shield(future)
+        finally:
+            self._inflight.pop(key, None)
+
+        with self._lock:
+            if snapshot.version != self._responses_version:
+                return encoded
+            self._responses[key] = encoded
+            while len(self._responses) > self.cache_size:
+                self._responses.popitem(last=False)
+        return encoded
+
+    def _rank_sync(self, snapshot: RegistrySnapshot, profile: ResearcherProfile, top_k: Optional[int],
+                   min_score: Optional[float], timeline_percentile: Optional[int], explain: bool) -> bytes:
+        recommendations = self.recommendations.rank(
+            profile, snapshot.custodians, snapshot.governance_bodies,
+            top_k=top_k, min_score=min_score, version=snapshot.version,
+            timeline_percentile=timeline_percentile,
+        )
+        return _encode({
+            "version": snapshot.version,
+            "count": len(recommendations),
+            "recommendations": [recommendation_json(rec, explain) for rec in recommendations],
+        })
+
+
+app = RecommenderAPI()
+
+
+if __name__ == "__main__":
+    try:
+        import uvicorn
+    except ImportError:
+        raise SystemExit("Serving the API needs an ASGI server, e.g. `pip install uvicorn`.")
+    uvicorn.run(app, host="127.0.0.1", port=8000)
@@ -0,0 +1,145 @@
+"""Memoised pathway recommendations keyed by profile and data version."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from data_access.loader import data_fingerprint
+from data_access.models import PathwayRecommendation, ResearcherProfile
+from data_access.navigator import rank_pathways
+
+
+# ---------------------------------------------------------------------------
+# Canonical profile key
+# ---------------------------------------------------------------------------
+
+def profile_fingerprint(profile: ResearcherProfile) -> str:
+    """Return a canonical hash of the profile fields that affect ranking.
+
+    List fields are compared as sets (data needs case-insensitively, as the
+    scorer does), and fields the scorer ignores — institution country,
+    ethics/funding status, population size, repeat access — are left out,
+    so near-identical form submissions share an entry.
+    """
+    canonical = {
+        "researcher_type": profile.researcher_type,
+        "data_needs": sorted({n.lower() for n in profile.data_needs}),
+        "geographic_scope": sorted(set(profile.geographic_scope)),
+        "study_type": profile.study_type,
+        "timeline_priority": profile.timeline_priority,
+        "budget_range": profile.budget_range,
+        "needs_data_extraction": bool(profile.needs_data_extraction),
+        "needs_section_251": bool(profile.needs_section_251),
+    }
+    payload = json.dumps(canonical, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def recommendations_digest(recommendations: List[PathwayRecommendation], *args: Any) -> str:
+    """Digest of what figures and reports read from a recommendation set.
+
+    Covers each custodian's content (via its hash; custodians are frozen),
+    scores, estimated weeks, speed basis and governance route, plus any
+    extra arguments, so a hot-reloaded catalogue edit changes the digest.
+    Hashes are per process, so digests are only stable within one.
+    """
+    digest = hashlib.sha256()
+    for rec in recommendations:
+        digest.update(repr((
+            rec.custodian.id,
+            hash(rec.custodian),
+            rec.overall_score,
+            sorted(rec.dimension_scores.items()),
+            rec.estimated_total_weeks,
+            rec.speed_basis,
+            [hash(g) for g in rec.required_governance],
+        )).encode("utf-8"))
+    digest.update(json.dumps(args, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Recommendation cache
+# ---------------------------------------------------------------------------
+
+class RecommendationCache:
+    """Thread-safe LRU cache in front of ``rank_pathways``.
+
+    Entries are keyed by ``profile_fingerprint`` plus the data version
+    (a ``RegistrySnapshot.version``, or by default
+    ``loader.data_fingerprint``); when the version changes, every entry
+    is dropped. The custodian and governance lists passed in
+    are assumed to be the ones that version describes.
+
+    The cache is shared by every session, so callers always receive fresh
+    copies of the cached recommendations; the cached instances themselves
+    are never handed out, mutated or rendered.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[Any, ...], List[PathwayRecommendation]]" = OrderedDict()
+        self._version: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def rank(
+        self,
+        profile: ResearcherProfile,
+        custodians,
+        governance_bodies,
+        top_k: Optional[int] = None,
+        min_score: Optional[float] = None,
+        version: Optional[Any] = None,
+        timeline_percentile: Optional[int] = None,
+    ) -> List[PathwayRecommendation]:
+        """Return cached recommendations for ``profile``, ranking on a miss."""
+        version = version if version is not None else data_fingerprint()
+        key = (profile_fingerprint(profile), top_k, min_score, timeline_percentile)
+
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return [rec.copy() for rec in cached]
+            self.misses += 1
+
+        recommendations = rank_pathways(
+            profile, custodians, governance_bodies, top_k=top_k, min_score=min_score,
+            timeline_percentile=timeline_percentile,
+        )
+
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = recommendations
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return [rec.copy() for rec in recommendations]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "version": self._version,
+        }
@@ -0,0 +1,249 @@
+"""Structured cost model parsed from custodian fee text.
+
+Custodian fees are published as free text ("GBP 3,000 - 9,000", "Free for
+academic researchers", "RAP compute charges apply"). ``parse_fee_text``
+turns one such string into a ``FeeAmount`` with a numeric range, a
+charging basis and any free-for condition; ``CostModel`` holds the parsed
+fees of one ``CostEstimate`` and prices a study of a given duration.
+
+``CostEstimate`` parses itself once at construction and keeps the result
+as ``CostEstimate.model``, so nothing here runs on the scoring path.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+
+# Charging bases
+ONE_OFF = "one_off"
+PER_YEAR = "per_year"
+PER_MONTH = "per_month"
+PER_DATASET = "per_dataset"
+
+_CURRENCIES = {"gbp": "GBP", "£": "GBP", "usd": "USD", "$": "USD", "eur": "EUR", "€": "EUR"}
+
+# An amount: optional currency, digits with thousands separators, optional k/m and "+"
+_AMOUNT = re.compile(
+    r"(?P<currency>gbp|usd|eur|£|\$|€)?\s*"
+    r"(?P<number>\d[\d,]*(?:\.\d+)?)\s*"
+    r"(?P<scale>k|m)?\b(?P<plus>\+)?"
+)
+# Two amounts joined by a dash or "to" form a range
+_RANGE_JOIN = re.compile(r"^\s*(?:-|–|—|to)\s*$")
+# Wording before an amount that makes it a ceiling ("Up to 5,000") or a floor ("From 500")
+_CEILING = re.compile(r"\b(?:up\s*to|max(?:imum)?|under|less\s+than|no\s+more\s+than)\W*$")
+_FLOOR = re.compile(r"\b(?:from|min(?:imum)?|at\s+least)\W*$")
+# Numbers that label rather than price: "Tier 2", "Band 3", "Phase 1"
+_LABEL = re.compile(r"\b(?:tier|band|level|phase|stage|option|category|year|version|v)\s*$")
+_YEAR = re.compile(r"^(?:19|20)\d\d$")
+_FREE_FOR = re.compile(r"\bfree\s+for\s+(?P<who>[^.;,]+)")
+# Words in a researcher type too generic to match a free-for condition on
+_GENERIC_WORDS = {"researcher", "researchers", "research", "analyst", "analysts", "sector", "other"}
+
+_BASIS_PATTERNS = (
+    (PER_MONTH, re.compile(r"per\s+month|/\s*month|monthly|\bpcm\b")),
+    (PER_YEAR, re.compile(r"per\s+(?:year|annum)|/\s*(?:yr|year)|annual|yearly|\bp\.?a\.?\b")),
+    (PER_DATASET, re.compile(r"per\s+dataset|/\s*dataset|each\s+dataset")),
+)
+
+
+@dataclass(frozen=True)
+class FeeAmount:
+    """One parsed fee.
+
+    ``minimum``/``maximum`` are whole currency units; ``maximum`` is None
+    when the fee is open-ended ("50,000+") or, with ``minimum`` also None,
+    when the text gives no amount at all ("Varies by SDE").
+    """
+    text: Optional[str] = None
+    minimum: Optional[int] = None
+    maximum: Optional[int] = None
+    currency: str = "GBP"
+    basis: str = ONE_OFF
+    free: bool = False               # free for everyone
+    free_for: Optional[str] = None   # condition after "free for ..." in the text
+
+    @property
+    def listed(self) -> bool:
+        """True if the custodian publishes this fee at all."""
+        return bool(self.text)
+
+    def waived_for(self, researcher_type: Optional[str]) -> bool:
+        """True if the "free for ..." condition names this researcher type.
+
+        Matches on the distinctive words of the type, so "Academic
+        researcher" satisfies "free for academic researchers". Generic
+        conditions ("free for approved research") match no type.
+        """
+        if not self.free_for or not researcher_type:
+            return False
+        words = set(re.findall(r"[a-z]+", researcher_type.lower())) - _GENERIC_WORDS
+        return any(re.search(rf"\b{word}", self.free_for) for word in words)
+
+    def bounds(self, researcher_type: Optional[str] = None) -> Tuple[int, Optional[int]]:
+        """Return (low, high) for one unit of ``basis``; high is None if unbounded or unknown.
+
+        A conditionally free fee costs nothing only for a ``researcher_type``
+        its condition names; otherwise its amount applies, or it is unpriced.
+        """
+        if self.free or not self.listed or self.waived_for(researcher_type):
+            return 0, 0
+        if self.minimum is None:
+            return 0, None
+        return self.minimum, self.maximum
+
+
+def _amount(match: "re.Match[str]") -> int:
+    value = float(match.group("number").replace(",", ""))
+    scale = match.group("scale")
+    if scale == "k":
+        value *= 1_000
+    elif scale == "m":
+        value *= 1_000_000
+    return int(value)
+
+
+def _is_priced(match: "re.Match[str]") -> bool:
+    return bool(match.group("currency") or match.group("scale") or "," in match.group("number"))
+
+
+def _is_label(lowered: str, match: "re.Match[str]") -> bool:
+    """True for plain numbers that are labels ("Tier 2") or years rather than prices."""
+    if _is_priced(match):
+        return False
+    return bool(_LABEL.search(lowered[:match.start()]) or _YEAR.match(match.group("number")))
+
+
+def parse_fee_text(text: Optional[str], basis: str = ONE_OFF) -> FeeAmount:
+    """Parse one fee string.
+
+    The price is the first amount with a currency, thousands separator or
+    k/m suffix, or failing that the first plain number that is not a label
+    ("Tier 2") or a year. If another amount follows it joined by a dash or
+    "to", that is the maximum; a trailing "+" or a leading "from" makes the
+    fee open-ended and a leading "up to" makes the amount a maximum with a
+    minimum of zero. ``basis`` is the charging basis implied by the field
+    the text came from, overridden by wording such as "per year".
+
+    Empty text and text mentioning "free" without a condition are free; a
+    "free for ..." condition is kept in ``free_for`` and applied per
+    researcher type by ``bounds``.
+    """
+    lowered = (text or "").strip().lower()
+
+    for name, pattern in _BASIS_PATTERNS:
+        if pattern.search(lowered):
+            basis = name
+            break
+
+    free_for = _FREE_FOR.search(lowered)
+    fee = dict(
+        text=text,
+        basis=basis,
+        free=lowered == "" or ("free" in lowered and free_for is None),
+        free_for=free_for.group("who").strip() if free_for else None,
+    )
+
+    matches = [m for m in _AMOUNT.finditer(lowered) if not _is_label(lowered, m)]
+    if not matches:
+        return FeeAmount(**fee)
+
+    index = next((i for i, m in enumerate(matches) if _is_priced(m)), 0)
+    first = matches[index]
+    following = matches[index + 1] if index + 1 < len(matches) else None
+    prefix = lowered[:first.start()]
+
+    minimum = _amount(first)
+    maximum: Optional[int] = minimum
+    currency = first.group("currency")
+    if first.group("plus") or _FLOOR.search(prefix):
+        maximum = None
+    elif _CEILING.search(prefix):
+        minimum = 0
+    elif following is not None and _RANGE_JOIN.match(lowered[first.end():following.start()]):
+        maximum = None if following.group("plus") else max(_amount(following), minimum)
+        currency = currency or following.group("currency")
+
+    return FeeAmount(
+        minimum=minimum,
+        maximum=maximum,
+        currency=_CURRENCIES.get(currency or "gbp", "GBP"),
+        **fee,
+    )
+
+
+@dataclass(frozen=True)
+class CostModel:
+    """Parsed fees of one custodian and total-cost-of-access pricing."""
+    application: FeeAmount = FeeAmount()
+    annual: FeeAmount = FeeAmount(basis=PER_YEAR)
+    per_dataset: FeeAmount = FeeAmount(basis=PER_DATASET)
+    tre: FeeAmount = FeeAmount()
+    free_for: Tuple[str, ...] = ()   # researcher types with no charges at all
+
+    @classmethod
+    def parse(
+        cls,
+        application_fee: Optional[str] = None,
+        annual_access_fee: Optional[str] = None,
+        per_dataset_fee: Optional[str] = None,
+        tre_fee: Optional[str] = None,
+        free_for: Sequence[str] = (),
+    ) -> "CostModel":
+        return cls(
+            application=parse_fee_text(application_fee, ONE_OFF),
+            annual=parse_fee_text(annual_access_fee, PER_YEAR),
+            per_dataset=parse_fee_text(per_dataset_fee, PER_DATASET),
+            tre=parse_fee_text(tre_fee, ONE_OFF),
+            free_for=tuple(free_for),
+        )
+
+    @property
+    def fees(self) -> Tuple[FeeAmount, ...]:
+        return (self.application, self.annual, self.per_dataset, self.tre)
+
+    @property
+    def conditional(self) -> bool:
+        """True if any fee is free only for some researchers."""
+        return any(fee.free_for for fee in self.fees)
+
+    def coefficients(
+        self,
+        researcher_type: Optional[str] = None,
+    ) -> Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]]:
+        """Return (low, high) cost per (study, year, dataset); high is inf when unbounded."""
+        fixed, yearly, dataset = [0.0, 0.0], [0.0, 0.0], [0.0, 0.0]
+        target = {ONE_OFF: (fixed, 1), PER_YEAR: (yearly, 1), PER_MONTH: (yearly, 12), PER_DATASET: (dataset, 1)}
+        for fee in self.fees:
+            low, high = fee.bounds(researcher_type)
+            column, scale = target[fee.basis]
+            column[0] += low * scale
+            column[1] += float("inf") if high is None else high * scale
+        return tuple(fixed), tuple(yearly), tuple(dataset)
+
+    def total_cost(
+        self,
+        years: float = 1.0,
+        datasets: int = 1,
+        researcher_type: Optional[str] = None,
+    ) -> Tuple[int, Optional[int]]:
+        """Return the (low, high) total cost of access for a study.
+
+        One-off fees are charged once, yearly and monthly fees for the
+        study duration and per-dataset fees for each dataset. ``high`` is
+        None when any applicable fee is open-ended or unpriced. Researcher
+        types listed in ``free_for`` pay nothing, and a fee that is free only
+        for some researchers ("Free for academic; industry via partnership
+        fees") is waived only for the types its condition names.
+        """
+        if researcher_type is not None and researcher_type in self.free_for:
+            return 0, 0
+        low = high = 0.0
+        for (unit_low, unit_high), units in zip(self.coefficients(researcher_type), (1, years, datasets)):
+            if units:
+                low += unit_low * units
+                high += unit_high * units
+        return round(low), None if high == float("inf") else round(high)
@@ -0,0 +1,241 @@
+"""Precompiled custodian feature matrix for vectorised pathway scoring."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from data_access.models import CostEstimate, DataCustodian
+
+
+# ---------------------------------------------------------------------------
+# Fee classification codes (mirrors the branches of navigator._score_cost)
+# ---------------------------------------------------------------------------
+
+FEE_UNSPECIFIED = 0  # no cost information at all
+FEE_FREE = 1         # application fee mentions "free" or is empty
+FEE_NUMERIC = 2      # first number in the fee string is the minimum fee
+FEE_UNPARSED = 3     # fee text with no number in it
+
+_MAX_FEE = np.iinfo(np.int64).max
+
+
+def parse_fee(costs: Optional[CostEstimate]) -> Tuple[int, int]:
+    """Return ``(fee code, minimum fee in GBP)`` for a custodian's costs."""
+    if costs is None:
+        return FEE_UNSPECIFIED, 0
+    if costs.application_fee_free:
+        return FEE_FREE, 0
+    if costs.min_application_fee is not None:
+        return FEE_NUMERIC, min(costs.min_application_fee, _MAX_FEE)
+    return FEE_UNPARSED, 0
+
+
+def _vocabulary(values: Sequence[Sequence[str]]) -> Dict[str, int]:
+    index: Dict[str, int] = {}
+    for group in values:
+        for value in group:
+            index.setdefault(value, len(index))
+    return index
+
+
+def _membership(values: Sequence[Sequence[str]], index: Dict[str, int]) -> np.ndarray:
+    matrix = np.zeros((len(values), len(index)), dtype=bool)
+    for row, group in enumerate(values):
+        for value in group:
+            matrix[row, index[value]] = True
+    return matrix
+
+
+# ---------------------------------------------------------------------------
+# Feature matrix
+# ---------------------------------------------------------------------------
+
+@dataclass
+class CustodianFeatures:
+    """Column-oriented view of a custodian list, one row per custodian.
+
+    Set-valued fields become boolean membership matrices over a vocabulary
+    (so set intersections become matrix products), categorical fields
+    become integer codes, and timeline/fee fields are reduced to numbers.
+    Custodians are treated as read-only once compiled.
+    """
+
+    custodians: List[DataCustodian]
+    data_type_index: Dict[str, int] = field(default_factory=dict)
+    data_type_bits: np.ndarray = field(default_factory=lambda: np.zeros((0, 0), dtype=bool))
+    region_index: Dict[str, int] = field(default_factory=dict)
+    region_bits: np.ndarray = field(default_factory=lambda: np.zeros((0, 0), dtype=bool))
+    uk_wide: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+    researcher_index: Dict[str, int] = field(default_factory=dict)
+    eligible_bits: np.ndarray = field(default_factory=lambda: np.zeros((0, 0), dtype=bool))
+    eligibility_open: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+    access_model_index: Dict[str, int] = field(default_factory=dict)
+    access_model_codes: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    tre_only: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+    speed_weeks: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    fee_codes: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int8))
+    min_fees: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    # (custodians, [per study, per year, per dataset], [low, high]) GBP; high is inf if unbounded
+    cost_coefficients: np.ndarray = field(default_factory=lambda: np.zeros((0, 3, 2)))
+    free_for_index: Dict[str, int] = field(default_factory=dict)
+    free_for_bits: np.ndarray = field(default_factory=lambda: np.zeros((0, 0), dtype=bool))
+    # Rows whose fees are free only for some researcher types (see CostModel.conditional)
+    conditional_costs: Tuple[int, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.custodians)
+
+    @classmethod
+    def build(cls, custodians: Sequence[DataCustodian]) -> "CustodianFeatures":
+        custodians = list(custodians)
+
+        data_types = [sorted({t.lower() for t in c.data_types}) for c in custodians]
+        regions = [c.regions for c in custodians]
+        eligible = [c.eligible_researchers for c in custodians]
+
+        data_type_index = _vocabulary(data_types)
+        region_index = _vocabulary(regions)
+        researcher_index = _vocabulary(eligible)
+        access_model_index = _vocabulary([[c.access_model] for c in custodians])
+
+        fees = [parse_fee(c.costs) for c in custodians]
+        free_for = [c.costs.free_for if c.costs else () for c in custodians]
+        free_for_index = _vocabulary(free_for)
+
+        return cls(
+            custodians=custodians,
+            data_type_index=data_type_index,
+            data_type_bits=_membership(data_types, data_type_index),
+            region_index=region_index,
+            region_bits=_membership(regions, region_index),
+            uk_wide=np.array(["UK-wide" in c.regions for c in custodians], dtype=bool),
+            researcher_index=researcher_index,
+            eligible_bits=_membership(eligible, researcher_index),
+            eligibility_open=np.array([not c.eligible_researchers for c in custodians], dtype=bool),
+            access_model_index=access_model_index,
+            access_model_codes=np.array(
+                [access_model_index[c.access_model] for c in custodians], dtype=np.int64
+            ),
+            tre_only=np.array([c.access_model == "tre_only" for c in custodians], dtype=bool),
+            # Timeline-less custodians are assumed to take 20 weeks when scoring speed
+            speed_weeks=np.array(
+                [c.total_typical_weeks if c.timeline else 20 for c in custodians],
+                dtype=np.int64,
+            ),
+            fee_codes=np.array([code for code, _ in fees], dtype=np.int8),
+            min_fees=np.array([fee for _, fee in fees], dtype=np.int64),
+            # Custodians without cost information are unpriced: (0, inf) per study
+            cost_coefficients=np.array(
+                [
+                    c.costs.model.coefficients() if c.costs else ((0.0, np.inf), (0.0, 0.0), (0.0, 0.0))
+                    for c in custodians
+                ],
+                dtype=float,
+            ).reshape(len(custodians), 3, 2),
+            free_for_index=free_for_index,
+            free_for_bits=_membership(free_for, free_for_index),
+            conditional_costs=tuple(i for i, c in enumerate(custodians) if c.costs and c.costs.model.conditional),
+        )
+
+    # -- profile-side encoding --
+
+    def data_type_vector(self, needs: Sequence[str]) -> Tuple[np.ndarray, int]:
+        """Return (membership vector, number of distinct needs) for data needs."""
+        needs_lower = {n.lower() for n in needs}
+        vector = np.zeros(len(self.data_type_index), dtype=bool)
+        for need in needs_lower:
+            col = self.data_type_index.get(need)
+            if col is not None:
+                vector[col] = True
+        return vector, len(needs_lower)
+
+    def region_vector(self, scope: Sequence[str]) -> Tuple[np.ndarray, int]:
+        """Return (membership vector, number of distinct regions) for a scope."""
+        scope_set = set(scope)
+        vector = np.zeros(len(self.region_index), dtype=bool)
+        for region in scope_set:
+            col = self.region_index.get(region)
+            if col is not None:
+                vector[col] = True
+        return vector, len(scope_set)
+
+    def eligibility_vector(self, researcher_type: str) -> np.ndarray:
+        """Return a per-custodian mask of custodians listing this researcher type."""
+        col = self.researcher_index.get(researcher_type)
+        if col is None:
+            return np.zeros(len(self.custodians), dtype=bool)
+        return self.eligible_bits[:, col]
+
+    def total_cost(
+        self,
+        years: float = 1.0,
+        datasets: int = 1,
+        researcher_type: Optional[str] = None,
+    ) -> np.ndarray:
+        """Return (custodians, 2) low/high total cost of access for a study.
+
+        Vectorised ``CostModel.total_cost``: high is ``inf`` where a fee is
+        open-ended or unpriced, custodians that waive all charges for
+        ``researcher_type`` cost nothing, and conditionally free fees are
+        waived only for the types their condition names.
+        """
+        coefficients = self.cost_coefficients
+        if researcher_type is not None and self.conditional_costs:
+            coefficients = coefficients.copy()
+            for row in self.conditional_costs:
+                coefficients[row] = self.custodians[row].costs.model.coefficients(researcher_type)
+        multipliers = np.array([1.0, years, datasets])
+        totals = np.einsum("k,nkb->nb", multipliers, np.nan_to_num(coefficients, posinf=0.0))
+        unbounded = (np.isinf(coefficients[:, :, 1]) & (multipliers > 0)).any(axis=1)
+        totals[unbounded, 1] = np.inf
+        if researcher_type is not None:
+            col = self.free_for_index.get(researcher_type)
+            if col is not None:
+                totals[self.free_for_bits[:, col]] = 0.0
+        return totals
+
+    def access_model_vector(self, models: Sequence[str]) -> np.ndarray:
+        """Return a per-custodian mask of custodians using one of ``models``."""
+        vector = np.zeros(len(self.access_model_index), dtype=bool)
+        for model in models:
+            col = self.access_model_index.get(model)
+            if col is not None:
+                vector[col] = True
+        return vector[self.access_model_codes]
+
+
+# ---------------------------------------------------------------------------
+# Compilation cache
+# ---------------------------------------------------------------------------
+
+_FEATURE_CACHE: "OrderedDict[Tuple[int, ...], Tuple[List[DataCustodian], CustodianFeatures]]" = OrderedDict()
+_FEATURE_CACHE_SIZE = 8
+
+
+def compile_features(
+    custodians: Union[Sequence[DataCustodian], CustodianFeatures],
+) -> CustodianFeatures:
+    """Return the feature matrix for a custodian list, compiling it at most once.
+
+    Compiled matrices are cached by the identity of the custodian objects,
+    so repeated rankings against the same loaded list reuse them.
+    """
+    if isinstance(custodians, CustodianFeatures):
+        return custodians
+
+    key = tuple(id(c) for c in custodians)
+    entry = _FEATURE_CACHE.get(key)
+    if entry is not None:
+        _FEATURE_CACHE.move_to_end(key)
+        return entry[1]
+
+    features = CustodianFeatures.build(custodians)
+    # Keep the custodian list alive alongside the entry so its ids stay unique
+    _FEATURE_CACHE[key] = (list(custodians), features)
+    while len(_FEATURE_CACHE) > _FEATURE_CACHE_SIZE:
+        _FEATURE_CACHE.popitem(last=False)
+    return features
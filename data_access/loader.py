@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 from pathlib import Path
@@ -139,39 +140,101 @@ def _parse_governance_body(data: dict) -> GovernanceBody:
 # Public API
 # ---------------------------------------------------------------------------
 
+_SCHEMA: Optional[dict] = None
+
+
+def _schema_problems(data: dict) -> List[str]:
+    """Validate a custodian payload against ``custodian_schema.json``.
+
+    The same check the snapshot build applies, so a file is accepted or
+    rejected alike whichever path loads it. Skipped if the schema is missing.
+    """
+    global _SCHEMA
+    from data_access.snapshot import validate_custodian
+
+    if _SCHEMA is None:
+        if not _SCHEMA_FILE.is_file():
+            return []
+        with open(_SCHEMA_FILE, "r", encoding="utf-8") as f:
+            _SCHEMA = json.load(f)
+    return validate_custodian(data, _SCHEMA)
+
+
+def _load_custodian_file(fp: Path) -> Optional[DataCustodian]:
+    """Parse and validate one custodian JSON file, or warn and return ``None``."""
+    try:
+        with open(fp, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        problems = _schema_problems(data)
+        if problems:
+            more = f" (+{len(problems) - 1} more)" if len(problems) > 1 else ""
+            print(f"[loader] Warning: {fp.name} fails schema validation: {problems[0]}{more}")
+            return None
+        return _parse_custodian(data)
+    except Exception as exc:
+        # Log but don't crash — partial data is better than nothing.
+        print(f"[loader] Warning: failed to load {fp.name}: {exc}")
+        return None
+
+
+def _load_governance_file(fp: Path) -> Optional[List[GovernanceBody]]:
+    """Parse the governance bodies file, or warn and return ``None``."""
+    try:
+        with open(fp, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return [_parse_governance_body(g) for g in data]
+    except Exception as exc:
+        print(f"[loader] Warning: failed to load governance bodies: {exc}")
+        return None
+
+
+def _fresh_snapshot():
+    """Return the compiled catalogue snapshot if it is up to date, else ``None``."""
+    from data_access.snapshot import load_snapshot
+
+    return load_snapshot()
+
+
 def load_all_custodians() -> List[DataCustodian]:
-    """Load every ``*.json`` file from ``data/custodians/`` and return parsed objects."""
+    """Load every ``*.json`` file from ``data/custodians/`` and return parsed objects.
+
+    Reads the compiled snapshot instead when one exists and is up to date.
+    """
+    snapshot = _fresh_snapshot()
+    if snapshot is not None:
+        return snapshot.custodians
+
     custodians: List[DataCustodian] = []
     if not _CUSTODIANS_DIR.is_dir():
         return custodians
     for fp in sorted(_CUSTODIANS_DIR.glob("*.json")):
-        try:
-            with open(fp, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            custodians.append(_parse_custodian(data))
-        except Exception as exc:
-            # Log but don't crash — partial data is better than nothing.
-            print(f"[loader] Warning: failed to load {fp.name}: {exc}")
+        custodian = _load_custodian_file(fp)
+        if custodian is not None:
+            custodians.append(custodian)
     return custodians
 
 
 def load_governance_bodies() -> List[GovernanceBody]:
-    """Load governance bodies from ``data/governance_bodies.json``."""
+    """Load governance bodies from ``data/governance_bodies.json`` (or a fresh snapshot)."""
+    snapshot = _fresh_snapshot()
+    if snapshot is not None:
+        return snapshot.governance_bodies
+
     if not _GOVERNANCE_FILE.is_file():
         return []
-    try:
-        with open(_GOVERNANCE_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return [_parse_governance_body(g) for g in data]
-    except Exception as exc:
-        print(f"[loader] Warning: failed to load governance bodies: {exc}")
-        return []
+    return _load_governance_file(_GOVERNANCE_FILE) or []
 
 
 def get_custodian(custodian_id: str, custodians: Optional[List[DataCustodian]] = None) -> Optional[DataCustodian]:
-    """Look up a single custodian by ID."""
+    """Look up a single custodian by ID.
+
+    Without an explicit list, uses the id index of the shared registry
+    snapshot instead of reloading every file.
+    """
     if custodians is None:
-        custodians = load_all_custodians()
+        from data_access.registry import get_registry
+
+        return get_registry().snapshot().custodian(custodian_id)
     for c in custodians:
         if c.id == custodian_id:
             return c
@@ -179,10 +242,29 @@ def get_custodian(custodian_id: str, custodians: Optional[List[DataCustodian]] =
 
 
 def get_governance_body(body_id: str, bodies: Optional[List[GovernanceBody]] = None) -> Optional[GovernanceBody]:
-    """Look up a single governance body by ID."""
+    """Look up a single governance body by ID (registry index when no list is given)."""
     if bodies is None:
-        bodies = load_governance_bodies()
+        from data_access.registry import get_registry
+
+        return get_registry().snapshot().governance_body(body_id)
     for b in bodies:
         if b.id == body_id:
             return b
     return None
+
+
+def data_fingerprint() -> str:
+    """Return a cheap version fingerprint of the custodian and governance JSON files.
+
+    Built from file names, sizes and modification times (one ``stat`` per
+    file), so it changes whenever a data file is added, removed or edited.
+    """
+    digest = hashlib.sha1()
+    paths = sorted(_CUSTODIANS_DIR.glob("*.json")) if _CUSTODIANS_DIR.is_dir() else []
+    for fp in paths + [_GOVERNANCE_FILE]:
+        try:
+            st = fp.stat()
+        except OSError:
+            continue
+        digest.update(f"{fp.name}:{st.st_size}:{st.st_mtime_ns};".encode("utf-8"))
+    return digest.hexdigest()
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import copy
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+from data_access.costs import CostModel
 
 
 # ---------------------------------------------------------------------------
@@ -32,11 +36,30 @@ class EntityType(str, Enum):
     INFRASTRUCTURE_PROVIDER = "infrastructure_provider"
 
 
+# ---------------------------------------------------------------------------
+# Immutable model helpers
+# ---------------------------------------------------------------------------
+
+# Catalogue models are frozen (shareable across sessions and threads, and
+# hashable) and slotted where dataclasses supports pickling frozen slotted
+# classes (3.11+). List inputs are stored as tuples.
+_FROZEN = {"frozen": True, "slots": True} if sys.version_info >= (3, 11) else {"frozen": True}
+
+def _freeze(obj, *names: str):
+    for name in names:
+        object.__setattr__(obj, name, tuple(getattr(obj, name)))
+
+
+def _derive(obj, **values):
+    for name, value in values.items():
+        object.__setattr__(obj, name, value)
+
+
 # ---------------------------------------------------------------------------
 # Building-block dataclasses
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_FROZEN)
 class TimelineEstimate:
     """One phase of the access process with duration range in weeks."""
     phase: str
@@ -46,28 +69,64 @@ class TimelineEstimate:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class CostEstimate:
-    """Estimated costs for accessing data from a custodian."""
+    """Estimated costs for accessing data from a custodian.
+
+    The fee texts are parsed once, at construction, into ``model`` (see
+    ``data_access.costs``); ``application_fee_free`` and
+    ``min_application_fee`` are the parts the scorer reads. The scorer has
+    always counted any fee mentioning "free" as free, including
+    conditional ones; ``total_cost`` applies the condition per researcher.
+    """
     application_fee: Optional[str] = None
     annual_access_fee: Optional[str] = None
     per_dataset_fee: Optional[str] = None
     tre_fee: Optional[str] = None
     notes: Optional[str] = None
-    free_for: List[str] = field(default_factory=list)
-
-
-@dataclass
+    free_for: Tuple[str, ...] = ()
+
+    model: CostModel = field(init=False, repr=False, compare=False)
+    application_fee_free: bool = field(init=False, repr=False, compare=False)
+    min_application_fee: Optional[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        _freeze(self, "free_for")
+        model = CostModel.parse(
+            self.application_fee, self.annual_access_fee, self.per_dataset_fee,
+            self.tre_fee, self.free_for,
+        )
+        _derive(
+            self,
+            model=model,
+            application_fee_free=model.application.free or model.application.free_for is not None,
+            min_application_fee=model.application.minimum,
+        )
+
+    def total_cost(
+        self,
+        years: float = 1.0,
+        datasets: int = 1,
+        researcher_type: Optional[str] = None,
+    ) -> Tuple[int, Optional[int]]:
+        """Return the (low, high) GBP cost of access for a study; see ``CostModel.total_cost``."""
+        return self.model.total_cost(years, datasets, researcher_type)
+
+
+@dataclass(**_FROZEN)
 class AccessRequirement:
     """A prerequisite the researcher must meet."""
     name: str
     description: str
     mandatory: bool = True
-    applies_to: List[str] = field(default_factory=list)
+    applies_to: Tuple[str, ...] = ()
     url: Optional[str] = None
 
+    def __post_init__(self):
+        _freeze(self, "applies_to")
 
-@dataclass
+
+@dataclass(**_FROZEN)
 class AccessStep:
     """A discrete step in the access journey."""
     order: int
@@ -82,7 +141,7 @@ class AccessStep:
 # Governance bodies
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_FROZEN)
 class GovernanceTier:
     """One tier of a multi-tier governance body (e.g. PBPP Tier 1 / Tier 2)."""
     tier_name: str
@@ -91,7 +150,7 @@ class GovernanceTier:
     criteria: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_FROZEN)
 class GovernanceBody:
     """A governance / approval body that sits across custodian pathways."""
     id: str
@@ -99,18 +158,24 @@ class GovernanceBody:
     short_name: str
     description: str
     url: Optional[str] = None
-    nations: List[str] = field(default_factory=list)
+    nations: Tuple[str, ...] = ()
     role: Optional[str] = None
-    tiers: List[GovernanceTier] = field(default_factory=list)
+    tiers: Tuple[GovernanceTier, ...] = ()
+
+    def __post_init__(self):
+        _freeze(self, "nations", "tiers")
 
 
 # ---------------------------------------------------------------------------
 # Core entities
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_FROZEN)
 class DataCustodian:
-    """Complete profile of a UK health data custodian / pathway."""
+    """Complete profile of a UK health data custodian / pathway.
+
+    Timeline totals and the cost summary are derived once at construction.
+    """
     id: str
     name: str
     short_name: str
@@ -118,49 +183,57 @@ class DataCustodian:
     url: str
 
     entity_type: str = EntityType.DATA_CUSTODIAN.value
-    regions: List[str] = field(default_factory=list)
+    regions: Tuple[str, ...] = ()
     access_model: str = AccessModel.TRE_ONLY.value
 
     population_coverage: Optional[str] = None
     patient_count: Optional[str] = None
 
-    data_types: List[str] = field(default_factory=list)
-    key_datasets: List[str] = field(default_factory=list)
-    linkages: List[str] = field(default_factory=list)
+    data_types: Tuple[str, ...] = ()
+    key_datasets: Tuple[str, ...] = ()
+    linkages: Tuple[str, ...] = ()
 
     tre_platform: Optional[str] = None
-    eligible_researchers: List[str] = field(default_factory=list)
+    eligible_researchers: Tuple[str, ...] = ()
 
-    requirements: List[AccessRequirement] = field(default_factory=list)
-    access_steps: List[AccessStep] = field(default_factory=list)
-    timeline: List[TimelineEstimate] = field(default_factory=list)
+    requirements: Tuple[AccessRequirement, ...] = ()
+    access_steps: Tuple[AccessStep, ...] = ()
+    timeline: Tuple[TimelineEstimate, ...] = ()
     costs: Optional[CostEstimate] = None
 
-    strengths: List[str] = field(default_factory=list)
-    limitations: List[str] = field(default_factory=list)
-    recent_changes: List[str] = field(default_factory=list)
+    strengths: Tuple[str, ...] = ()
+    limitations: Tuple[str, ...] = ()
+    recent_changes: Tuple[str, ...] = ()
 
-    related_governance_bodies: List[str] = field(default_factory=list)
+    related_governance_bodies: Tuple[str, ...] = ()
     gateway_search_term: Optional[str] = None
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = ()
     contact_email: Optional[str] = None
     last_updated: Optional[str] = None
 
-    # -- derived helpers --
-    @property
-    def total_typical_weeks(self) -> int:
-        return sum(t.typical_weeks for t in self.timeline)
-
-    @property
-    def total_min_weeks(self) -> int:
-        return sum(t.min_weeks for t in self.timeline)
-
-    @property
-    def total_max_weeks(self) -> int:
-        return sum(t.max_weeks for t in self.timeline)
-
-    @property
-    def cost_summary(self) -> str:
+    # -- derived fields --
+    total_typical_weeks: int = field(init=False, repr=False, compare=False)
+    total_min_weeks: int = field(init=False, repr=False, compare=False)
+    total_max_weeks: int = field(init=False, repr=False, compare=False)
+    cost_summary: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        _freeze(
+            self,
+            "regions", "data_types", "key_datasets", "linkages", "eligible_researchers",
+            "requirements", "access_steps", "timeline",
+            "strengths", "limitations", "recent_changes",
+            "related_governance_bodies", "tags",
+        )
+        _derive(
+            self,
+            total_typical_weeks=sum(t.typical_weeks for t in self.timeline),
+            total_min_weeks=sum(t.min_weeks for t in self.timeline),
+            total_max_weeks=sum(t.max_weeks for t in self.timeline),
+            cost_summary=self._summarise_costs(),
+        )
+
+    def _summarise_costs(self) -> str:
         if self.costs is None:
             return "Not specified"
         parts = []
@@ -179,15 +252,15 @@ class DataCustodian:
 # Researcher profile (form input)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(**_FROZEN)
 class ResearcherProfile:
     """Captures what the researcher needs - maps to the Navigator form."""
     researcher_type: str
     institution_country: str
     ethics_status: str
     funding_status: str
-    data_needs: List[str]
-    geographic_scope: List[str]
+    data_needs: Tuple[str, ...]
+    geographic_scope: Tuple[str, ...]
     population_size: str
     study_type: str
     timeline_priority: str
@@ -196,19 +269,87 @@ class ResearcherProfile:
     needs_repeat_access: bool = False
     needs_section_251: bool = False
 
+    def __post_init__(self):
+        _freeze(self, "data_needs", "geographic_scope")
+
 
 # ---------------------------------------------------------------------------
 # Recommendation output
 # ---------------------------------------------------------------------------
 
+class _LazyExplanation:
+    """Dataclass field descriptor that renders reasons/concerns on first access.
+
+    A ``None`` value means "not rendered yet"; reading the attribute then
+    asks the recommendation's ``explainer`` for both lists at once.
+
+    Rendering is not locked. A recommendation read from two threads at once
+    (the page and the report worker) may be rendered twice; the explainer is
+    deterministic, so either result is equivalent. Instances must not be
+    shared between sessions: ``RecommendationCache`` hands out copies.
+    """
+
+    def __set_name__(self, owner, name: str):
+        self.slot = f"_{name}"
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            raise AttributeError(self.slot)  # no class-level default
+        value = obj.__dict__.get(self.slot)
+        if value is None:
+            obj._render_explanation()
+            value = obj.__dict__[self.slot]
+        return value
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.slot] = value
+
+
 @dataclass
 class PathwayRecommendation:
-    """A scored recommendation for a single custodian pathway."""
+    """A scored recommendation for a single custodian pathway.
+
+    Unlike the catalogue models this stays a mutable, unslotted dataclass:
+    it is per-request output and renders its explanation lazily.
+    ``match_reasons`` and ``concerns`` may be passed as ``None`` together
+    with an ``explainer``; they are then rendered on first access.
+    """
     custodian: DataCustodian
     overall_score: float
     dimension_scores: Dict[str, float]
-    match_reasons: List[str]
-    concerns: List[str]
+    match_reasons: List[str] = _LazyExplanation()
+    concerns: List[str] = _LazyExplanation()
     estimated_total_weeks: int
     estimated_cost_range: str
     required_governance: List[GovernanceBody] = field(default_factory=list)
+    # Simulated completion-time percentiles ({"p50": ..., "p80": ..., "p95": ..., "mean": ...})
+    timeline_percentiles: Optional[Dict[str, float]] = None
+    # Percentile the speed score was based on (e.g. "P80"); None means summed typical weeks
+    speed_basis: Optional[str] = None
+    profile: Optional[ResearcherProfile] = field(default=None, repr=False, compare=False)
+    explainer: Optional[Callable[[PathwayRecommendation], Tuple[List[str], List[str]]]] = field(
+        default=None, repr=False, compare=False,
+    )
+
+    def copy(self) -> PathwayRecommendation:
+        """Copy with its own containers; a rendered explanation is carried over.
+
+        The custodian, governance bodies and profile are frozen and shared.
+        """
+        out = copy.copy(self)
+        out.dimension_scores = dict(self.dimension_scores)
+        out.required_governance = list(self.required_governance)
+        if self.timeline_percentiles is not None:
+            out.timeline_percentiles = dict(self.timeline_percentiles)
+        for name in ("match_reasons", "concerns"):
+            rendered = self.__dict__.get(f"_{name}")
+            if rendered is not None:
+                out.__dict__[f"_{name}"] = list(rendered)
+        return out
+
+    def _render_explanation(self):
+        reasons, concerns = self.explainer(self) if self.explainer else ([], [])
+        if self.__dict__.get("_match_reasons") is None:
+            self.__dict__["_match_reasons"] = reasons
+        if self.__dict__.get("_concerns") is None:
+            self.__dict__["_concerns"] = concerns
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
-
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from data_access.features import (
+    FEE_FREE,
+    FEE_NUMERIC,
+    FEE_UNSPECIFIED,
+    CustodianFeatures,
+    compile_features,
+)
 from data_access.models import (
     DataCustodian,
     GovernanceBody,
     PathwayRecommendation,
     ResearcherProfile,
 )
+from data_access.timeline import DEFAULT_PERCENTILES, TimelineDistribution, simulate_timelines
 
 
 # ---------------------------------------------------------------------------
@@ -25,6 +37,11 @@ WEIGHTS: Dict[str, float] = {
     "study_design": 0.10,
 }
 
+DIMENSIONS: Tuple[str, ...] = tuple(WEIGHTS)
+
+# Multiplier applied when a profile needs extracts but the custodian is TRE-only
+_EXTRACTION_PENALTY = 0.85
+
 # ---------------------------------------------------------------------------
 # Timeline urgency mapping (profile value → max acceptable typical weeks)
 # ---------------------------------------------------------------------------
@@ -131,22 +148,33 @@ def _score_eligibility(researcher_type: str, eligible: List[str]) -> Tuple[float
     return 20.0, [], [f"{researcher_type} may not be eligible — check with custodian"]
 
 
-def _score_speed(priority: str, custodian_timeline: list) -> Tuple[float, List[str], List[str]]:
+def _score_speed(
+    priority: str,
+    custodian_timeline: list,
+    simulated_weeks: Optional[float] = None,
+    basis: str = "",
+) -> Tuple[float, List[str], List[str]]:
     max_weeks = _URGENCY_MAP.get(priority, 200)
-    typical = sum(t.typical_weeks for t in custodian_timeline) if custodian_timeline else 20
+    if simulated_weeks is None:
+        typical = sum(t.typical_weeks for t in custodian_timeline) if custodian_timeline else 20
+        estimate = f"Estimated {typical} weeks"
+    else:
+        # Simulated completion-time percentile (see data_access.timeline)
+        typical = simulated_weeks
+        estimate = f"Estimated {simulated_weeks:.0f} weeks ({basis})"
 
     if typical <= max_weeks * 0.5:
         score = 100.0
-        reasons = [f"Estimated {typical} weeks — well within your timeframe"]
+        reasons = [f"{estimate} — well within your timeframe"]
     elif typical <= max_weeks:
         score = 70.0
-        reasons = [f"Estimated {typical} weeks — achievable within your timeframe"]
+        reasons = [f"{estimate} — achievable within your timeframe"]
     elif typical <= max_weeks * 1.5:
         score = 40.0
-        reasons = [f"Estimated {typical} weeks — may be tight for your timeline"]
+        reasons = [f"{estimate} — may be tight for your timeline"]
     else:
         score = 10.0
-        reasons = [f"Estimated {typical} weeks — likely exceeds your timeline"]
+        reasons = [f"{estimate} — likely exceeds your timeline"]
 
     return score, reasons, []
 
@@ -157,16 +185,12 @@ def _score_cost(budget: str, custodian_costs) -> Tuple[float, List[str], List[st
     if custodian_costs is None:
         return 50.0, ["Costs not fully specified"], ["Check costs with custodian"]
 
-    # Check if free
-    fee_str = (custodian_costs.application_fee or "").lower()
-    if "free" in fee_str or fee_str == "":
+    # Fee text is parsed once into custodian_costs.model (see data_access.costs)
+    if custodian_costs.application_fee_free:
         return 100.0, ["Free access"], []
 
-    # Try to parse a rough numeric from the fee string
-    import re
-    numbers = re.findall(r"[\d,]+", fee_str.replace(",", ""))
-    if numbers:
-        min_fee = int(numbers[0])
+    min_fee = custodian_costs.min_application_fee
+    if min_fee is not None:
         if min_fee <= max_budget:
             return 80.0, [f"Costs ({custodian_costs.application_fee}) within budget"], []
         else:
@@ -182,103 +206,348 @@ def _score_study_design(study_type: str, access_model: str) -> Tuple[float, List
     return 30.0, [], [f"Access model ({access_model.replace('_', ' ')}) may not suit {study_type}"]
 
 
+# ---------------------------------------------------------------------------
+# Vectorised scoring
+# ---------------------------------------------------------------------------
+
+def _score_matrix(
+    features: CustodianFeatures,
+    profiles: Sequence[ResearcherProfile],
+    speed_weeks: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Score every profile against every custodian at once.
+
+    Returns ``(dims, overall)`` where ``dims[d, p, c]`` is the score for
+    dimension ``DIMENSIONS[d]`` and ``overall[p, c]`` the weighted score
+    (extraction penalty applied, not yet rounded). Each dimension follows
+    the branches of the matching ``_score_*`` function exactly.
+
+    ``speed_weeks`` (profiles x custodians) replaces the summed typical
+    weeks in the speed dimension, e.g. with simulated percentiles.
+    """
+    n_profiles = len(profiles)
+
+    needs = [features.data_type_vector(p.data_needs) for p in profiles]
+    scopes = [features.region_vector(p.geographic_scope) for p in profiles]
+
+    def col(values: list) -> np.ndarray:
+        return np.array(values).reshape(n_profiles, 1)
+
+    needs_bits = np.array([v for v, _ in needs], dtype=np.int64).reshape(n_profiles, -1)
+    n_needs = col([n for _, n in needs])
+    scope_bits = np.array([v for v, _ in scopes], dtype=np.int64).reshape(n_profiles, -1)
+    n_scope = col([n for _, n in scopes])
+    scope_uk_wide = col(["UK-wide" in p.geographic_scope for p in profiles])
+    max_weeks = col([_URGENCY_MAP.get(p.timeline_priority, 200) for p in profiles])
+    max_budget = col([_BUDGET_MAP.get(p.budget_range, 999_999) for p in profiles])
+    extraction = col([p.needs_data_extraction for p in profiles])
+
+    eligible = np.array([features.eligibility_vector(p.researcher_type) for p in profiles]).reshape(n_profiles, -1)
+    compatible = np.array(
+        [features.access_model_vector(_STUDY_MODEL_COMPAT.get(p.study_type, [])) for p in profiles]
+    ).reshape(n_profiles, -1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        matched = needs_bits @ features.data_type_bits.T.astype(np.int64)
+        data_fit = np.where(n_needs == 0, 50.0, (matched / n_needs) * 100)
+
+        overlap = scope_bits @ features.region_bits.T.astype(np.int64)
+        geographic = np.select(
+            [n_scope == 0, features.uk_wide, (overlap == 0) & scope_uk_wide, overlap == 0],
+            [50.0, 100.0, 40.0, 0.0],
+            default=(overlap / n_scope) * 100,
+        )
+
+    eligibility = np.select(
+        [features.eligibility_open, eligible],
+        [70.0, 100.0],
+        default=20.0,
+    )
+
+    typical = features.speed_weeks if speed_weeks is None else speed_weeks
+    speed = np.select(
+        [typical <= max_weeks * 0.5, typical <= max_weeks, typical <= max_weeks * 1.5],
+        [100.0, 70.0, 40.0],
+        default=10.0,
+    )
+
+    fee_codes = features.fee_codes
+    cost = np.select(
+        [
+            fee_codes == FEE_UNSPECIFIED,
+            fee_codes == FEE_FREE,
+            (fee_codes == FEE_NUMERIC) & (features.min_fees <= max_budget),
+            fee_codes == FEE_NUMERIC,
+        ],
+        [50.0, 100.0, 80.0, 20.0],
+        default=50.0,
+    )
+
+    study_design = np.where(compatible, 100.0, 30.0)
+
+    shape = (n_profiles, len(features))
+    dims = np.stack([
+        np.broadcast_to(dim, shape)
+        for dim in (data_fit, geographic, eligibility, speed, cost, study_design)
+    ])
+
+    # Accumulate in WEIGHTS order so results match the scalar sum bit for bit
+    overall = np.zeros(shape)
+    for d, dim in enumerate(DIMENSIONS):
+        overall = overall + dims[d] * WEIGHTS[dim]
+    overall = np.where(extraction & features.tre_only, overall * _EXTRACTION_PENALTY, overall)
+
+    return dims, overall
+
+
 # ---------------------------------------------------------------------------
 # Governance resolution
 # ---------------------------------------------------------------------------
 
+class GovernanceResolver:
+    """Resolves the governance bodies each custodian route needs.
+
+    Built once from ``load_governance_bodies``. Resolution depends only on
+    the custodian and the profile's ``needs_section_251`` flag, so each
+    route is resolved at most once per feature matrix and flag value and
+    then becomes a table lookup. Rows are resolved on first use: ranking
+    only routes the custodians that make the cut.
+    """
+
+    def __init__(self, bodies: List[GovernanceBody]):
+        self.bodies = list(bodies)
+        self.body_map: Dict[str, GovernanceBody] = {b.id: b for b in self.bodies}
+        self._tables: "OrderedDict[int, Tuple[CustodianFeatures, Dict[bool, List[Optional[List[GovernanceBody]]]]]]" = OrderedDict()
+
+    def resolve(self, custodian: DataCustodian, needs_section_251: bool) -> List[GovernanceBody]:
+        """Determine which governance bodies are needed for this combination.
+
+        For PBPP (Scotland), selects the appropriate tier based on the researcher
+        profile rather than including both tiers.
+        """
+        body_map = self.body_map
+        needed: List[GovernanceBody] = []
+        needed_ids: set = set()
+
+        # Determine which PBPP tier is appropriate for Scottish custodians
+        pbpp_preferred = "pbpp_tier2" if needs_section_251 else "pbpp_tier1"
+        pbpp_excluded = "pbpp_tier1" if needs_section_251 else "pbpp_tier2"
+
+        # Include bodies listed by custodian, but filter PBPP to appropriate tier
+        for gid in custodian.related_governance_bodies:
+            if gid == pbpp_excluded:
+                continue  # skip the non-applicable PBPP tier
+            if gid in body_map and gid not in needed_ids:
+                needed.append(body_map[gid])
+                needed_ids.add(gid)
+
+        # Section 251 / CAG trigger
+        if needs_section_251:
+            cag = body_map.get("cag")
+            if cag and "cag" not in needed_ids:
+                cust_nations = set(custodian.regions)
+                cag_nations = {"England", "Wales"}
+                if cust_nations & cag_nations:
+                    needed.append(cag)
+                    needed_ids.add("cag")
+
+        # Scotland PBPP auto-inclusion (if not already added via custodian)
+        if "Scotland" in custodian.regions and pbpp_preferred not in needed_ids:
+            tier = body_map.get(pbpp_preferred)
+            if tier:
+                needed.append(tier)
+                needed_ids.add(pbpp_preferred)
+
+        return needed
+
+    def _table(self, features: CustodianFeatures) -> Dict[bool, List[Optional[List[GovernanceBody]]]]:
+        entry = self._tables.get(id(features))
+        if entry is not None and entry[0] is features:
+            self._tables.move_to_end(id(features))
+            return entry[1]
+
+        table = {flag: [None] * len(features.custodians) for flag in (False, True)}
+        self._tables[id(features)] = (features, table)
+        while len(self._tables) > _RESOLVER_TABLES:
+            self._tables.popitem(last=False)
+        return table
+
+    def route(self, features: CustodianFeatures, row: int, needs_section_251: bool) -> List[GovernanceBody]:
+        """Return the governance route for one custodian row of a feature matrix."""
+        routes = self._table(features)[needs_section_251]
+        route = routes[row]
+        if route is None:
+            route = routes[row] = self.resolve(features.custodians[row], needs_section_251)
+        return route
+
+    def routes_for(self, features: CustodianFeatures) -> Dict[bool, List[List[GovernanceBody]]]:
+        """Return ``{needs_section_251: [route per custodian row]}``, resolving every row."""
+        table = self._table(features)
+        for flag, routes in table.items():
+            for row, route in enumerate(routes):
+                if route is None:
+                    routes[row] = self.resolve(features.custodians[row], flag)
+        return table
+
+
+_RESOLVER_TABLES = 8
+_RESOLVER_CACHE: "OrderedDict[int, Tuple[List[GovernanceBody], GovernanceResolver]]" = OrderedDict()
+
+
+def governance_resolver(
+    governance_bodies: Union[List[GovernanceBody], GovernanceResolver],
+) -> GovernanceResolver:
+    """Return a resolver for a governance body list, building it at most once."""
+    if isinstance(governance_bodies, GovernanceResolver):
+        return governance_bodies
+
+    entry = _RESOLVER_CACHE.get(id(governance_bodies))
+    if entry is not None and entry[0] is governance_bodies:
+        _RESOLVER_CACHE.move_to_end(id(governance_bodies))
+        return entry[1]
+
+    resolver = GovernanceResolver(governance_bodies)
+    _RESOLVER_CACHE[id(governance_bodies)] = (governance_bodies, resolver)
+    while len(_RESOLVER_CACHE) > _RESOLVER_TABLES:
+        _RESOLVER_CACHE.popitem(last=False)
+    return resolver
+
+
 def _resolve_governance(
     profile: ResearcherProfile,
     custodian: DataCustodian,
     all_bodies: List[GovernanceBody],
 ) -> List[GovernanceBody]:
-    """Determine which governance bodies are needed for this combination.
+    """Determine which governance bodies are needed for this combination."""
+    return governance_resolver(all_bodies).resolve(custodian, profile.needs_section_251)
+
+
+# ---------------------------------------------------------------------------
+# Simulated timelines
+# ---------------------------------------------------------------------------
+
+_TIMELINE_TABLES = 8
+_TIMELINE_CACHE: "OrderedDict[Tuple[int, int, bool, int], Tuple[CustodianFeatures, GovernanceResolver, TimelineDistribution]]" = OrderedDict()
+
 
-    For PBPP (Scotland), selects the appropriate tier based on the researcher
-    profile rather than including both tiers.
+def simulated_timelines(
+    features: CustodianFeatures,
+    resolver: GovernanceResolver,
+    needs_section_251: bool,
+    percentile: int,
+) -> TimelineDistribution:
+    """Return simulated completion times for every custodian's pathway.
+
+    Each row covers one custodian plus the governance route it needs for
+    the given ``needs_section_251`` value. Simulations are seeded, so they
+    are cached per (features, resolver, route flag, percentile).
     """
-    body_map = {b.id: b for b in all_bodies}
-    needed: List[GovernanceBody] = []
-    needed_ids: set = set()
-
-    # Determine which PBPP tier is appropriate for Scottish custodians
-    pbpp_preferred = "pbpp_tier2" if profile.needs_section_251 else "pbpp_tier1"
-    pbpp_excluded = "pbpp_tier1" if profile.needs_section_251 else "pbpp_tier2"
-
-    # Include bodies listed by custodian, but filter PBPP to appropriate tier
-    for gid in custodian.related_governance_bodies:
-        if gid == pbpp_excluded:
-            continue  # skip the non-applicable PBPP tier
-        if gid in body_map and gid not in needed_ids:
-            needed.append(body_map[gid])
-            needed_ids.add(gid)
-
-    # Section 251 / CAG trigger
-    if profile.needs_section_251:
-        cag = body_map.get("cag")
-        if cag and "cag" not in needed_ids:
-            cust_nations = set(custodian.regions)
-            cag_nations = {"England", "Wales"}
-            if cust_nations & cag_nations:
-                needed.append(cag)
-                needed_ids.add("cag")
-
-    # Scotland PBPP auto-inclusion (if not already added via custodian)
-    if "Scotland" in custodian.regions and pbpp_preferred not in needed_ids:
-        tier = body_map.get(pbpp_preferred)
-        if tier:
-            needed.append(tier)
-            needed_ids.add(pbpp_preferred)
-
-    return needed
+    if not 0 < percentile < 100:
+        raise ValueError(f"timeline_percentile must be between 1 and 99, got {percentile}")
+
+    key = (id(features), id(resolver), needs_section_251, percentile)
+    entry = _TIMELINE_CACHE.get(key)
+    if entry is not None and entry[0] is features and entry[1] is resolver:
+        _TIMELINE_CACHE.move_to_end(key)
+        return entry[2]
+
+    # Every custodian is scored on its simulated time, so every row is routed
+    routes = [resolver.route(features, row, needs_section_251) for row in range(len(features.custodians))]
+    distribution = simulate_timelines(
+        list(zip(features.custodians, routes)),
+        percentiles=sorted(set(DEFAULT_PERCENTILES) | {percentile}),
+    )
+    _TIMELINE_CACHE[key] = (features, resolver, distribution)
+    while len(_TIMELINE_CACHE) > _TIMELINE_TABLES:
+        _TIMELINE_CACHE.popitem(last=False)
+    return distribution
 
 
 # ---------------------------------------------------------------------------
 # Main ranking function
 # ---------------------------------------------------------------------------
 
-def rank_pathways(
+def _explain(
     profile: ResearcherProfile,
-    custodians: List[DataCustodian],
-    governance_bodies: List[GovernanceBody],
+    custodian: DataCustodian,
+    simulated_weeks: Optional[float] = None,
+    basis: str = "",
+) -> Tuple[List[str], List[str]]:
+    """Collect the reasons and concerns behind a custodian's dimension scores."""
+    all_reasons: List[str] = []
+    all_concerns: List[str] = []
+    for _, reasons, concerns in (
+        _score_data_fit(profile.data_needs, custodian.data_types),
+        _score_geography(profile.geographic_scope, custodian.regions),
+        _score_eligibility(profile.researcher_type, custodian.eligible_researchers),
+        _score_speed(profile.timeline_priority, custodian.timeline, simulated_weeks, basis),
+        _score_cost(profile.budget_range, custodian.costs),
+        _score_study_design(profile.study_type, custodian.access_model),
+    ):
+        all_reasons.extend(reasons)
+        all_concerns.extend(concerns)
+
+    if profile.needs_data_extraction and custodian.access_model == "tre_only":
+        all_concerns.append("TRE-only — no data extraction available")
+    return all_reasons, all_concerns
+
+
+def explain_recommendation(rec: PathwayRecommendation) -> Tuple[List[str], List[str]]:
+    """Render ``(match_reasons, concerns)`` for a recommendation.
+
+    Used as the recommendation's lazy ``explainer``, so the text is only
+    built for recommendations that are actually displayed.
+    """
+    simulated_weeks = None
+    if rec.speed_basis and rec.timeline_percentiles:
+        simulated_weeks = rec.timeline_percentiles[rec.speed_basis.lower()]
+    reasons, concerns = _explain(rec.profile, rec.custodian, simulated_weeks, rec.speed_basis or "")
+    if rec.required_governance:
+        gov_names = [g.short_name for g in rec.required_governance]
+        reasons.append(f"Governance route: {', '.join(gov_names)}")
+    return reasons, concerns
+
+
+def _select(overall_row: List[float], top_k: Optional[int], min_score: Optional[float]) -> Tuple[List[int], List[float]]:
+    """Return the custodian rows that make the cut, best first, and their rounded scores.
+
+    Scores come from the vectorised pass, so they are exact rather than
+    estimates; only rows that survive the cutoff are explained and get a
+    governance route. Ties keep catalogue order, as a stable full sort would.
+    """
+    rounded = np.array([round(score, 1) for score in overall_row])
+    order = np.argsort(-rounded, kind="stable")
+    if min_score is not None:
+        order = order[rounded[order] >= min_score]
+    if top_k is not None:
+        order = order[:max(top_k, 0)]
+    return order.tolist(), rounded[order].tolist()
+
+
+def _recommend(
+    profile: ResearcherProfile,
+    features: CustodianFeatures,
+    dims: np.ndarray,
+    overall_row: List[float],
+    resolver: GovernanceResolver,
+    top_k: Optional[int] = None,
+    min_score: Optional[float] = None,
+    timelines: Optional[TimelineDistribution] = None,
+    speed_basis: Optional[str] = None,
 ) -> List[PathwayRecommendation]:
-    """Score and rank all custodians against the researcher's profile.
+    """Build the sorted recommendations for one profile's score rows.
 
-    Returns a descending-sorted list of ``PathwayRecommendation`` objects.
+    Only numbers are computed here; reasons and concerns are rendered on
+    first access, and only the selected rows are routed through governance.
     """
+    rows, scores = _select(overall_row, top_k, min_score)
+    dim_rows = dims[:, rows].T.tolist()
+
     recommendations: List[PathwayRecommendation] = []
 
-    for custodian in custodians:
-        all_reasons: List[str] = []
-        all_concerns: List[str] = []
-        dim_scores: Dict[str, float] = {}
-
-        # --- score each dimension ---
-        for dim, scorer in [
-            ("data_fit", lambda: _score_data_fit(profile.data_needs, custodian.data_types)),
-            ("geographic", lambda: _score_geography(profile.geographic_scope, custodian.regions)),
-            ("eligibility", lambda: _score_eligibility(profile.researcher_type, custodian.eligible_researchers)),
-            ("speed", lambda: _score_speed(profile.timeline_priority, custodian.timeline)),
-            ("cost", lambda: _score_cost(profile.budget_range, custodian.costs)),
-            ("study_design", lambda: _score_study_design(profile.study_type, custodian.access_model)),
-        ]:
-            score, reasons, concerns = scorer()
-            dim_scores[dim] = score
-            all_reasons.extend(reasons)
-            all_concerns.extend(concerns)
-
-        # --- weighted overall ---
-        overall = sum(dim_scores[k] * WEIGHTS[k] for k in WEIGHTS)
-
-        # --- data extraction check ---
-        if profile.needs_data_extraction and custodian.access_model == "tre_only":
-            all_concerns.append("TRE-only — no data extraction available")
-            overall *= 0.85  # penalty
-
-        # --- resolve governance ---
-        gov = _resolve_governance(profile, custodian, governance_bodies)
-        if gov:
-            gov_names = [g.short_name for g in gov]
-            all_reasons.append(f"Governance route: {', '.join(gov_names)}")
+    for idx, score, dim_row in zip(rows, scores, dim_rows):
+        custodian = features.custodians[idx]
+        gov = resolver.route(features, idx, bool(profile.needs_section_251))
 
         # --- timeline & cost summaries ---
         typical_weeks = custodian.total_typical_weeks
@@ -292,15 +561,133 @@ def rank_pathways(
         recommendations.append(
             PathwayRecommendation(
                 custodian=custodian,
-                overall_score=round(overall, 1),
-                dimension_scores=dim_scores,
-                match_reasons=all_reasons,
-                concerns=all_concerns,
+                overall_score=score,
+                dimension_scores=dict(zip(DIMENSIONS, dim_row)),
+                match_reasons=None,  # rendered lazily by explain_recommendation
+                concerns=None,
                 estimated_total_weeks=typical_weeks,
                 estimated_cost_range=cost_range,
-                required_governance=gov,
+                required_governance=list(gov),
+                timeline_percentiles=timelines.summary(idx) if timelines is not None else None,
+                speed_basis=speed_basis,
+                profile=profile,
+                explainer=explain_recommendation,
             )
         )
 
-    recommendations.sort(key=lambda r: r.overall_score, reverse=True)
     return recommendations
+
+
+def rank_pathways(
+    profile: ResearcherProfile,
+    custodians: Union[List[DataCustodian], CustodianFeatures],
+    governance_bodies: Union[List[GovernanceBody], GovernanceResolver],
+    top_k: Optional[int] = None,
+    min_score: Optional[float] = None,
+    timeline_percentile: Optional[int] = None,
+) -> List[PathwayRecommendation]:
+    """Score and rank all custodians against the researcher's profile.
+
+    ``custodians`` may be a list (compiled to a feature matrix and cached)
+    or a precompiled ``CustodianFeatures``; likewise ``governance_bodies``
+    may be a list or a prebuilt ``GovernanceResolver``.
+
+    ``top_k`` keeps only the best k pathways and ``min_score`` drops any
+    scoring below the cutoff; custodians that miss the cut are never
+    explained or routed through governance (with ``timeline_percentile``
+    every custodian is routed, since its whole route is simulated).
+
+    ``timeline_percentile`` (e.g. 80) scores speed on that percentile of
+    the simulated pathway completion time, governance included, instead of
+    the summed typical weeks; each recommendation then carries its
+    simulated P50/P80/P95 in ``timeline_percentiles``.
+
+    Returns a descending-sorted list of ``PathwayRecommendation`` objects.
+    """
+    return rank_pathways_batch(
+        [profile], custodians, governance_bodies, top_k=top_k, min_score=min_score,
+        timeline_percentile=timeline_percentile,
+    )[0]
+
+
+def _rank_chunk(
+    profiles: List[ResearcherProfile],
+    custodians: List[DataCustodian],
+    governance_bodies: List[GovernanceBody],
+    top_k: Optional[int],
+    min_score: Optional[float],
+    timeline_percentile: Optional[int],
+) -> List[List[PathwayRecommendation]]:
+    """Process-pool entry point: rank one chunk of profiles in-process."""
+    return rank_pathways_batch(
+        profiles, custodians, governance_bodies, top_k=top_k, min_score=min_score,
+        timeline_percentile=timeline_percentile,
+    )
+
+
+def rank_pathways_batch(
+    profiles: Sequence[ResearcherProfile],
+    custodians: Union[List[DataCustodian], CustodianFeatures],
+    governance_bodies: Union[List[GovernanceBody], GovernanceResolver],
+    processes: Optional[int] = None,
+    top_k: Optional[int] = None,
+    min_score: Optional[float] = None,
+    timeline_percentile: Optional[int] = None,
+) -> List[List[PathwayRecommendation]]:
+    """Rank custodians for many profiles at once.
+
+    All profiles are scored against all custodians in one matrix pass, and
+    governance routes are resolved once per custodian for each distinct
+    ``needs_section_251`` value rather than once per profile.
+
+    With ``processes`` > 1 the profiles are split into chunks ranked in a
+    process pool; recommendations then reference unpickled copies of the
+    custodian and governance objects. ``top_k``, ``min_score`` and
+    ``timeline_percentile`` apply to each profile as in ``rank_pathways``.
+
+    Returns one descending-sorted recommendation list per profile, in
+    input order.
+    """
+    profiles = list(profiles)
+    features = compile_features(custodians)
+    resolver = governance_resolver(governance_bodies)
+
+    if processes and processes > 1 and len(profiles) > 1:
+        chunk_size = -(-len(profiles) // processes)
+        chunks = [profiles[i:i + chunk_size] for i in range(0, len(profiles), chunk_size)]
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(
+                    _rank_chunk, chunk, features.custodians, resolver.bodies,
+                    top_k, min_score, timeline_percentile,
+                )
+                for chunk in chunks
+            ]
+            return [ranked for future in futures for ranked in future.result()]
+
+    if not profiles:
+        return []
+
+    timelines: Dict[bool, TimelineDistribution] = {}
+    speed_weeks = None
+    speed_basis = None
+    if timeline_percentile is not None:
+        flags = [bool(profile.needs_section_251) for profile in profiles]
+        for flag in set(flags):
+            timelines[flag] = simulated_timelines(features, resolver, flag, timeline_percentile)
+        speed_weeks = np.stack([timelines[flag].percentile(timeline_percentile) for flag in flags])
+        speed_basis = f"P{timeline_percentile}"
+
+    dims, overall = _score_matrix(features, profiles, speed_weeks)
+    overall_rows = overall.tolist()
+
+    results: List[List[PathwayRecommendation]] = []
+    for p, profile in enumerate(profiles):
+        flag = bool(profile.needs_section_251)
+        results.append(
+            _recommend(
+                profile, features, dims[:, p, :], overall_rows[p],
+                resolver, top_k, min_score, timelines.get(flag), speed_basis,
+            )
+        )
+    return results
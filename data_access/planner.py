@@ -0,0 +1,354 @@
+"""Multi-custodian combination planner.
+
+Many studies need data from more than one custodian (e.g. SAIL plus the
+Scottish Safe Havens for a multi-nation cohort). ``plan_combinations``
+searches sets of custodians that together cover the most requested data
+types in the most requested regions within the researcher's budget and
+timeline.
+
+Each custodian's coverage is reduced to an integer bitset over the
+profile's requirements, one bit per (data type, region) pair, so a plan
+pairing England-only GP data with Welsh hospital data does not count as
+covering GP data in Wales. A "UK-wide" scope stands for the four nations,
+so nation-level custodians can together cover it. Custodians with identical or dominated coverage
+are collapsed, and the remaining sets are explored branch-and-bound from
+a greedy starting solution, so the search stays interactive on large
+catalogues.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from data_access.features import FEE_FREE, FEE_NUMERIC, CustodianFeatures, compile_features
+from data_access.models import DataCustodian, GovernanceBody, Region, ResearcherProfile
+from data_access.navigator import (
+    _BUDGET_MAP,
+    _URGENCY_MAP,
+    GovernanceResolver,
+    _score_matrix,
+    governance_resolver,
+)
+
+
+DEFAULT_MAX_CUSTODIANS = 3
+DEFAULT_MAX_PLANS = 3
+# Search nodes explored before returning the best plans found so far
+DEFAULT_MAX_NODES = 200_000
+
+# Regions a "UK-wide" scope is planned as
+_NATIONS = tuple(r.value for r in Region if r is not Region.UK_WIDE)
+
+
+@dataclass
+class CombinationPlan:
+    """A set of custodians to apply to together, with what they cover."""
+    custodians: List[DataCustodian]
+    governance: List[GovernanceBody] = field(default_factory=list)
+    covered_data_types: List[str] = field(default_factory=list)
+    missing_data_types: List[str] = field(default_factory=list)
+    covered_regions: List[str] = field(default_factory=list)
+    missing_regions: List[str] = field(default_factory=list)
+    # Every uncovered (data type, region) pair; a data type or region is
+    # "covered" above when at least one of its pairs is
+    missing_pairs: List[Tuple[str, str]] = field(default_factory=list)
+    min_fee: int = 0                      # sum of known minimum fees, GBP
+    unpriced: List[str] = field(default_factory=list)  # custodians without a parsable fee
+    estimated_weeks: int = 0              # applications run in parallel: slowest pathway
+    mean_score: float = 0.0               # mean single-custodian match score
+
+    @property
+    def coverage(self) -> float:
+        """Share of requested (data type, region) pairs covered.
+
+        With only data types or only regions requested, the share of those.
+        """
+        types = len(self.covered_data_types) + len(self.missing_data_types)
+        regions = len(self.covered_regions) + len(self.missing_regions)
+        if types and regions:
+            return 1 - len(self.missing_pairs) / (types * regions)
+        total = types + regions
+        return (len(self.covered_data_types) + len(self.covered_regions)) / total if total else 1.0
+
+
+@dataclass
+class _Candidate:
+    row: int
+    mask: int
+    fee: int
+    weeks: int
+    score: float
+
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+# ---------------------------------------------------------------------------
+# Requirement bitsets
+# ---------------------------------------------------------------------------
+
+def _requirement_matrix(
+    profile: ResearcherProfile,
+    features: CustodianFeatures,
+) -> Tuple[List[str], List[str], np.ndarray]:
+    """Return (data needs, regions, custodians x requirements coverage matrix).
+
+    With both data needs and regions requested, each requirement is one
+    (need, region) pair, need-major, held by custodians that hold the data
+    type and cover the region; otherwise there is one requirement per need
+    or per region. Data needs are matched case-insensitively as in the
+    data-fit score; UK-wide custodians cover every requested region, as in
+    the geographic score. A "UK-wide" scope is replaced by the four nations,
+    which a UK-wide custodian or a set of nation custodians can cover.
+    """
+    needs: Dict[str, str] = {}
+    for need in profile.data_needs:
+        needs.setdefault(need.lower(), need)
+    regions: List[str] = []
+    for region in profile.geographic_scope:
+        regions.extend(_NATIONS if region == Region.UK_WIDE.value else (region,))
+    regions = list(dict.fromkeys(regions))
+
+    need_columns = []
+    for need in needs:
+        col = features.data_type_index.get(need)
+        need_columns.append(features.data_type_bits[:, col] if col is not None else np.zeros(len(features), dtype=bool))
+    region_columns = []
+    for region in regions:
+        col = features.region_index.get(region)
+        held = features.region_bits[:, col] if col is not None else np.zeros(len(features), dtype=bool)
+        region_columns.append(held | features.uk_wide)
+
+    if need_columns and region_columns:
+        columns = [held & covers for held in need_columns for covers in region_columns]
+    else:
+        columns = need_columns + region_columns
+
+    matrix = np.stack(columns, axis=1) if columns else np.zeros((len(features), 0), dtype=bool)
+    return list(needs.values()), regions, matrix
+
+
+def _pack(matrix: np.ndarray) -> List[int]:
+    bits = [1 << j for j in range(matrix.shape[1])]
+    return [sum(bit for bit, held in zip(bits, row) if held) for row in matrix.tolist()]
+
+
+def _candidates(
+    profile: ResearcherProfile,
+    features: CustodianFeatures,
+    routes: List[List[GovernanceBody]],
+    masks: List[int],
+    max_budget: int,
+    max_weeks: int,
+    require_eligible: bool,
+) -> List[_Candidate]:
+    """Individually feasible custodians, one per distinct coverage, undominated."""
+    _, overall = _score_matrix(features, [profile])
+    scores = overall[0].tolist()
+    eligible = features.eligibility_open | features.eligibility_vector(profile.researcher_type)
+
+    best: Dict[int, _Candidate] = {}
+    for row, custodian in enumerate(features.custodians):
+        mask = masks[row]
+        if not mask or (require_eligible and not eligible[row]):
+            continue
+        fee = int(features.min_fees[row]) if features.fee_codes[row] == FEE_NUMERIC else 0
+        weeks = custodian.total_typical_weeks + sum(
+            g.tiers[0].typical_weeks for g in routes[row] if g.tiers
+        )
+        if fee > max_budget or weeks > max_weeks:
+            continue
+        candidate = _Candidate(row, mask, fee, weeks, scores[row])
+        current = best.get(mask)
+        if current is None or (fee, weeks, -candidate.score) < (current.fee, current.weeks, -current.score):
+            best[mask] = candidate
+
+    # Drop custodians whose coverage another covers at no more cost or time
+    pool = list(best.values())
+    kept = [
+        c for c in pool
+        if not any(
+            o.mask != c.mask and o.mask & c.mask == c.mask and o.fee <= c.fee and o.weeks <= c.weeks
+            for o in pool
+        )
+    ]
+    kept.sort(key=lambda c: (-_popcount(c.mask), c.fee, c.weeks, -c.score))
+    return kept
+
+
+# ---------------------------------------------------------------------------
+# Search
+# ---------------------------------------------------------------------------
+
+class _Search:
+    """Branch-and-bound over candidate subsets, keeping the best ``max_plans``.
+
+    Plans are ordered by coverage, then fewer custodians, lower fees,
+    shorter timeline and higher mean match score. Only additions that
+    cover something new are explored, and a branch is cut when even the
+    union of every remaining candidate cannot reach the worst kept plan.
+    """
+
+    def __init__(self, candidates: List[_Candidate], max_size: int, max_budget: int,
+                 max_plans: int, max_nodes: int):
+        self.candidates = candidates
+        self.max_size = max_size
+        self.max_budget = max_budget
+        self.max_plans = max_plans
+        self.max_nodes = max_nodes
+        self.nodes = 0
+        self.plans: List[Tuple[tuple, Tuple[int, ...]]] = []
+        self.seen: set = set()
+
+        # suffix[i] = union of the masks of candidates[i:]
+        self.suffix = [0] * (len(candidates) + 1)
+        for i in range(len(candidates) - 1, -1, -1):
+            self.suffix[i] = self.suffix[i + 1] | candidates[i].mask
+
+    def _key(self, chosen: Tuple[int, ...], covered: int, fee: int, weeks: int) -> tuple:
+        mean = sum(self.candidates[i].score for i in chosen) / len(chosen)
+        return (-_popcount(covered), len(chosen), fee, weeks, -mean)
+
+    def _offer(self, chosen: Tuple[int, ...], covered: int, fee: int, weeks: int):
+        members = tuple(sorted(chosen))
+        if members in self.seen:
+            return
+        self.seen.add(members)
+        self.plans.append((self._key(members, covered, fee, weeks), members))
+        self.plans.sort()
+        del self.plans[self.max_plans:]
+
+    def _worth_exploring(self, bound: int, size: int) -> bool:
+        if len(self.plans) < self.max_plans:
+            return True
+        worst_coverage, worst_size = -self.plans[-1][0][0], self.plans[-1][0][1]
+        return bound > worst_coverage or (bound == worst_coverage and size <= worst_size)
+
+    def greedy(self):
+        """Seed the incumbent with greedy set cover under the budget."""
+        chosen: List[int] = []
+        covered = fee = weeks = 0
+        while len(chosen) < self.max_size:
+            best = None
+            for i, c in enumerate(self.candidates):
+                gain = _popcount(c.mask & ~covered)
+                if gain and fee + c.fee <= self.max_budget:
+                    key = (gain, -c.fee, -c.weeks, c.score)
+                    if best is None or key > best[0]:
+                        best = (key, i)
+            if best is None:
+                break
+            c = self.candidates[best[1]]
+            chosen.append(best[1])
+            covered |= c.mask
+            fee += c.fee
+            weeks = max(weeks, c.weeks)
+            self._offer(tuple(chosen), covered, fee, weeks)
+
+    def run(self, start: int = 0, chosen: Tuple[int, ...] = (), covered: int = 0,
+            fee: int = 0, weeks: int = 0) -> bool:
+        """Depth-first search; returns False if the node budget ran out."""
+        if len(chosen) >= self.max_size:
+            return True
+        for i in range(start, len(self.candidates)):
+            bound = _popcount(covered | self.suffix[i])
+            if not self._worth_exploring(bound, len(chosen) + 1):
+                break
+            self.nodes += 1
+            if self.nodes > self.max_nodes:
+                return False
+            c = self.candidates[i]
+            if not c.mask & ~covered or fee + c.fee > self.max_budget:
+                continue
+            node = (chosen + (i,), covered | c.mask, fee + c.fee, max(weeks, c.weeks))
+            self._offer(*node)
+            if not self.run(i + 1, *node):
+                return False
+        return True
+
+
+def plan_combinations(
+    profile: ResearcherProfile,
+    custodians: Union[List[DataCustodian], CustodianFeatures],
+    governance_bodies: Union[List[GovernanceBody], GovernanceResolver],
+    max_custodians: int = DEFAULT_MAX_CUSTODIANS,
+    max_plans: int = DEFAULT_MAX_PLANS,
+    max_budget: Optional[int] = None,
+    max_weeks: Optional[int] = None,
+    require_eligible: bool = True,
+    max_nodes: int = DEFAULT_MAX_NODES,
+) -> List[CombinationPlan]:
+    """Find custodian combinations that best cover the profile's data in its regions.
+
+    ``max_budget`` (GBP, summed minimum fees) and ``max_weeks`` (slowest
+    pathway, applications running in parallel) default to the profile's
+    budget range and timeline priority; each custodian's weeks include its
+    governance route. Custodians the researcher may not be eligible for are
+    skipped unless ``require_eligible`` is False. Fees that cannot be parsed
+    count as zero and are listed in ``CombinationPlan.unpriced``.
+
+    Returns up to ``max_plans`` plans, best first. If the search explores
+    more than ``max_nodes`` nodes it stops early with the best plans found.
+    """
+    features = compile_features(custodians)
+    resolver = governance_resolver(governance_bodies)
+    routes = resolver.routes_for(features)[bool(profile.needs_section_251)]
+
+    if max_budget is None:
+        max_budget = _BUDGET_MAP.get(profile.budget_range, 999_999)
+    if max_weeks is None:
+        max_weeks = _URGENCY_MAP.get(profile.timeline_priority, 200)
+
+    needs, regions, matrix = _requirement_matrix(profile, features)
+    masks = _pack(matrix)
+    candidates = _candidates(profile, features, routes, masks, max_budget, max_weeks, require_eligible)
+
+    search = _Search(candidates, max_custodians, max_budget, max_plans, max_nodes)
+    search.greedy()
+    search.run()
+
+    plans: List[CombinationPlan] = []
+    for key, members in search.plans:
+        chosen = [candidates[i] for i in members]
+        covered = 0
+        for c in chosen:
+            covered |= c.mask
+        governance: Dict[str, GovernanceBody] = {}
+        for c in chosen:
+            for body in routes[c.row]:
+                governance.setdefault(body.id, body)
+        held = [bool(covered >> j & 1) for j in range(matrix.shape[1])]
+        missing_pairs: List[Tuple[str, str]] = []
+        if needs and regions:
+            grid = np.array(held).reshape(len(needs), len(regions))
+            need_held, region_held = grid.any(axis=1).tolist(), grid.any(axis=0).tolist()
+            missing_pairs = [
+                (need, region)
+                for need, row in zip(needs, grid.tolist())
+                for region, h in zip(regions, row) if not h
+            ]
+        else:
+            need_held, region_held = held[:len(needs)], held[len(needs):]
+        plans.append(
+            CombinationPlan(
+                custodians=[features.custodians[c.row] for c in chosen],
+                governance=list(governance.values()),
+                covered_data_types=[n for n, h in zip(needs, need_held) if h],
+                missing_data_types=[n for n, h in zip(needs, need_held) if not h],
+                covered_regions=[r for r, h in zip(regions, region_held) if h],
+                missing_regions=[r for r, h in zip(regions, region_held) if not h],
+                missing_pairs=missing_pairs,
+                min_fee=sum(c.fee for c in chosen),
+                unpriced=[
+                    features.custodians[c.row].short_name for c in chosen
+                    if features.fee_codes[c.row] not in (FEE_FREE, FEE_NUMERIC)
+                ],
+                estimated_weeks=max(c.weeks for c in chosen),
+                mean_score=round(-key[-1], 1),
+            )
+        )
+    return plans
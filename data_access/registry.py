@@ -0,0 +1,254 @@
+"""Hot-reloading registry of custodian and governance data."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from data_access import loader
+from data_access.models import DataCustodian, GovernanceBody
+from data_access.snapshot import load_snapshot
+
+
+_FileState = Tuple[int, int]  # (mtime_ns, size)
+
+
+@dataclass(frozen=True)
+class RegistrySnapshot:
+    """A consistent view of the catalogue at one version.
+
+    Snapshots are never mutated; a reload publishes a new one. The lists
+    keep their identity for the life of the snapshot, so identity-keyed
+    caches (compiled features, governance resolvers) hit across calls.
+
+    Id, tag, region and data-type indexes are built once per snapshot so
+    lookups and filters never scan the catalogue.
+    """
+    version: int
+    custodians: List[DataCustodian] = field(default_factory=list)
+    governance_bodies: List[GovernanceBody] = field(default_factory=list)
+    loaded_at: float = 0.0
+
+    custodian_index: Dict[str, DataCustodian] = field(init=False, repr=False, compare=False)
+    governance_index: Dict[str, GovernanceBody] = field(init=False, repr=False, compare=False)
+    tag_index: Dict[str, Tuple[int, ...]] = field(init=False, repr=False, compare=False)
+    region_index: Dict[str, Tuple[int, ...]] = field(init=False, repr=False, compare=False)
+    data_type_index: Dict[str, Tuple[int, ...]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        tags: Dict[str, List[int]] = {}
+        regions: Dict[str, List[int]] = {}
+        data_types: Dict[str, List[int]] = {}
+        for pos, custodian in enumerate(self.custodians):
+            for tag in dict.fromkeys(t.lower() for t in custodian.tags):
+                tags.setdefault(tag, []).append(pos)
+            for region in dict.fromkeys(custodian.regions):
+                regions.setdefault(region, []).append(pos)
+            for data_type in dict.fromkeys(t.lower() for t in custodian.data_types):
+                data_types.setdefault(data_type, []).append(pos)
+
+        object.__setattr__(self, "custodian_index", {c.id: c for c in self.custodians})
+        object.__setattr__(self, "governance_index", {b.id: b for b in self.governance_bodies})
+        object.__setattr__(self, "tag_index", {k: tuple(v) for k, v in tags.items()})
+        object.__setattr__(self, "region_index", {k: tuple(v) for k, v in regions.items()})
+        object.__setattr__(self, "data_type_index", {k: tuple(v) for k, v in data_types.items()})
+
+    # -- lookups --
+
+    def custodian(self, custodian_id: str) -> Optional[DataCustodian]:
+        """Look up a single custodian by ID."""
+        return self.custodian_index.get(custodian_id)
+
+    def governance_body(self, body_id: str) -> Optional[GovernanceBody]:
+        """Look up a single governance body by ID."""
+        return self.governance_index.get(body_id)
+
+    def with_tag(self, tag: str) -> List[DataCustodian]:
+        """Custodians carrying ``tag`` (case-insensitive)."""
+        return self._take(self.tag_index.get(tag.lower(), ()))
+
+    def in_region(self, region: str, include_uk_wide: bool = True) -> List[DataCustodian]:
+        """Custodians covering ``region``; UK-wide custodians count unless excluded."""
+        return self._take(self._region_positions(region, include_uk_wide))
+
+    def with_data_type(self, data_type: str) -> List[DataCustodian]:
+        """Custodians holding ``data_type`` (case-insensitive)."""
+        return self._take(self.data_type_index.get(data_type.lower(), ()))
+
+    def filter(
+        self,
+        regions: Optional[List[str]] = None,
+        data_types: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        include_uk_wide: bool = True,
+    ) -> List[DataCustodian]:
+        """Custodians matching any of ``regions``, all of ``data_types`` and all of ``tags``.
+
+        Omitted criteria do not filter. Results keep catalogue order.
+        """
+        selected: Optional[set] = None
+
+        def narrow(positions) -> None:
+            nonlocal selected
+            selected = set(positions) if selected is None else selected & set(positions)
+
+        if regions:
+            narrow(pos for region in regions for pos in self._region_positions(region, include_uk_wide))
+        for data_type in data_types or []:
+            narrow(self.data_type_index.get(data_type.lower(), ()))
+        for tag in tags or []:
+            narrow(self.tag_index.get(tag.lower(), ()))
+
+        if selected is None:
+            return list(self.custodians)
+        return self._take(sorted(selected))
+
+    def _region_positions(self, region: str, include_uk_wide: bool) -> Tuple[int, ...]:
+        positions = self.region_index.get(region, ())
+        if include_uk_wide and region != "UK-wide":
+            positions = tuple(sorted(set(positions) | set(self.region_index.get("UK-wide", ()))))
+        return positions
+
+    def _take(self, positions) -> List[DataCustodian]:
+        return [self.custodians[pos] for pos in positions]
+
+
+class CustodianRegistry:
+    """Loads custodian/governance JSON once and reloads only what changed.
+
+    Every ``snapshot()`` call stats the data files (at most once per
+    ``check_interval`` seconds); files whose mtime or size changed are
+    reparsed, removed files are dropped, and if anything changed a new
+    snapshot is published with the version number incremented. A file
+    that fails to parse or to validate against the custodian schema keeps
+    its last good contents.
+    """
+
+    def __init__(
+        self,
+        custodians_dir: Optional[Path] = None,
+        governance_file: Optional[Path] = None,
+        check_interval: float = 2.0,
+    ):
+        self.custodians_dir = Path(custodians_dir) if custodians_dir else loader._CUSTODIANS_DIR
+        self.governance_file = Path(governance_file) if governance_file else loader._GOVERNANCE_FILE
+        self.check_interval = check_interval
+
+        self._lock = threading.Lock()
+        self._custodian_files: Dict[Path, Tuple[_FileState, Optional[DataCustodian]]] = {}
+        self._governance_state: Optional[_FileState] = None
+        self._governance: List[GovernanceBody] = []
+        self._snapshot = RegistrySnapshot(version=0)
+        self._last_check = float("-inf")
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def snapshot(self) -> RegistrySnapshot:
+        """Return the current snapshot, reloading changed files first if due."""
+        if time.monotonic() - self._last_check >= self.check_interval:
+            self.refresh()
+        return self._snapshot
+
+    def refresh(self, force: bool = False) -> RegistrySnapshot:
+        """Stat every data file now and publish a new snapshot if any changed."""
+        with self._lock:
+            self._last_check = time.monotonic()
+            if self._snapshot.version == 0 and not force:
+                self._seed_from_snapshot()
+            changed = force or self._snapshot.version == 0
+            changed = self._refresh_custodians(force) or changed
+            changed = self._refresh_governance(force) or changed
+
+            if changed:
+                self._snapshot = RegistrySnapshot(
+                    version=self._snapshot.version + 1,
+                    custodians=[
+                        custodian
+                        for _, (_, custodian) in sorted(self._custodian_files.items())
+                        if custodian is not None
+                    ],
+                    governance_bodies=list(self._governance),
+                    loaded_at=time.time(),
+                )
+            return self._snapshot
+
+    def _seed_from_snapshot(self):
+        """Start from the compiled catalogue snapshot when it is up to date.
+
+        Files are recorded with the state the snapshot was compiled from,
+        so the first refresh only reparses files edited since the build.
+        """
+        compiled = load_snapshot(custodians_dir=self.custodians_dir, governance_file=self.governance_file)
+        if compiled is None:
+            return
+        for name, custodian in compiled.custodian_files:
+            state = compiled.file_states.get(f"custodians/{name}")
+            if state is not None:
+                self._custodian_files[self.custodians_dir / name] = (tuple(state), custodian)
+        self._governance_state = compiled.file_states.get(self.governance_file.name)
+        self._governance = list(compiled.governance_bodies)
+
+    def _refresh_custodians(self, force: bool) -> bool:
+        current: Dict[Path, _FileState] = {}
+        if self.custodians_dir.is_dir():
+            for fp in self.custodians_dir.glob("*.json"):
+                state = _stat(fp)
+                if state is not None:
+                    current[fp] = state
+
+        changed = False
+        for fp in list(self._custodian_files):
+            if fp not in current:
+                del self._custodian_files[fp]
+                changed = True
+
+        for fp, state in current.items():
+            previous = self._custodian_files.get(fp)
+            if previous is not None and previous[0] == state and not force:
+                continue
+            custodian = loader._load_custodian_file(fp)
+            if custodian is None and previous is not None:
+                custodian = previous[1]  # keep the last good parse
+            self._custodian_files[fp] = (state, custodian)
+            changed = True
+        return changed
+
+    def _refresh_governance(self, force: bool) -> bool:
+        state = _stat(self.governance_file)
+        if state == self._governance_state and not force:
+            return False
+        self._governance_state = state
+        if state is None:
+            self._governance = []
+            return True
+        bodies = loader._load_governance_file(self.governance_file)
+        if bodies is not None:
+            self._governance = bodies
+        return True
+
+
+def _stat(fp: Path) -> Optional[_FileState]:
+    try:
+        st = fp.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+_REGISTRY: Optional[CustodianRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_registry() -> CustodianRegistry:
+    """Return the process-wide registry for the project's ``data/`` directory."""
+    global _REGISTRY
+    if _REGISTRY is None:
+        with _REGISTRY_LOCK:
+            if _REGISTRY is None:
+                _REGISTRY = CustodianRegistry()
+    return _REGISTRY
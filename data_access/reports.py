@@ -0,0 +1,258 @@
+"""Recommendation reports (Markdown, HTML, CSV) rendered off the script thread.
+
+``render_report`` formats one ranked recommendation list. ``ReportGenerator``
+renders in a worker thread and caches the result by profile and
+recommendation digest: callers ``submit`` as soon as the recommendations
+are known, build the rest of the page while the report renders, and read
+the future when the text is needed. Reruns with the same results reuse the
+rendered reports.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import html
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import astuple
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from data_access.cache import recommendations_digest
+from data_access.models import PathwayRecommendation, ResearcherProfile
+from data_access.navigator import DIMENSIONS
+
+
+# format -> (file extension, MIME type)
+REPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "markdown": ("md", "text/markdown"),
+    "html": ("html", "text/html"),
+    "csv": ("csv", "text/csv"),
+}
+
+_TITLE = "UK Health Data Access Navigator — Recommendations Report"
+
+
+def _profile_rows(profile: ResearcherProfile) -> List[Tuple[str, str]]:
+    return [
+        ("Researcher type", profile.researcher_type),
+        ("Institution country", profile.institution_country),
+        ("Study design", profile.study_type),
+        ("Data needs", ", ".join(profile.data_needs)),
+        ("Geographic scope", ", ".join(profile.geographic_scope)),
+        ("Timeline priority", profile.timeline_priority),
+        ("Budget", profile.budget_range),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Renderers
+# ---------------------------------------------------------------------------
+
+def _markdown(profile: ResearcherProfile, recommendations: Sequence[PathwayRecommendation],
+              generated: datetime) -> str:
+    lines = [
+        f"# {_TITLE}",
+        f"\nGenerated: {generated.strftime('%Y-%m-%d %H:%M')}",
+        "\n## Research Profile",
+    ]
+    lines += [f"- **{label}:** {value}" for label, value in _profile_rows(profile)]
+    lines.append("\n## Ranked Recommendations\n")
+
+    for idx, rec in enumerate(recommendations, 1):
+        lines.append(f"### {idx}. {rec.custodian.name} — {rec.overall_score:.0f}% match")
+        lines.append(f"- **Timeline:** ~{rec.estimated_total_weeks} weeks")
+        lines.append(f"- **Cost:** {rec.estimated_cost_range}")
+        lines.append(f"- **Access model:** {rec.custodian.access_model}")
+        lines.append(f"- **Website:** {rec.custodian.url}")
+        if rec.match_reasons:
+            lines.append("- **Why recommended:** " + "; ".join(rec.match_reasons[:3]))
+        if rec.concerns:
+            lines.append("- **Considerations:** " + "; ".join(rec.concerns[:3]))
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def _html(profile: ResearcherProfile, recommendations: Sequence[PathwayRecommendation],
+          generated: datetime) -> str:
+    e = html.escape
+    parts = [
+        "<!DOCTYPE html>",
+        '<html lang="en"><head><meta charset="utf-8">',
+        f"<title>{e(_TITLE)}</title>",
+        "<style>body{font-family:sans-serif;max-width:60rem;margin:2rem auto;line-height:1.4}"
+        "table{border-collapse:collapse;width:100%}th,td{border:1px solid #ccc;padding:.3rem .5rem;"
+        "text-align:left;vertical-align:top}th{background:#f4f4f4}</style>",
+        "</head><body>",
+        f"<h1>{e(_TITLE)}</h1>",
+        f"<p>Generated: {generated.strftime('%Y-%m-%d %H:%M')}</p>",
+        "<h2>Research Profile</h2><ul>",
+    ]
+    parts += [f"<li><strong>{e(label)}:</strong> {e(value)}</li>" for label, value in _profile_rows(profile)]
+    parts.append("</ul><h2>Ranked Recommendations</h2>")
+
+    header = ["#", "Custodian", "Match", "Timeline", "Cost", "Access model", "Governance"]
+    parts.append("<table><tr>" + "".join(f"<th>{h}</th>" for h in header) + "</tr>")
+    for idx, rec in enumerate(recommendations, 1):
+        cells = [
+            str(idx),
+            f'<a href="{e(rec.custodian.url or "", quote=True)}">{e(rec.custodian.name)}</a>',
+            f"{rec.overall_score:.0f}%",
+            f"~{rec.estimated_total_weeks} weeks",
+            e(rec.estimated_cost_range),
+            e(rec.custodian.access_model),
+            e(", ".join(g.short_name for g in rec.required_governance) or "—"),
+        ]
+        parts.append("<tr>" + "".join(f"<td>{c}</td>" for c in cells) + "</tr>")
+    parts.append("</table>")
+
+    for idx, rec in enumerate(recommendations, 1):
+        parts.append(f"<h3>{idx}. {e(rec.custodian.name)} — {rec.overall_score:.0f}% match</h3>")
+        if rec.match_reasons:
+            parts.append("<p><strong>Why recommended:</strong></p><ul>"
+                         + "".join(f"<li>{e(r)}</li>" for r in rec.match_reasons) + "</ul>")
+        if rec.concerns:
+            parts.append("<p><strong>Considerations:</strong></p><ul>"
+                         + "".join(f"<li>{e(c)}</li>" for c in rec.concerns) + "</ul>")
+
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+def _csv(profile: ResearcherProfile, recommendations: Sequence[PathwayRecommendation],
+         generated: datetime) -> str:
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(
+        ["rank", "custodian_id", "custodian", "overall_score"]
+        + [f"{dim}_score" for dim in DIMENSIONS]
+        + ["estimated_weeks", "estimated_cost", "access_model", "governance", "url",
+           "match_reasons", "concerns"]
+    )
+    for idx, rec in enumerate(recommendations, 1):
+        writer.writerow(
+            [idx, rec.custodian.id, rec.custodian.name, rec.overall_score]
+            + [rec.dimension_scores.get(dim, "") for dim in DIMENSIONS]
+            + [
+                rec.estimated_total_weeks,
+                rec.estimated_cost_range,
+                rec.custodian.access_model,
+                "; ".join(g.short_name for g in rec.required_governance),
+                rec.custodian.url or "",
+                "; ".join(rec.match_reasons),
+                "; ".join(rec.concerns),
+            ]
+        )
+    return out.getvalue()
+
+
+_RENDERERS = {"markdown": _markdown, "html": _html, "csv": _csv}
+
+
+def render_report(
+    profile: ResearcherProfile,
+    recommendations: Sequence[PathwayRecommendation],
+    fmt: str = "markdown",
+    generated: Optional[datetime] = None,
+) -> str:
+    """Render a ranked recommendation list as Markdown, HTML or CSV."""
+    if fmt not in _RENDERERS:
+        raise ValueError(f"Unknown report format: {fmt!r} (expected one of {sorted(_RENDERERS)})")
+    return _RENDERERS[fmt](profile, recommendations, generated or datetime.now())
+
+
+# ---------------------------------------------------------------------------
+# Background generator
+# ---------------------------------------------------------------------------
+
+def report_digest(profile: ResearcherProfile, recommendations: Sequence[PathwayRecommendation]) -> str:
+    """Key for a report: every profile field plus the recommendation digest."""
+    payload = repr(astuple(profile))
+    return hashlib.sha256(
+        (payload + recommendations_digest(list(recommendations))).encode("utf-8")
+    ).hexdigest()
+
+
+class ReportGenerator:
+    """Renders reports in a worker thread, at most once per profile and recommendations.
+
+    ``submit`` returns a ``Future`` immediately; callers that need the text
+    use ``get``. Entries hold futures, so concurrent requests for the same
+    report share one render; failed renders are not cached.
+    """
+
+    def __init__(self, maxsize: int = 32, max_workers: int = 1):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], Future]" = OrderedDict()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="report")
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def submit(
+        self,
+        profile: ResearcherProfile,
+        recommendations: Sequence[PathwayRecommendation],
+        fmt: str = "markdown",
+    ) -> Future:
+        """Start rendering a report (or return the cached one) without blocking."""
+        if fmt not in _RENDERERS:
+            raise ValueError(f"Unknown report format: {fmt!r} (expected one of {sorted(_RENDERERS)})")
+        recommendations = list(recommendations)
+        key = (report_digest(profile, recommendations), fmt)
+
+        with self._lock:
+            future = self._entries.get(key)
+            if future is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return future
+            self.misses += 1
+            future = self._executor.submit(render_report, profile, recommendations, fmt)
+            self._entries[key] = future
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        future.add_done_callback(lambda done: self._on_done(key, done))
+        return future
+
+    def get(
+        self,
+        profile: ResearcherProfile,
+        recommendations: Sequence[PathwayRecommendation],
+        fmt: str = "markdown",
+        timeout: Optional[float] = None,
+    ) -> str:
+        """Return the rendered report, waiting for the worker if needed."""
+        return self.submit(profile, recommendations, fmt).result(timeout)
+
+    def _on_done(self, key: Tuple[str, str], future: Future):
+        # Drop failed renders so the next request retries
+        if future.cancelled() or future.exception() is not None:
+            with self._lock:
+                if self._entries.get(key) is future:
+                    del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
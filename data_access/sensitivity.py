@@ -0,0 +1,204 @@
+"""Sensitivity of pathway rankings to the scoring weights.
+
+Rankings are recomputed from the dimension scores already stored on each
+``PathwayRecommendation``, so no custodian is re-scored: every weight
+sample is one row of a (samples x dimensions) matrix multiplied against
+the (dimensions x pathways) score matrix.
+"""
+
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from data_access.models import DataCustodian, PathwayRecommendation
+from data_access.navigator import _EXTRACTION_PENALTY, DIMENSIONS, WEIGHTS
+
+
+DEFAULT_SAMPLES = 2000
+# Dirichlet concentration: higher keeps sampled weights closer to the defaults
+DEFAULT_CONCENTRATION = 50.0
+
+
+@dataclass
+class CustodianSensitivity:
+    """How one pathway's rank moves as the weights are perturbed."""
+    custodian: DataCustodian
+    base_rank: int          # 1-based rank under the default weights
+    mean_rank: float
+    best_rank: int
+    worst_rank: int
+    top_share: float        # share of samples ranking this pathway first
+    top_k_share: float      # share of samples ranking it within the top k
+    # Per dimension: the weight (others rescaled proportionally) at which this
+    # pathway swaps places with the default leader; None if it never does
+    tipping_points: Dict[str, Optional[float]] = field(default_factory=dict)
+
+
+@dataclass
+class SensitivityReport:
+    """Rank stability of a recommendation list under perturbed weights."""
+    method: str
+    weights: np.ndarray     # (samples, len(DIMENSIONS)), each row sums to 1
+    top_k: int
+    pathways: List[CustodianSensitivity]
+
+    @property
+    def samples(self) -> int:
+        return len(self.weights)
+
+    @property
+    def top_choice_stability(self) -> float:
+        """Share of samples in which the default top pathway stays first."""
+        return self.pathways[0].top_share if self.pathways else 0.0
+
+
+# ---------------------------------------------------------------------------
+# Weight samples
+# ---------------------------------------------------------------------------
+
+def _base_weights(weights: Optional[Mapping[str, float]]) -> np.ndarray:
+    weights = WEIGHTS if weights is None else weights
+    base = np.array([weights[dim] for dim in DIMENSIONS], dtype=float)
+    if (base < 0).any() or base.sum() <= 0:
+        raise ValueError("weights must be non-negative and not all zero")
+    return base / base.sum()
+
+
+def dirichlet_weights(
+    base: np.ndarray,
+    samples: int = DEFAULT_SAMPLES,
+    concentration: float = DEFAULT_CONCENTRATION,
+    seed: Optional[int] = 0,
+) -> np.ndarray:
+    """Draw weight vectors from a Dirichlet distribution centred on ``base``."""
+    alpha = np.maximum(base * concentration, 1e-6)
+    return np.random.default_rng(seed).dirichlet(alpha, size=samples)
+
+
+def grid_weights(base: np.ndarray, steps: int = 3, spread: float = 0.5) -> np.ndarray:
+    """Scale every weight by each of ``steps`` factors in ``1 ± spread`` and renormalise.
+
+    Covers all combinations, so the grid has ``steps ** len(base)`` rows.
+    """
+    factors = np.linspace(1 - spread, 1 + spread, steps)
+    grid = np.array(list(itertools.product(factors, repeat=len(base)))) * base
+    return grid / grid.sum(axis=1, keepdims=True)
+
+
+# ---------------------------------------------------------------------------
+# Analysis
+# ---------------------------------------------------------------------------
+
+def _tipping_points(scores: np.ndarray, penalty: np.ndarray, base: np.ndarray) -> np.ndarray:
+    """Return (pathways, dimensions) weights at which each pathway swaps with the leader.
+
+    Moving one weight ``t`` while rescaling the others proportionally makes
+    every pathway's score linear in ``t``, so each crossing with the leader
+    (row 0) is found in closed form. For the leader itself the crossing
+    nearest its current weight, against any challenger, is reported. A
+    dimension that already holds all the weight has no others to rescale,
+    so it has no tipping point.
+    """
+    n, d = scores.shape
+    movable = base < 1
+    total = scores @ base                                  # (n,)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rest = (total[:, None] - scores * base) / (1 - base)   # score of the other dims, renormalised
+    rest = np.where(movable, rest, 0.0)
+    intercept = penalty[:, None] * rest                    # (n, d)
+    slope = penalty[:, None] * (scores - rest)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing = (intercept - intercept[0]) / (slope[0] - slope)
+    # Only strict overtakes count: the challenger must pull ahead past the
+    # crossing, moving away from the current weight, within [0, 1]
+    rising = slope > slope[0]
+    valid = movable & np.isfinite(crossing) & (
+        ((crossing > base) & (crossing < 1) & rising)
+        | ((crossing < base) & (crossing > 0) & ~rising & (slope != slope[0]))
+    )
+    crossing = np.where(valid, crossing, np.nan)
+
+    points = crossing.copy()
+    points[0] = np.nan
+    if n > 1:
+        distance = np.abs(crossing[1:] - base)
+        nearest = np.where(np.isnan(distance), np.inf, distance).argmin(axis=0)
+        leader = crossing[1:][nearest, np.arange(d)]
+        points[0] = np.where(np.isnan(distance).all(axis=0), np.nan, leader)
+    return points
+
+
+def weight_sensitivity(
+    recommendations: Sequence[PathwayRecommendation],
+    method: str = "dirichlet",
+    samples: int = DEFAULT_SAMPLES,
+    concentration: float = DEFAULT_CONCENTRATION,
+    steps: int = 3,
+    spread: float = 0.5,
+    top_k: int = 3,
+    weights: Optional[Mapping[str, float]] = None,
+    seed: Optional[int] = 0,
+) -> SensitivityReport:
+    """Measure how stable a ranking is when the scoring weights are perturbed.
+
+    ``recommendations`` must be a ranked list as returned by
+    ``rank_pathways``; their stored dimension scores are re-weighted, so
+    the analysis covers exactly the pathways in the list. ``method`` is
+    ``"dirichlet"`` (``samples`` draws around the default weights, tighter
+    for larger ``concentration``) or ``"grid"`` (every weight scaled by
+    ``steps`` factors within ``1 ± spread``). Scores are rounded to one
+    decimal and ties keep list order, as in the ranking itself.
+    """
+    base = _base_weights(weights)
+    if method == "dirichlet":
+        sampled = dirichlet_weights(base, samples, concentration, seed)
+    elif method == "grid":
+        sampled = grid_weights(base, steps, spread)
+    else:
+        raise ValueError(f"Unknown method: {method!r}")
+
+    recommendations = list(recommendations)
+    n = len(recommendations)
+    if not n:
+        return SensitivityReport(method=method, weights=sampled, top_k=top_k, pathways=[])
+
+    scores = np.array(
+        [[rec.dimension_scores.get(dim, 0.0) for dim in DIMENSIONS] for rec in recommendations]
+    )
+    penalty = np.array([
+        _EXTRACTION_PENALTY
+        if rec.profile is not None and rec.profile.needs_data_extraction
+        and rec.custodian.access_model == "tre_only"
+        else 1.0
+        for rec in recommendations
+    ])
+
+    overall = np.round((sampled @ scores.T) * penalty, 1)        # (samples, n)
+    order = np.argsort(-overall, axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, n + 1)[None, :], axis=1)
+
+    points = _tipping_points(scores, penalty, base)
+
+    pathways = [
+        CustodianSensitivity(
+            custodian=rec.custodian,
+            base_rank=i + 1,
+            mean_rank=float(ranks[:, i].mean()),
+            best_rank=int(ranks[:, i].min()),
+            worst_rank=int(ranks[:, i].max()),
+            top_share=float((ranks[:, i] == 1).mean()),
+            top_k_share=float((ranks[:, i] <= top_k).mean()),
+            tipping_points={
+                dim: None if np.isnan(points[i, d]) else round(float(points[i, d]), 3)
+                for d, dim in enumerate(DIMENSIONS)
+            },
+        )
+        for i, rec in enumerate(recommendations)
+    ]
+    return SensitivityReport(method=method, weights=sampled, top_k=top_k, pathways=pathways)
@@ -0,0 +1,290 @@
+"""Compiled single-file snapshot of the custodian and governance catalogue.
+
+``build_snapshot`` validates every ``data/custodians/*.json`` file against
+``custodian_schema.json``, parses the catalogue once and writes it to one
+pickle together with a content hash of its sources. ``load_snapshot``
+reads it back in a single read and returns ``None`` whenever the snapshot
+is missing, unreadable or stale, in which case callers fall back to the
+JSON sources (validated against the same schema by the loader). The
+unpickled snapshot is kept in memory until the pickle itself changes.
+
+Build it with ``python scripts/build_catalogue_snapshot.py``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from data_access import loader
+from data_access.models import DataCustodian, GovernanceBody
+
+try:
+    import jsonschema
+except ImportError:  # optional; a built-in subset validator is used instead
+    jsonschema = None
+
+
+SNAPSHOT_FILE = loader._PROJECT_ROOT / "data" / "catalogue.snapshot.pickle"
+SNAPSHOT_FORMAT = 4
+
+_FileState = Tuple[int, int]  # (mtime_ns, size)
+
+# Unpickled snapshots by path, with the pickle's own file state
+_LOADED: Dict[Path, Tuple[_FileState, "CatalogueSnapshot"]] = {}
+
+
+@dataclass
+class CatalogueSnapshot:
+    """Parsed catalogue plus the source state it was compiled from."""
+    format: int
+    source_hash: str
+    file_states: Dict[str, _FileState] = field(default_factory=dict)
+    custodian_files: List[Tuple[str, DataCustodian]] = field(default_factory=list)
+    governance_bodies: List[GovernanceBody] = field(default_factory=list)
+
+    @property
+    def custodians(self) -> List[DataCustodian]:
+        return [custodian for _, custodian in self.custodian_files]
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+def _source_files(custodians_dir: Path, governance_file: Path) -> List[Path]:
+    files = sorted(custodians_dir.glob("*.json")) if custodians_dir.is_dir() else []
+    if governance_file.is_file():
+        files.append(governance_file)
+    return files
+
+
+def _source_key(fp: Path, custodians_dir: Path) -> str:
+    return f"custodians/{fp.name}" if fp.parent == custodians_dir else fp.name
+
+
+def _file_state(fp: Path) -> Optional[_FileState]:
+    try:
+        st = fp.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _content_hash(contents: Dict[str, bytes]) -> str:
+    digest = hashlib.sha256()
+    for key in sorted(contents):
+        digest.update(key.encode("utf-8") + b"\0" + hashlib.sha256(contents[key]).digest())
+    return digest.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Schema validation
+# ---------------------------------------------------------------------------
+
+_JSON_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+
+
+def _matches_type(value: Any, type_name: str) -> bool:
+    if type_name in ("integer", "number") and isinstance(value, bool):
+        return False
+    return isinstance(value, _JSON_TYPES.get(type_name, object))
+
+
+def _subset_validate(value: Any, schema: Dict[str, Any], path: str = "$") -> List[str]:
+    """Validate the JSON Schema keywords custodian_schema.json uses.
+
+    Covers ``type``, ``enum``, ``pattern``, ``required``, ``properties``,
+    ``additionalProperties: false`` and ``items``; used when the
+    ``jsonschema`` package is not installed.
+    """
+    errors: List[str] = []
+
+    types = schema.get("type")
+    if types is not None:
+        types = types if isinstance(types, list) else [types]
+        if not any(_matches_type(value, t) for t in types):
+            return [f"{path}: expected {' or '.join(types)}, got {type(value).__name__}"]
+
+    if "enum" in schema and value not in schema["enum"]:
+        errors.append(f"{path}: {value!r} is not one of {schema['enum']}")
+    if "pattern" in schema and isinstance(value, str) and not re.search(schema["pattern"], value):
+        errors.append(f"{path}: {value!r} does not match {schema['pattern']!r}")
+
+    if isinstance(value, dict):
+        properties = schema.get("properties", {})
+        for key in schema.get("required", []):
+            if key not in value:
+                errors.append(f"{path}: missing required property {key!r}")
+        for key, item in value.items():
+            if key in properties:
+                errors.extend(_subset_validate(item, properties[key], f"{path}.{key}"))
+            elif schema.get("additionalProperties") is False:
+                errors.append(f"{path}: unexpected property {key!r}")
+
+    if isinstance(value, list) and "items" in schema:
+        for i, item in enumerate(value):
+            errors.extend(_subset_validate(item, schema["items"], f"{path}[{i}]"))
+
+    return errors
+
+
+_VALIDATOR: Optional[Tuple[Dict[str, Any], Any]] = None
+
+
+def validate_custodian(data: Any, schema: Dict[str, Any]) -> List[str]:
+    """Return schema violations for one custodian payload (empty if valid)."""
+    global _VALIDATOR
+    if jsonschema is not None:
+        if _VALIDATOR is None or _VALIDATOR[0] is not schema:
+            _VALIDATOR = (schema, jsonschema.Draft202012Validator(schema))
+        validator = _VALIDATOR[1]
+        return [
+            f"$.{'.'.join(str(p) for p in error.absolute_path)}: {error.message}"
+            for error in sorted(validator.iter_errors(data), key=lambda e: list(e.absolute_path))
+        ]
+    return _subset_validate(data, schema)
+
+
+# ---------------------------------------------------------------------------
+# Build / load
+# ---------------------------------------------------------------------------
+
+def build_snapshot(
+    path: Path = SNAPSHOT_FILE,
+    custodians_dir: Optional[Path] = None,
+    governance_file: Optional[Path] = None,
+    schema_file: Optional[Path] = None,
+) -> Tuple[CatalogueSnapshot, Dict[str, List[str]]]:
+    """Validate, parse and write the catalogue snapshot.
+
+    Custodian files that fail validation or parsing are left out of the
+    snapshot and reported.
+
+    Returns:
+        (snapshot, errors) where ``errors`` maps source file to messages.
+    """
+    custodians_dir = Path(custodians_dir or loader._CUSTODIANS_DIR)
+    governance_file = Path(governance_file or loader._GOVERNANCE_FILE)
+    with open(schema_file or loader._SCHEMA_FILE, "r", encoding="utf-8") as f:
+        schema = json.load(f)
+
+    contents: Dict[str, bytes] = {}
+    states: Dict[str, _FileState] = {}
+    errors: Dict[str, List[str]] = {}
+    custodian_files: List[Tuple[str, DataCustodian]] = []
+    governance_bodies: List[GovernanceBody] = []
+
+    for fp in _source_files(custodians_dir, governance_file):
+        key = _source_key(fp, custodians_dir)
+        states[key] = _file_state(fp)
+        raw = contents[key] = fp.read_bytes()
+        try:
+            data = json.loads(raw.decode("utf-8"))
+            if fp == governance_file:
+                governance_bodies = [loader._parse_governance_body(g) for g in data]
+                continue
+            problems = validate_custodian(data, schema)
+            if problems:
+                errors[key] = problems
+                continue
+            custodian_files.append((fp.name, loader._parse_custodian(data)))
+        except Exception as exc:
+            errors[key] = [str(exc)]
+
+    snapshot = CatalogueSnapshot(
+        format=SNAPSHOT_FORMAT,
+        source_hash=_content_hash(contents),
+        file_states=states,
+        custodian_files=custodian_files,
+        governance_bodies=governance_bodies,
+    )
+
+    _write_snapshot(snapshot, Path(path))
+    return snapshot, errors
+
+
+def _write_snapshot(snapshot: CatalogueSnapshot, path: Path):
+    """Atomically replace ``path`` with ``snapshot`` and remember it as loaded."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    state = _file_state(path)
+    if state is not None:
+        _LOADED[path] = (state, snapshot)
+
+
+def load_snapshot(
+    path: Path = SNAPSHOT_FILE,
+    custodians_dir: Optional[Path] = None,
+    governance_file: Optional[Path] = None,
+) -> Optional[CatalogueSnapshot]:
+    """Return the compiled snapshot if it still matches its sources, else ``None``.
+
+    The pickle is only read again when its own mtime or size changes.
+    Sources are first compared by mtime and size; only if those differ is
+    the content hash recomputed, and on a match the new file states are
+    written back, so touching a file without editing it costs one rehash.
+    """
+    path = Path(path)
+    state = _file_state(path)
+    if state is None:
+        return None
+    loaded = _LOADED.get(path)
+    if loaded is not None and loaded[0] == state:
+        snapshot = loaded[1]
+    else:
+        try:
+            snapshot = pickle.loads(path.read_bytes())
+        except Exception as exc:
+            print(f"[loader] Warning: ignoring unreadable snapshot {path.name}: {exc}")
+            return None
+        _LOADED[path] = (state, snapshot)
+    if not isinstance(snapshot, CatalogueSnapshot) or snapshot.format != SNAPSHOT_FORMAT:
+        return None
+
+    custodians_dir = Path(custodians_dir or loader._CUSTODIANS_DIR)
+    governance_file = Path(governance_file or loader._GOVERNANCE_FILE)
+    files = {_source_key(fp, custodians_dir): fp for fp in _source_files(custodians_dir, governance_file)}
+
+    if set(files) != set(snapshot.file_states):
+        return None
+    if all(_file_state(fp) == snapshot.file_states[key] for key, fp in files.items()):
+        return snapshot
+
+    # States are taken before reading, so an edit racing the rehash is seen next time
+    states = {key: _file_state(fp) for key, fp in files.items()}
+    try:
+        contents = {key: fp.read_bytes() for key, fp in files.items()}
+    except OSError:
+        return None
+    if _content_hash(contents) != snapshot.source_hash:
+        return None
+
+    snapshot.file_states = states
+    try:
+        _write_snapshot(snapshot, path)
+    except OSError as exc:
+        print(f"[loader] Warning: could not update snapshot {path.name}: {exc}")
+    return snapshot
@@ -0,0 +1,240 @@
+"""Monte Carlo simulation of access-pathway completion times."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from data_access.models import DataCustodian, GovernanceBody, PathwayRecommendation
+
+
+DEFAULT_DRAWS = 100_000
+DEFAULT_PERCENTILES: Tuple[int, ...] = (50, 80, 95)
+
+# Weeks assumed for a custodian with no published timeline (as in the speed score)
+_NO_TIMELINE_WEEKS = 20
+
+# PERT shape parameter: weight of the most likely value
+_PERT_LAMBDA = 4.0
+
+# PERT inverse CDFs are tabulated at this many quantile steps, from a CDF
+# integrated over _PERT_PDF_POINTS midpoints
+_PERT_GRID = 4096
+_PERT_PDF_POINTS = 16384
+
+Pathway = Tuple[DataCustodian, Sequence[GovernanceBody]]
+
+
+@dataclass
+class TimelineDistribution:
+    """Simulated completion-time percentiles, one row per pathway."""
+    percentiles: Tuple[int, ...]
+    values: np.ndarray  # (pathways, len(percentiles)) weeks
+    mean: np.ndarray    # (pathways,) weeks
+    draws: int
+
+    def __len__(self) -> int:
+        return len(self.mean)
+
+    def percentile(self, q: int) -> np.ndarray:
+        """Return the simulated ``q``-th percentile for every pathway."""
+        return self.values[:, self.percentiles.index(q)]
+
+    def summary(self, row: int) -> Dict[str, float]:
+        """Return ``{"p50": ..., "p80": ..., "p95": ..., "mean": ...}`` for one pathway."""
+        out = {f"p{q}": round(float(v), 1) for q, v in zip(self.percentiles, self.values[row])}
+        out["mean"] = round(float(self.mean[row]), 1)
+        return out
+
+
+def _phases(
+    custodian: DataCustodian,
+    governance: Sequence[GovernanceBody],
+    tier_spread: Tuple[float, float],
+) -> List[Tuple[float, float, float]]:
+    phases = [(t.min_weeks, t.typical_weeks, t.max_weeks) for t in custodian.timeline]
+    if not phases:
+        phases = [(_NO_TIMELINE_WEEKS,) * 3]
+    # Governance tiers only publish typical weeks; tier_spread sets the range
+    for body in governance:
+        if body.tiers:
+            weeks = body.tiers[0].typical_weeks
+            phases.append((weeks * tier_spread[0], weeks, weeks * tier_spread[1]))
+    return phases
+
+
+def _pert_quantiles(c: np.ndarray) -> np.ndarray:
+    """Tabulate the standard PERT inverse CDF for each mode position in ``c``.
+
+    Row ``i`` holds the quantiles of Beta(1 + λc, 1 + λ(1 - c)) at
+    ``u = 0, 1/_PERT_GRID, ..., 1``, from a midpoint-rule CDF.
+    """
+    x = (np.arange(_PERT_PDF_POINTS) + 0.5) / _PERT_PDF_POINTS
+    c = np.asarray(c, dtype=np.float64)[:, None]
+    pdf = np.exp(_PERT_LAMBDA * c * np.log(x) + _PERT_LAMBDA * (1 - c) * np.log1p(-x))
+    cdf = np.zeros((len(c), _PERT_PDF_POINTS + 1))
+    np.cumsum(pdf, axis=1, out=cdf[:, 1:])
+    cdf /= cdf[:, -1:]
+    edges = np.linspace(0, 1, _PERT_PDF_POINTS + 1)
+    u = np.linspace(0, 1, _PERT_GRID + 1)
+    return np.stack([np.interp(u, row, edges) for row in cdf]).astype(np.float32)
+
+
+class _Sampler:
+    """Draws phase durations into reusable float32 buffers.
+
+    Buffers are sized for the longest pathway and reused across pathways,
+    so a simulation allocates a handful of arrays however many pathways
+    it covers. PERT draws interpolate tabulated inverse CDFs (one table
+    per distinct mode position, built once per simulation) instead of
+    calling the much slower Beta sampler.
+    """
+
+    def __init__(
+        self,
+        rng: np.random.Generator,
+        draws: int,
+        max_rows: int,
+        distribution: str,
+        tables: Optional[np.ndarray] = None,
+    ):
+        self.rng = rng
+        self.distribution = distribution
+        self._u = np.empty((max_rows, draws), dtype=np.float32)
+        self._x = np.empty((max_rows, draws), dtype=np.float32)
+        if distribution == "pert":
+            self._tables = tables.ravel()
+            self._y = np.empty((max_rows, draws), dtype=np.float32)
+            self._idx = np.empty((max_rows, draws), dtype=np.intp)
+
+    def sample(
+        self,
+        low: np.ndarray,
+        mode: np.ndarray,
+        high: np.ndarray,
+        table: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Return (rows, draws) durations for phases with ``high > low``.
+
+        For PERT, ``table`` gives each row's index into the quantile tables.
+        """
+        rows = len(low)
+        span = (high - low).astype(np.float32)[:, None]
+        c = ((mode - low) / (high - low)).astype(np.float32)[:, None]
+        x = self._x[:rows]
+        u = self._u[:rows]
+        self.rng.random(out=u, dtype=np.float32)
+
+        if self.distribution == "pert":
+            # Linear interpolation between the two table entries either side of u
+            idx, y = self._idx[:rows], self._y[:rows]
+            u *= _PERT_GRID
+            np.copyto(idx, u, casting="unsafe")
+            np.minimum(idx, _PERT_GRID - 1, out=idx)
+            u -= idx
+            idx += (np.asarray(table, dtype=np.intp) * (_PERT_GRID + 1))[:, None]
+            np.take(self._tables, idx, out=x)
+            idx += 1
+            np.take(self._tables, idx, out=y)
+            y -= x
+            y *= u
+            x += y
+        else:
+            # Branch-free inverse CDF of the standard triangular distribution:
+            # sqrt(min(u, c) * c) + (1 - c) - sqrt((1 - max(u, c)) * (1 - c))
+            np.minimum(u, c, out=x)
+            x *= c
+            np.sqrt(x, out=x)
+            np.maximum(u, c, out=u)
+            np.subtract(1, u, out=u)
+            u *= 1 - c
+            np.sqrt(u, out=u)
+            x -= u
+            x += 1 - c
+
+        x *= span
+        x += low.astype(np.float32)[:, None]
+        return x
+
+
+def simulate_timelines(
+    pathways: Sequence[Pathway],
+    draws: int = DEFAULT_DRAWS,
+    seed: Optional[int] = 0,
+    distribution: str = "triangular",
+    percentiles: Sequence[int] = DEFAULT_PERCENTILES,
+    tier_spread: Tuple[float, float] = (1.0, 1.0),
+) -> TimelineDistribution:
+    """Simulate total access time for each (custodian, governance route) pathway.
+
+    Every timeline phase is drawn independently from a triangular (default)
+    or PERT distribution over ``min_weeks``/``typical_weeks``/``max_weeks``
+    and summed per pathway with the governance tiers on its route. Tiers
+    only publish typical weeks, so they are fixed unless ``tier_spread``
+    gives (low, high) multipliers. Triangular draws use a closed-form
+    inverse CDF; PERT draws interpolate a 4096-step tabulated inverse CDF,
+    whose error is well below the Monte Carlo noise at the reported
+    percentiles.
+
+    Percentiles are order statistics of the simulated totals. With the
+    default ``seed`` results are reproducible, so they can be cached.
+    """
+    if distribution not in ("triangular", "pert"):
+        raise ValueError(f"Unknown distribution: {distribution!r}")
+    if draws < 1:
+        raise ValueError("draws must be at least 1")
+    percentiles = tuple(percentiles)
+    ranks = [min(max(int(np.ceil(q / 100 * draws)) - 1, 0), draws - 1) for q in percentiles]
+    kth = sorted(set(ranks))
+
+    plans = []
+    for custodian, governance in pathways:
+        fixed = 0.0
+        stochastic = []
+        for low, mode, high in _phases(custodian, governance, tier_spread):
+            low, high = min(low, mode), max(high, mode)
+            if high > low:
+                stochastic.append((low, mode, high))
+            else:
+                fixed += mode
+        plans.append((fixed, np.array(stochastic, dtype=np.float64).reshape(-1, 3)))
+
+    values = np.zeros((len(plans), len(percentiles)))
+    mean = np.zeros(len(plans))
+    max_rows = max((len(rows) for _, rows in plans), default=0)
+    sampler = None
+    tables = [None] * len(plans)
+    if max_rows:
+        quantiles = None
+        if distribution == "pert":
+            # One inverse-CDF table per distinct mode position across all pathways
+            stacked = np.concatenate([rows for _, rows in plans])
+            c = ((stacked[:, 1] - stacked[:, 0]) / (stacked[:, 2] - stacked[:, 0])).astype(np.float32)
+            unique, inverse = np.unique(c, return_inverse=True)
+            quantiles = _pert_quantiles(unique)
+            tables = np.split(inverse.ravel(), np.cumsum([len(rows) for _, rows in plans])[:-1])
+        sampler = _Sampler(np.random.default_rng(seed), draws, max_rows, distribution, quantiles)
+
+    for i, (fixed, rows) in enumerate(plans):
+        if not len(rows):
+            values[i] = fixed
+            mean[i] = fixed
+            continue
+        totals = sampler.sample(rows[:, 0], rows[:, 1], rows[:, 2], tables[i]).sum(axis=0)
+        totals.partition(kth)
+        values[i] = totals[ranks] + fixed
+        mean[i] = totals.mean(dtype=np.float64) + fixed
+
+    return TimelineDistribution(percentiles=percentiles, values=values, mean=mean, draws=draws)
+
+
+def simulate_recommendation_timelines(
+    recommendations: Sequence[PathwayRecommendation],
+    **kwargs,
+) -> TimelineDistribution:
+    """Simulate the pathways behind a list of recommendations, in order."""
+    return simulate_timelines(
+        [(rec.custodian, rec.required_governance) for rec in recommendations], **kwargs,
+    )
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-from typing import List
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 
+from data_access.cache import recommendations_digest
 from data_access.models import DataCustodian, PathwayRecommendation
 
 
@@ -85,31 +91,29 @@ def create_pathway_sankey(
         labels.append(model_display.get(am, am))
         colours.append("#95a5a6")
 
-    sources: List[int] = []
-    targets: List[int] = []
-    values: List[float] = []
-    link_colours: List[str] = []
-
-    # Links: data_need → custodian
-    for i, dn in enumerate(data_needs):
-        dn_lower = dn.lower()
-        for j, rec in enumerate(recommendations):
-            cust_types_lower = {dt.lower() for dt in rec.custodian.data_types}
-            if dn_lower in cust_types_lower:
-                sources.append(data_need_offset + i)
-                targets.append(custodian_offset + j)
-                values.append(max(rec.overall_score / 10, 1))
-                link_colours.append(_score_colour(rec.overall_score).replace(")", ", 0.4)").replace("rgb", "rgba") if "rgb" in _score_colour(rec.overall_score) else f"rgba(100,100,100,0.3)")
-
-    # Links: custodian → access model
-    for j, rec in enumerate(recommendations):
-        am = rec.custodian.access_model
-        if am in access_models_set:
-            am_idx = model_offset + access_models_set.index(am)
-            sources.append(custodian_offset + j)
-            targets.append(am_idx)
-            values.append(max(rec.overall_score / 10, 1))
-            link_colours.append(f"rgba(150,150,150,0.3)")
+    # Links, built column-wise: data_need → custodian, then custodian → access model
+    # Compact dtypes keep the base64-encoded arrays sent to the browser small
+    link_values = np.array([max(rec.overall_score / 10, 1) for rec in recommendations], dtype=np.float32)
+
+    custodian_types = [{dt.lower() for dt in rec.custodian.data_types} for rec in recommendations]
+    held = np.array(
+        [[dn.lower() in types for types in custodian_types] for dn in data_needs],
+        dtype=bool,
+    ).reshape(len(data_needs), len(recommendations))
+    index_dtype = np.min_scalar_type(max(len(labels) - 1, 0))
+    need_rows, need_cols = (a.astype(index_dtype) for a in np.nonzero(held))  # need by need, custodians in order
+
+    model_column = {am: model_offset + k for k, am in enumerate(access_models_set)}
+    custodian_rows = np.arange(len(recommendations), dtype=index_dtype)
+
+    sources = np.concatenate([need_rows + data_need_offset, custodian_rows + custodian_offset]).astype(index_dtype)
+    targets = np.concatenate([
+        need_cols + custodian_offset,
+        np.array([model_column[rec.custodian.access_model] for rec in recommendations], dtype=index_dtype),
+    ]).astype(index_dtype)
+    values = np.concatenate([link_values[need_cols], link_values])
+    # rgba(100,100,100,0.3) and rgba(150,150,150,0.3) as 8-digit hex, repeated per link
+    link_colours = ["#6464644d"] * len(need_rows) + ["#9696964d"] * len(recommendations)
 
     fig = go.Figure(data=[go.Sankey(
         node=dict(
@@ -182,66 +186,63 @@ def create_comparison_radar(recommendations: List[PathwayRecommendation]) -> go.
 # ---------------------------------------------------------------------------
 
 def create_timeline_gantt(recommendations: List[PathwayRecommendation]) -> go.Figure:
-    """Horizontal stacked bars showing estimated phases per custodian."""
-    fig = go.Figure()
-
-    phase_names_seen: set = set()
+    """Horizontal stacked bars showing estimated phases per custodian.
+
+    Segments are collected column-wise and drawn as one array-backed trace
+    per phase name (plus one for governance), so the number of traces stays
+    small however many pathways are shown.
+    """
+    # phase name -> columns of (custodian, weeks, base, hover lines)
+    segments: Dict[str, Dict[str, list]] = {}
+    shown: List[str] = []
+
+    def _add(group: str, name: str, weeks: int, base: int, label: str, detail: str):
+        columns = segments.setdefault(group, {"y": [], "x": [], "base": [], "hover": []})
+        columns["y"].append(name)
+        columns["x"].append(weeks)
+        columns["base"].append(base)
+        columns["hover"].append((label, detail))
 
-    for idx, rec in enumerate(recommendations):
+    for rec in recommendations:
+        name = rec.custodian.short_name
         offset = 0
         for phase in rec.custodian.timeline:
-            show_legend = phase.phase not in phase_names_seen
-            phase_names_seen.add(phase.phase)
-
-            colour = _PHASE_COLOURS.get(phase.phase, "#95a5a6")
-
-            fig.add_trace(go.Bar(
-                y=[rec.custodian.short_name],
-                x=[phase.typical_weeks],
-                base=offset,
-                orientation="h",
-                name=phase.phase,
-                marker_color=colour,
-                showlegend=show_legend,
-                legendgroup=phase.phase,
-                hovertemplate=(
-                    f"<b>{rec.custodian.short_name}</b><br>"
-                    f"{phase.phase}: {phase.typical_weeks} weeks<br>"
-                    f"(Range: {phase.min_weeks}-{phase.max_weeks} weeks)"
-                    "<extra></extra>"
-                ),
-            ))
+            _add(
+                phase.phase, name, phase.typical_weeks, offset,
+                f"{phase.phase}: {phase.typical_weeks} weeks",
+                f"<br>(Range: {phase.min_weeks}-{phase.max_weeks} weeks)",
+            )
             offset += phase.typical_weeks
 
         # Add governance body time as a separate bar
         for gov in rec.required_governance:
-            if gov.tiers:
-                gov_weeks = gov.tiers[0].typical_weeks
-            else:
-                gov_weeks = 0
+            gov_weeks = gov.tiers[0].typical_weeks if gov.tiers else 0
             if gov_weeks > 0:
-                show_legend = "Governance" not in phase_names_seen
-                phase_names_seen.add("Governance")
-                fig.add_trace(go.Bar(
-                    y=[rec.custodian.short_name],
-                    x=[gov_weeks],
-                    base=offset,
-                    orientation="h",
-                    name="Governance",
-                    marker_color="#8e44ad",
-                    showlegend=show_legend,
-                    legendgroup="Governance",
-                    hovertemplate=(
-                        f"<b>{rec.custodian.short_name}</b><br>"
-                        f"{gov.short_name}: ~{gov_weeks} weeks"
-                        "<extra></extra>"
-                    ),
-                ))
+                _add("Governance", name, gov_weeks, offset, f"{gov.short_name}: ~{gov_weeks} weeks", "")
                 offset += gov_weeks
 
+        if offset or rec.custodian.timeline:
+            shown.append(name)
+
+    fig = go.Figure()
+    for group, columns in segments.items():
+        fig.add_trace(go.Bar(
+            y=columns["y"],
+            x=np.array(columns["x"], dtype=np.int32),
+            base=np.array(columns["base"], dtype=np.int32),
+            orientation="h",
+            name=group,
+            marker_color="#8e44ad" if group == "Governance" else _PHASE_COLOURS.get(group, "#95a5a6"),
+            legendgroup=group,
+            customdata=columns["hover"],
+            hovertemplate="<b>%{y}</b><br>%{customdata[0]}%{customdata[1]}<extra></extra>",
+        ))
+
     fig.update_layout(
-        barmode="stack",
+        # Bars carry explicit bases, so they are overlaid rather than re-stacked
+        barmode="overlay",
         xaxis_title="Weeks",
+        yaxis=dict(categoryorder="array", categoryarray=list(dict.fromkeys(shown))),
         title_text="Estimated Timeline Comparison",
         height=max(300, len(recommendations) * 50 + 150),
         margin=dict(l=10, r=10, t=40, b=40),
@@ -254,42 +255,69 @@ def create_timeline_gantt(recommendations: List[PathwayRecommendation]) -> go.Fi
 # 4. Cost breakdown chart
 # ---------------------------------------------------------------------------
 
-def create_cost_comparison(recommendations: List[PathwayRecommendation]) -> go.Figure:
-    """Bar chart showing cost categories per custodian."""
-    import re
+def _cost_range_label(low: int, high: Optional[int]) -> str:
+    if high is None:
+        return f"£{low:,}+ (some fees unpriced)"
+    return f"£{low:,}" if high == low else f"£{low:,}-£{high:,}"
+
+
+def create_cost_comparison(
+    recommendations: List[PathwayRecommendation],
+    study_years: Optional[float] = None,
+    researcher_type: Optional[str] = None,
+) -> go.Figure:
+    """Bar chart showing cost categories per custodian.
 
+    Fees come from each custodian's parsed cost model (lower bound of any
+    range, zero when free or unpriced). With ``study_years`` the total cost
+    of access over that duration is overlaid, with its upper bound as an
+    error bar where one is known.
+    """
     custodian_names: List[str] = []
     app_fees: List[float] = []
     annual_fees: List[float] = []
     tre_fees: List[float] = []
-
-    def _parse_fee(fee_str: str | None) -> float:
-        if not fee_str:
-            return 0
-        if "free" in fee_str.lower():
-            return 0
-        numbers = re.findall(r"[\d,]+", fee_str.replace(",", ""))
-        if numbers:
-            return float(numbers[0])
-        return 0
+    totals: List[Tuple[int, Optional[int]]] = []
 
     for rec in recommendations:
         custodian_names.append(rec.custodian.short_name)
         costs = rec.custodian.costs
         if costs:
-            app_fees.append(_parse_fee(costs.application_fee))
-            annual_fees.append(_parse_fee(costs.annual_access_fee))
-            tre_fees.append(_parse_fee(costs.tre_fee))
+            model = costs.model
+            app_fees.append(model.application.bounds()[0])
+            annual_fees.append(model.annual.bounds()[0])
+            tre_fees.append(model.tre.bounds()[0])
+            if study_years is not None:
+                totals.append(costs.total_cost(study_years, researcher_type=researcher_type))
         else:
             app_fees.append(0)
             annual_fees.append(0)
             tre_fees.append(0)
+            totals.append((0, None))
 
     fig = go.Figure()
     fig.add_trace(go.Bar(name="Application Fee", x=custodian_names, y=app_fees, marker_color="#3498db"))
     fig.add_trace(go.Bar(name="Annual Fee", x=custodian_names, y=annual_fees, marker_color="#e74c3c"))
     fig.add_trace(go.Bar(name="TRE Fee", x=custodian_names, y=tre_fees, marker_color="#2ecc71"))
 
+    if study_years is not None:
+        low = [t[0] for t in totals]
+        fig.add_trace(go.Scatter(
+            name=f"Total over {study_years:g} yr",
+            x=custodian_names,
+            y=low,
+            mode="markers",
+            marker=dict(symbol="diamond", size=11, color="#2c3e50"),
+            error_y=dict(
+                type="data",
+                symmetric=False,
+                array=[high - lo if high is not None else 0 for lo, high in totals],
+                arrayminus=[0] * len(low),
+            ),
+            customdata=[_cost_range_label(lo, high) for lo, high in totals],
+            hovertemplate="<b>%{x}</b><br>Total: %{customdata}<extra></extra>",
+        ))
+
     fig.update_layout(
         barmode="group",
         yaxis_title="Estimated Cost (GBP)",
@@ -327,3 +355,83 @@ def create_score_overview(recommendations: List[PathwayRecommendation]) -> go.Fi
         margin=dict(l=10, r=10, t=40, b=20),
     )
     return fig
+
+
+# ---------------------------------------------------------------------------
+# 6. Figure cache
+# ---------------------------------------------------------------------------
+
+class FigureCache:
+    """Thread-safe LRU of pre-serialised Plotly figure JSON.
+
+    Entries are keyed by builder name and ``recommendations_digest``, so
+    reruns with an unchanged recommendation set skip the builder and its
+    trace construction and validation: the cached JSON is loaded back
+    without re-validation.
+
+    Only figure construction is cached. ``st.plotly_chart`` still copies
+    the figure to a dict and serialises it to JSON on every rerun, since it
+    cannot take a pre-serialised spec.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def to_json(
+        self,
+        builder: Callable[..., go.Figure],
+        recommendations: List[PathwayRecommendation],
+        *args: Any,
+    ) -> str:
+        """Return the figure JSON for ``builder(recommendations, *args)``, building on a miss."""
+        key = (builder.__name__, recommendations_digest(recommendations, *args))
+        with self._lock:
+            spec = self._entries.get(key)
+            if spec is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return spec
+            self.misses += 1
+
+        spec = pio.to_json(builder(recommendations, *args), validate=False)
+
+        with self._lock:
+            self._entries[key] = spec
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return spec
+
+    def figure(
+        self,
+        builder: Callable[..., go.Figure],
+        recommendations: List[PathwayRecommendation],
+        *args: Any,
+    ) -> go.Figure:
+        """Return the figure for ``builder(recommendations, *args)`` from cached JSON.
+
+        The figure is rebuilt from the JSON on every call, which is cheaper
+        than the builder but is not free.
+        """
+        spec = self.to_json(builder, recommendations, *args)
+        return go.Figure(json.loads(spec), _validate=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -11,8 +11,10 @@ Usage:
 
 Output:
     sail_data_use_register.csv - Complete data use register with project details
+    sail_direct_scrape.csv - Direct-scrape rows, streamed as their details complete
 """
 
+import csv
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
@@ -45,6 +47,27 @@ HEADERS = {
 SAIL_BASE_URL = "https://saildatabank.com"
 SAIL_REGISTER_URL = f"{SAIL_BASE_URL}/data/data-use-register/"
 HDR_API_BASE = "https://api.www.healthdatagateway.org/api/v1"
+DIRECT_OUTPUT_FILE = 'sail_direct_scrape.csv'
+
+# Labels looked for on project pages, and the column each maps to
+DETAIL_FIELD_PATTERNS = [
+    ('Lead Organisation', 'lead_organisation'),
+    ('Lead Applicant', 'lead_applicant'),
+    ('Principal Investigator', 'principal_investigator'),
+    ('Start Date', 'start_date'),
+    ('End Date', 'end_date'),
+    ('Status', 'status'),
+    ('Datasets', 'datasets'),
+    ('Research Summary', 'research_summary'),
+    ('Lay Summary', 'lay_summary'),
+    ('Public Benefit', 'public_benefit'),
+    ('Approval Date', 'approval_date'),
+    ('Project ID', 'project_id'),
+    ('IGRP', 'igrp_number'),
+]
+
+# Every column get_project_details can add to a project
+DETAIL_FIELDS = ['project_url', 'full_title'] + [key for _, key in DETAIL_FIELD_PATTERNS]
 
 
 class HDRGatewayAPI:
@@ -151,8 +174,11 @@ class HDRGatewayAPI:
         # Also try a general search
         result = self.search_data_uses(search_terms="SAIL Databank")
         if result and result.get('data'):
+            seen = {record_key(r) for r in all_results}
             for record in result['data']:
-                if record not in all_results:
+                key = record_key(record)
+                if key not in seen:
+                    seen.add(key)
                     all_results.append(record)
 
         # Remove duplicates based on ID
@@ -251,23 +277,6 @@ class SAILDirectScraper:
         if title:
             details['full_title'] = title.get_text(strip=True)
 
-        # Field patterns to look for
-        field_patterns = [
-            ('Lead Organisation', 'lead_organisation'),
-            ('Lead Applicant', 'lead_applicant'),
-            ('Principal Investigator', 'principal_investigator'),
-            ('Start Date', 'start_date'),
-            ('End Date', 'end_date'),
-            ('Status', 'status'),
-            ('Datasets', 'datasets'),
-            ('Research Summary', 'research_summary'),
-            ('Lay Summary', 'lay_summary'),
-            ('Public Benefit', 'public_benefit'),
-            ('Approval Date', 'approval_date'),
-            ('Project ID', 'project_id'),
-            ('IGRP', 'igrp_number'),
-        ]
-
         # Extract from definition lists
         for dl in soup.find_all('dl'):
             dts = dl.find_all('dt')
@@ -275,7 +284,7 @@ class SAILDirectScraper:
             for dt, dd in zip(dts, dds):
                 label = dt.get_text(strip=True)
                 value = dd.get_text(strip=True)
-                for pattern, key in field_patterns:
+                for pattern, key in DETAIL_FIELD_PATTERNS:
                     if pattern.lower() in label.lower():
                         details[key] = value
                         break
@@ -287,15 +296,32 @@ class SAILDirectScraper:
                 if len(cells) >= 2:
                     label = cells[0].get_text(strip=True)
                     value = cells[1].get_text(strip=True)
-                    for pattern, key in field_patterns:
+                    for pattern, key in DETAIL_FIELD_PATTERNS:
                         if pattern.lower() in label.lower():
                             details[key] = value
                             break
 
         return details
 
-    def scrape(self, include_details=True, max_workers=5):
-        """Main scraping function."""
+    def output_fieldnames(self):
+        """CSV columns: register columns in first-seen order, then detail fields."""
+        fieldnames = {}
+        for proj in self.projects:
+            for key in proj:
+                fieldnames.setdefault(key, None)
+        for key in DETAIL_FIELDS:
+            fieldnames.setdefault(key, None)
+        return list(fieldnames)
+
+    def scrape(self, include_details=True, max_workers=5, stream_to=None):
+        """
+        Main scraping function.
+
+        Args:
+            include_details: Fetch each project's detail page
+            max_workers: Concurrent detail-page requests
+            stream_to: Optional CSV path; rows are written as their details complete
+        """
         html = self.get_page(SAIL_REGISTER_URL)
         if not html:
             logger.error("Failed to fetch the SAIL register page")
@@ -308,11 +334,40 @@ class SAILDirectScraper:
         self.projects = self.parse_register_page(html)
         logger.info(f"Found {len(self.projects)} projects from direct scraping")
 
-        # Fetch details
-        if include_details and self.projects:
-            project_urls = [p.get('project_link') or p.get('title_link') for p in self.projects]
+        # Index projects by detail URL so each result merges in O(1);
+        # a URL shared by several rows updates the first, as before
+        url_to_project = {}
+        project_urls = []
+        if include_details:
+            for proj in self.projects:
+                for url in (proj.get('project_link'), proj.get('title_link')):
+                    if url and url not in url_to_project:
+                        url_to_project[url] = proj
+
+            project_urls = list(dict.fromkeys(
+                p.get('project_link') or p.get('title_link') for p in self.projects
+            ))
             project_urls = [url for url in project_urls if url]
 
+        # A row is complete once every detail fetch merging into it has finished
+        pending = {}
+        for url in project_urls:
+            key = id(url_to_project[url])
+            pending[key] = pending.get(key, 0) + 1
+
+        writer = None
+        stream_file = None
+        if stream_to and self.projects:
+            stream_file = open(stream_to, 'w', newline='', encoding='utf-8-sig')
+            writer = csv.DictWriter(stream_file, fieldnames=self.output_fieldnames(), extrasaction='ignore')
+            writer.writeheader()
+
+        try:
+            if writer:
+                for proj in self.projects:
+                    if id(proj) not in pending:
+                        writer.writerow(proj)
+
             if project_urls:
                 with ThreadPoolExecutor(max_workers=max_workers) as executor:
                     future_to_url = {executor.submit(self.get_project_details, url): url
@@ -320,18 +375,29 @@ class SAILDirectScraper:
 
                     for future in as_completed(future_to_url):
                         url = future_to_url[future]
+                        proj = url_to_project[url]
                         try:
-                            details = future.result()
-                            for proj in self.projects:
-                                if proj.get('project_link') == url or proj.get('title_link') == url:
-                                    proj.update(details)
-                                    break
+                            proj.update(future.result())
                         except Exception as e:
                             logger.warning(f"Error getting details: {e}")
 
+                        pending[id(proj)] -= 1
+                        if writer and not pending[id(proj)]:
+                            writer.writerow(proj)
+                            stream_file.flush()
+        finally:
+            if stream_file:
+                stream_file.close()
+                logger.info(f"Streamed {len(self.projects)} records to {stream_to}")
+
         return pd.DataFrame(self.projects)
 
 
+def record_key(record):
+    """Hashable key for a record dict, equal for records that compare equal."""
+    return json.dumps(record, sort_keys=True, default=str)
+
+
 def normalize_hdr_record(record):
     """Convert HDR UK Gateway record to standardized format."""
     return {
@@ -396,10 +462,13 @@ def main():
             all_records.extend(sail_records)
 
         # Also try search endpoint for SAIL
+        seen = {record_key(r) for r in all_records}
         sail_results = hdr_api.get_sail_data_uses()
         for record in sail_results:
             normalized = normalize_hdr_record(record)
-            if normalized not in all_records:
+            key = record_key(normalized)
+            if key not in seen:
+                seen.add(key)
                 all_records.append(normalized)
 
     except Exception as e:
@@ -409,7 +478,7 @@ def main():
     print("\n[2] Attempting direct scraping from SAIL Databank...")
     try:
         direct_scraper = SAILDirectScraper()
-        df_direct = direct_scraper.scrape(include_details=True)
+        df_direct = direct_scraper.scrape(include_details=True, stream_to=DIRECT_OUTPUT_FILE)
 
         if not df_direct.empty:
             # Add source column
@@ -6,6 +6,9 @@ OpenSAFELY's transparent job execution platform.
 """
 
 from .client import OpenSAFELYJobsClient, OpenSAFELYDataLoader
+from .cache import PageCache, CachedPage
+from .dimensions import ProjectOrganizationTable
+from .aggregators import JobStatsAggregator
 from .models import (
     Organization,
     Project,
@@ -20,6 +23,10 @@ from .models import (
 __all__ = [
     "OpenSAFELYJobsClient",
     "OpenSAFELYDataLoader",
+    "PageCache",
+    "CachedPage",
+    "ProjectOrganizationTable",
+    "JobStatsAggregator",
     "Organization",
     "Project",
     "Workspace",
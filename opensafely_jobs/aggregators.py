@@ -0,0 +1,168 @@
+"""
+Streaming aggregators for OpenSAFELY job history.
+
+Each aggregator consumes typed job rows chunk by chunk (see
+``OpenSAFELYDataLoader.iter_job_chunks``) and keeps only running totals,
+so statistics can be computed over event logs far larger than memory.
+"""
+
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Iterable
+
+from .dimensions import ProjectOrganizationTable, UNKNOWN_ID
+
+
+def count_jobs_by_organization(table: ProjectOrganizationTable, project_jobs: List[int]) -> Dict[str, int]:
+    """
+    Roll per-project job counts up to organisations.
+
+    A job for a project with several organisations counts towards each.
+
+    Args:
+        table: Project/organisation dimension table
+        project_jobs: Job request count per project id
+
+    Returns:
+        Mapping of organisation name to job count, largest first
+    """
+    org_jobs = [0] * table.org_count
+    for project_id, job_count in enumerate(project_jobs):
+        if job_count:
+            for org_id in table.project_orgs[project_id]:
+                org_jobs[org_id] += job_count
+
+    return {
+        table.org_names[org_id]: count
+        for org_id, count in sorted(enumerate(org_jobs), key=lambda x: x[1], reverse=True)
+        if count
+    }
+
+
+class ProjectJobCounter:
+    """Counts job requests per project id of a dimension table."""
+
+    def __init__(self, table: ProjectOrganizationTable):
+        self.table = table
+        self.counts = [0] * table.project_count
+
+    def add(self, job: Dict[str, Any]):
+        project_id = job.get("project_id", UNKNOWN_ID)
+        if project_id != UNKNOWN_ID:
+            self.counts[project_id] += 1
+
+    def update(self, jobs: Iterable[Dict[str, Any]]):
+        for job in jobs:
+            self.add(job)
+
+
+class JobStatsAggregator:
+    """
+    Running totals behind ``OpenSAFELYDataLoader.get_stats``.
+
+    Memory is bounded by the number of distinct statuses, backends,
+    projects, users and days, not by the number of job rows.
+    """
+
+    def __init__(self, org_table: Optional[ProjectOrganizationTable] = None):
+        self.org_table = org_table if org_table is not None and org_table.has_organizations else None
+        self.project_counter = ProjectJobCounter(self.org_table) if self.org_table else None
+
+        self.total_job_requests = 0
+        self.status_counts: Dict[str, int] = {}
+        self.backend_counts: Dict[str, int] = {}
+        self.org_counts: Dict[str, int] = {}
+        self.unique_projects: set = set()
+        self.unique_users: set = set()
+        self.jobs_by_date: Dict[str, int] = {}
+        self.total_individual_jobs = 0
+        self.jobs_in_succeeded_requests = 0
+        self.jobs_in_failed_requests = 0
+
+    def update(self, jobs: Iterable[Dict[str, Any]]):
+        """Fold a chunk of typed job rows into the running totals."""
+        status_counts = self.status_counts
+        backend_counts = self.backend_counts
+        org_counts = self.org_counts
+        jobs_by_date = self.jobs_by_date
+        count_project = self.project_counter.add if self.project_counter is not None else None
+
+        for job in jobs:
+            self.total_job_requests += 1
+
+            status = job.get("status", "unknown")
+            status_counts[status] = status_counts.get(status, 0) + 1
+
+            backend = job.get("backend", "unknown")
+            backend_counts[backend] = backend_counts.get(backend, 0) + 1
+
+            org = job.get("organization", "unknown")
+            org_counts[org] = org_counts.get(org, 0) + 1
+
+            if job.get("project"):
+                self.unique_projects.add(job["project"])
+            if job.get("user"):
+                self.unique_users.add(job["user"])
+
+            dt: Optional[datetime] = job.get("started_at_dt")
+            if dt:
+                date_key = dt.strftime("%Y-%m-%d")
+                jobs_by_date[date_key] = jobs_by_date.get(date_key, 0) + 1
+
+            job_count = int(job.get("jobs_total") or 0)
+            self.total_individual_jobs += job_count
+            if status == "succeeded":
+                self.jobs_in_succeeded_requests += job_count
+            elif status == "failed":
+                self.jobs_in_failed_requests += job_count
+
+            if count_project is not None:
+                count_project(job)
+
+    def result(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the statistics dictionary for the rows seen so far."""
+        status_counts = self.status_counts
+
+        # Calculate REQUEST-level success rate
+        succeeded_requests = status_counts.get("succeeded", 0)
+        failed_requests = status_counts.get("failed", 0)
+        completed_requests = succeeded_requests + failed_requests
+        request_success_rate = (succeeded_requests / completed_requests * 100) if completed_requests > 0 else 0
+
+        # Calculate JOB-level statistics (individual jobs within requests)
+        completed_jobs = self.jobs_in_succeeded_requests + self.jobs_in_failed_requests
+        job_success_rate = (self.jobs_in_succeeded_requests / completed_jobs * 100) if completed_jobs > 0 else 0
+
+        # Real organisation counts when the project/organisation mapping exists
+        organization_job_counts: Dict[str, int] = {}
+        if self.project_counter is not None:
+            organization_job_counts = count_jobs_by_organization(self.org_table, self.project_counter.counts)
+
+        return {
+            # Request-level metrics
+            "total_job_requests": self.total_job_requests,
+            "requests_succeeded": succeeded_requests,
+            "requests_failed": failed_requests,
+            "request_success_rate": request_success_rate,
+            # Job-level metrics (individual jobs within requests)
+            "total_individual_jobs": self.total_individual_jobs,
+            "jobs_in_succeeded_requests": self.jobs_in_succeeded_requests,
+            "jobs_in_failed_requests": self.jobs_in_failed_requests,
+            "job_success_rate": job_success_rate,
+            # Legacy field for compatibility
+            "total_jobs": self.total_job_requests,
+            "success_rate": request_success_rate,
+            # Other counts
+            "total_projects": len(self.unique_projects),
+            "total_organizations": len(organization_job_counts) if organization_job_counts else len(self.org_counts),
+            "total_users": len(self.unique_users),
+            "jobs_running": status_counts.get("running", 0),
+            "jobs_pending": status_counts.get("pending", 0),
+            "status_counts": status_counts,
+            "backend_counts": self.backend_counts,
+            "org_counts": self.org_counts,
+            "organization_job_counts": organization_job_counts,
+            "has_organization_data": bool(organization_job_counts),
+            "jobs_by_date": dict(sorted(self.jobs_by_date.items())[-30:]),  # Last 30 days
+            "last_updated": metadata.get("last_updated_formatted", "Unknown"),
+            "last_updated_iso": metadata.get("last_updated"),
+        }
@@ -0,0 +1,218 @@
+"""
+Page cache for the OpenSAFELY Jobs client.
+
+Stores raw HTML responses from jobs.opensafely.org on disk together with
+their ETag/Last-Modified validators so that repeat fetches can be made as
+conditional GETs, and keeps the records parsed out of each page so that an
+unchanged page never has to be re-parsed.
+
+The cache directory can also be used to replay a scrape offline.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedPage:
+    """A raw HTML response and the validators needed to revalidate it."""
+    url: str
+    text: str
+    digest: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CachedPage":
+        return cls(
+            url=data.get("url", ""),
+            text=data.get("text", ""),
+            digest=data.get("digest", ""),
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+            fetched_at=data.get("fetched_at", 0.0),
+        )
+
+
+def content_digest(text: str) -> str:
+    """Return a stable digest of page content."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _key(value: str) -> str:
+    return hashlib.sha1(value.encode("utf-8")).hexdigest()
+
+
+class PageCache:
+    """
+    Raw-response and parsed-record cache keyed by URL.
+
+    Pages live in ``<cache_dir>/pages/`` as JSON and parsed records in
+    ``<cache_dir>/records/`` as pickles tagged with the digest of the page
+    they were parsed from. Without a ``cache_dir`` the cache is memory-only.
+
+    Example:
+        >>> cache = PageCache(Path(".cache/opensafely"))
+        >>> client = OpenSAFELYJobsClient(page_cache=cache)
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize the page cache.
+
+        Args:
+            cache_dir: Directory for on-disk storage (memory-only if None)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._pages: Dict[str, CachedPage] = {}
+        self._records: Dict[Tuple[str, str], Tuple[str, Any]] = {}
+
+        if self.cache_dir:
+            (self.cache_dir / "pages").mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / "records").mkdir(parents=True, exist_ok=True)
+
+    def _page_path(self, url: str) -> Path:
+        return self.cache_dir / "pages" / f"{_key(url)}.json"
+
+    def _records_path(self, kind: str, url: str) -> Path:
+        return self.cache_dir / "records" / f"{_key(kind + ':' + url)}.pickle"
+
+    def _write_atomic(self, path: Path, payload: bytes):
+        """Write via a temp file so readers never see a partial entry."""
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    # -- raw pages --
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Return the cached response for a URL, if any."""
+        page = self._pages.get(url)
+        if page is not None or not self.cache_dir:
+            return page
+
+        path = self._page_path(url)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                page = CachedPage.from_dict(json.load(f))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry for {url}: {e}")
+            return None
+
+        self._pages[url] = page
+        return page
+
+    def put(
+        self,
+        url: str,
+        text: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CachedPage:
+        """Store a freshly downloaded response."""
+        page = CachedPage(
+            url=url,
+            text=text,
+            digest=content_digest(text),
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=time.time(),
+        )
+        self._pages[url] = page
+        if self.cache_dir:
+            try:
+                payload = json.dumps(asdict(page), ensure_ascii=False).encode("utf-8")
+                self._write_atomic(self._page_path(url), payload)
+            except Exception as e:
+                logger.warning(f"Failed to write cache entry for {url}: {e}")
+        return page
+
+    def touch(self, url: str) -> Optional[CachedPage]:
+        """Mark a cached response as revalidated (e.g. after HTTP 304)."""
+        page = self.get(url)
+        if page is None:
+            return None
+        page.fetched_at = time.time()
+        if self.cache_dir:
+            try:
+                payload = json.dumps(asdict(page), ensure_ascii=False).encode("utf-8")
+                self._write_atomic(self._page_path(url), payload)
+            except Exception as e:
+                logger.debug(f"Failed to refresh cache entry for {url}: {e}")
+        return page
+
+    # -- parsed records --
+
+    def get_records(self, kind: str, url: str, digest: str) -> Optional[Any]:
+        """
+        Return records parsed from a page, if parsed from the same content.
+
+        Args:
+            kind: Parser name (records of different kinds never collide)
+            url: Page URL
+            digest: Digest of the page content currently in the cache
+
+        Returns:
+            The stored records, or None if missing or parsed from stale content
+        """
+        entry = self._records.get((kind, url))
+        if entry is None and self.cache_dir:
+            path = self._records_path(kind, url)
+            if path.exists():
+                try:
+                    with open(path, "rb") as f:
+                        entry = pickle.load(f)
+                    self._records[(kind, url)] = entry
+                except Exception as e:
+                    logger.debug(f"Ignoring unreadable record cache for {url}: {e}")
+                    entry = None
+
+        if entry is None:
+            return None
+        cached_digest, records = entry
+        return records if cached_digest == digest else None
+
+    def put_records(self, kind: str, url: str, digest: str, records: Any):
+        """Store records parsed from the page content with the given digest."""
+        entry = (digest, records)
+        self._records[(kind, url)] = entry
+        if self.cache_dir:
+            try:
+                self._write_atomic(self._records_path(kind, url), pickle.dumps(entry))
+            except Exception as e:
+                logger.warning(f"Failed to write record cache for {url}: {e}")
+
+    def clear_memory(self):
+        """Drop in-memory entries; on-disk entries are reloaded on demand."""
+        self._pages.clear()
+        self._records.clear()
+
+    def clear(self):
+        """Remove every cached page and record, including on disk."""
+        self.clear_memory()
+        if self.cache_dir:
+            for sub in ("pages", "records"):
+                for path in (self.cache_dir / sub).glob("*"):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
@@ -7,15 +7,17 @@ or from a pre-scraped CSV file for complete historical data.
 OpenSAFELY publishes machine-readable logs of every query run against NHS data.
 """
 
+import copy
 import csv
+import heapq
 import json
 import logging
 import os
 import re
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Generator
+from typing import Optional, List, Dict, Any, Callable, Generator, TextIO
 from urllib.parse import urljoin
 
 import requests
@@ -23,6 +25,9 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
+from .cache import PageCache, CachedPage
+from .dimensions import ProjectOrganizationTable, UNKNOWN_ID
+from .aggregators import JobStatsAggregator, ProjectJobCounter, count_jobs_by_organization
 from .models import (
     Organization,
     Project,
@@ -37,6 +42,9 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Sort position for job rows without a parseable start time
+_OLDEST = datetime.min.replace(tzinfo=timezone.utc)
+
 
 class OpenSAFELYJobsError(Exception):
     """Base exception for OpenSAFELY Jobs client errors."""
@@ -145,6 +153,9 @@ class OpenSAFELYJobsClient:
         use_demo_fallback: bool = True,
         backoff_factor: float = 0.5,
         session: Optional[requests.Session] = None,
+        cache_dir: Optional[Path] = None,
+        page_cache: Optional[PageCache] = None,
+        offline: bool = False,
     ):
         """
         Initialize the OpenSAFELY Jobs client.
@@ -156,11 +167,16 @@ class OpenSAFELYJobsClient:
             use_demo_fallback: Use demo data when live API is unreachable
             backoff_factor: Backoff multiplier between retries
             session: Optional custom requests session
+            cache_dir: Directory for the on-disk page cache (memory-only if None)
+            page_cache: Optional pre-built page cache (overrides cache_dir)
+            offline: Serve pages only from the cache, never from the network
         """
         self.base_url = base_url or self.BASE_URL
         self.timeout = timeout
         self.use_demo_fallback = use_demo_fallback
         self._using_demo_data = False
+        self.offline = offline
+        self.page_cache = page_cache or PageCache(cache_dir)
 
         self.session = session or requests.Session()
         retry_strategy = Retry(
@@ -181,17 +197,74 @@ class OpenSAFELYJobsClient:
         self._cache: Dict[str, Any] = {}
         self._cache_ttl = 300  # 5 minutes
 
-    def _get_page(self, path: str) -> BeautifulSoup:
-        """Fetch and parse an HTML page."""
+    def _fetch(self, path: str) -> CachedPage:
+        """
+        Fetch the raw HTML for a page, revalidating any cached copy.
+
+        Cached responses are sent back with If-None-Match/If-Modified-Since
+        so an unchanged page costs a 304 rather than a full download. In
+        offline mode only the cache is consulted.
+        """
         url = urljoin(self.base_url, path)
+        cached = self.page_cache.get(url)
+
+        if self.offline:
+            if cached is None:
+                raise OpenSAFELYConnectionError(f"No cached response for {url} (offline mode)")
+            return cached
+
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
         try:
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.get(url, timeout=self.timeout, headers=headers)
+            if response.status_code == 304 and cached is not None:
+                logger.debug(f"Not modified: {url}")
+                return self.page_cache.touch(url) or cached
             response.raise_for_status()
-            return BeautifulSoup(response.text, "lxml")
         except requests.RequestException as e:
             logger.error(f"Failed to fetch {url}: {e}")
             raise OpenSAFELYConnectionError(f"Failed to fetch {url}: {e}")
 
+        return self.page_cache.put(
+            url,
+            response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def _get_page(self, path: str) -> BeautifulSoup:
+        """Fetch and parse an HTML page."""
+        return BeautifulSoup(self._fetch(path).text, "lxml")
+
+    def _get_records(self, path: str, kind: str, parser: Callable[[BeautifulSoup], Any]) -> Any:
+        """
+        Fetch a page and return the records parsed out of it.
+
+        The parsed records are cached against the page content digest, so
+        the HTML is only parsed again when the page actually changes.
+
+        Args:
+            path: Page path relative to the base URL
+            kind: Name of the parser, used to namespace cached records
+            parser: Function turning the page soup into records
+
+        Returns:
+            Whatever ``parser`` returns for the page
+        """
+        page = self._fetch(path)
+        records = self.page_cache.get_records(kind, page.url, page.digest)
+        if records is not None:
+            return copy.deepcopy(records)
+
+        records = parser(BeautifulSoup(page.text, "lxml"))
+        self.page_cache.put_records(kind, page.url, page.digest, records)
+        return copy.deepcopy(records)
+
     def _parse_datetime(self, text: str) -> Optional[datetime]:
         """Parse datetime from various formats."""
         if not text:
@@ -239,6 +312,216 @@ class OpenSAFELYJobsClient:
         match = re.search(r"(\d+)", text.replace(",", ""))
         return int(match.group(1)) if match else 0
 
+    # -- page parsers (return plain records so they can be cached) --
+
+    def _parse_organizations(self, soup: BeautifulSoup) -> List[Organization]:
+        """Parse the organisation list page."""
+        organizations = []
+
+        # Find organization list - typically in a list or table format
+        org_links = soup.find_all("a", href=re.compile(r"^/[^/]+/$"))
+
+        for link in org_links:
+            href = link.get("href", "")
+            # Skip non-organization links
+            if href in ["/", "/login/", "/logout/", "/organisations/", "/status/"]:
+                continue
+            if any(x in href for x in ["static", "admin", "staff", "api"]):
+                continue
+
+            name = link.get_text(strip=True)
+            if not name or len(name) < 2:
+                continue
+
+            slug = href.strip("/")
+
+            # Try to find project count nearby
+            parent = link.find_parent(["li", "tr", "div"])
+            project_count = 0
+            if parent:
+                count_text = parent.get_text()
+                count_match = re.search(r"(\d+)\s*project", count_text, re.IGNORECASE)
+                if count_match:
+                    project_count = int(count_match.group(1))
+
+            org = Organization(
+                name=name,
+                slug=slug,
+                project_count=project_count,
+            )
+            organizations.append(org)
+
+        # Deduplicate by slug
+        seen_slugs = set()
+        unique_orgs = []
+        for org in organizations:
+            if org.slug not in seen_slugs:
+                seen_slugs.add(org.slug)
+                unique_orgs.append(org)
+
+        return unique_orgs
+
+    def _parse_organization_details(self, soup: BeautifulSoup, slug: str) -> Organization:
+        """Parse an organisation page into an Organization with its projects."""
+        # Parse organization name from title or heading
+        name = slug
+        h1 = soup.find("h1")
+        if h1:
+            name = h1.get_text(strip=True)
+
+        # Find projects in the organization
+        projects = []
+        project_links = soup.find_all("a", href=re.compile(rf"^/{slug}/[^/]+/$"))
+
+        for link in project_links:
+            project_slug = link.get("href", "").strip("/").split("/")[-1]
+            project_name = link.get_text(strip=True)
+
+            if project_name and project_slug:
+                projects.append(Project(
+                    name=project_name,
+                    slug=f"{slug}/{project_slug}",
+                ))
+
+        return Organization(
+            name=name,
+            slug=slug,
+            project_count=len(projects),
+            projects=projects,
+        )
+
+    def _parse_job_requests(self, soup: BeautifulSoup) -> List[JobRequest]:
+        """Parse job request rows from the homepage."""
+        job_requests = []
+
+        # Find job request entries - typically in a table or list
+        # Look for time elements and links that indicate job requests
+        rows = soup.find_all(["tr", "li", "div"], class_=re.compile(r"job|request|row", re.IGNORECASE))
+
+        for row in rows:
+            try:
+                # Extract job request details
+                links = row.find_all("a")
+                time_elem = row.find("time")
+
+                identifier = ""
+                workspace_name = ""
+                project_name = ""
+                status = JobStatus.UNKNOWN
+
+                for link in links:
+                    href = link.get("href", "")
+                    text = link.get_text(strip=True)
+
+                    if "/job-requests/" in href or "/jobs/" in href:
+                        identifier = href.split("/")[-2] if href.endswith("/") else href.split("/")[-1]
+                    elif re.match(r"^/[^/]+/[^/]+/$", href):
+                        # This is likely a workspace link
+                        parts = href.strip("/").split("/")
+                        if len(parts) >= 2:
+                            project_name = parts[0]
+                            workspace_name = parts[-1]
+
+                # Parse status from class names or text
+                row_classes = " ".join(row.get("class", []))
+                row_text = row.get_text(strip=True).lower()
+
+                if "success" in row_classes or "succeeded" in row_text:
+                    status = JobStatus.SUCCEEDED
+                elif "fail" in row_classes or "failed" in row_text:
+                    status = JobStatus.FAILED
+                elif "running" in row_classes or "running" in row_text:
+                    status = JobStatus.RUNNING
+                elif "pending" in row_classes or "pending" in row_text:
+                    status = JobStatus.PENDING
+
+                # Parse timestamp
+                created_at = None
+                if time_elem:
+                    datetime_attr = time_elem.get("datetime")
+                    if datetime_attr:
+                        created_at = self._parse_datetime(datetime_attr)
+                    else:
+                        created_at = self._parse_datetime(time_elem.get_text(strip=True))
+
+                if identifier or workspace_name:
+                    job_requests.append(JobRequest(
+                        identifier=identifier,
+                        sha="",
+                        status=status,
+                        created_at=created_at,
+                        workspace_name=workspace_name,
+                        project_name=project_name,
+                    ))
+
+            except Exception as e:
+                logger.debug(f"Failed to parse job request row: {e}")
+                continue
+
+        return job_requests
+
+    def _parse_project_details(self, soup: BeautifulSoup, project_slug: str) -> Project:
+        """Parse a project page into a Project with its workspaces."""
+        # Parse project name
+        name = project_slug.split("/")[-1]
+        h1 = soup.find("h1")
+        if h1:
+            name = h1.get_text(strip=True)
+
+        # Find status
+        status = ProjectStatus.ONGOING
+        status_text = soup.find(text=re.compile(r"status", re.IGNORECASE))
+        if status_text:
+            parent = status_text.find_parent()
+            if parent:
+                for ps in ProjectStatus:
+                    if ps.value in parent.get_text().lower():
+                        status = ps
+                        break
+
+        # Find workspaces
+        workspaces = []
+        workspace_links = soup.find_all("a", href=re.compile(rf"^/{project_slug}/[^/]+/$"))
+
+        for link in workspace_links:
+            ws_name = link.get_text(strip=True)
+            ws_href = link.get("href", "")
+
+            if ws_name and "workspace" not in ws_href.lower():
+                workspaces.append(Workspace(
+                    name=ws_name,
+                    project_name=name,
+                ))
+
+        # Find member count
+        member_count = 0
+        members_text = soup.find(text=re.compile(r"member", re.IGNORECASE))
+        if members_text:
+            parent = members_text.find_parent()
+            if parent:
+                member_count = self._parse_count(parent.get_text())
+
+        # Extract organization names
+        org_names = []
+        org_section = soup.find(text=re.compile(r"organisation|organization", re.IGNORECASE))
+        if org_section:
+            parent = org_section.find_parent()
+            if parent:
+                org_links = parent.find_all("a")
+                org_names = [l.get_text(strip=True) for l in org_links if l.get_text(strip=True)]
+
+        return Project(
+            name=name,
+            slug=project_slug,
+            status=status,
+            org_names=org_names,
+            member_count=member_count,
+            workspace_count=len(workspaces),
+            workspaces=workspaces,
+        )
+
+    # -- public API --
+
     def get_organizations(self, use_cache: bool = True) -> List[Organization]:
         """
         Get list of all organizations using OpenSAFELY.
@@ -256,49 +539,7 @@ class OpenSAFELYJobsClient:
                 return cached_data
 
         try:
-            soup = self._get_page("/organisations/")
-            organizations = []
-
-            # Find organization list - typically in a list or table format
-            org_links = soup.find_all("a", href=re.compile(r"^/[^/]+/$"))
-
-            for link in org_links:
-                href = link.get("href", "")
-                # Skip non-organization links
-                if href in ["/", "/login/", "/logout/", "/organisations/", "/status/"]:
-                    continue
-                if any(x in href for x in ["static", "admin", "staff", "api"]):
-                    continue
-
-                name = link.get_text(strip=True)
-                if not name or len(name) < 2:
-                    continue
-
-                slug = href.strip("/")
-
-                # Try to find project count nearby
-                parent = link.find_parent(["li", "tr", "div"])
-                project_count = 0
-                if parent:
-                    count_text = parent.get_text()
-                    count_match = re.search(r"(\d+)\s*project", count_text, re.IGNORECASE)
-                    if count_match:
-                        project_count = int(count_match.group(1))
-
-                org = Organization(
-                    name=name,
-                    slug=slug,
-                    project_count=project_count,
-                )
-                organizations.append(org)
-
-            # Deduplicate by slug
-            seen_slugs = set()
-            unique_orgs = []
-            for org in organizations:
-                if org.slug not in seen_slugs:
-                    seen_slugs.add(org.slug)
-                    unique_orgs.append(org)
+            unique_orgs = self._get_records("/organisations/", "organizations", self._parse_organizations)
 
             self._cache[cache_key] = (time.time(), unique_orgs)
 
@@ -329,33 +570,10 @@ class OpenSAFELYJobsClient:
             Organization object with projects
         """
         try:
-            soup = self._get_page(f"/{slug}/")
-
-            # Parse organization name from title or heading
-            name = slug
-            h1 = soup.find("h1")
-            if h1:
-                name = h1.get_text(strip=True)
-
-            # Find projects in the organization
-            projects = []
-            project_links = soup.find_all("a", href=re.compile(rf"^/{slug}/[^/]+/$"))
-
-            for link in project_links:
-                project_slug = link.get("href", "").strip("/").split("/")[-1]
-                project_name = link.get_text(strip=True)
-
-                if project_name and project_slug:
-                    projects.append(Project(
-                        name=project_name,
-                        slug=f"{slug}/{project_slug}",
-                    ))
-
-            return Organization(
-                name=name,
-                slug=slug,
-                project_count=len(projects),
-                projects=projects,
+            return self._get_records(
+                f"/{slug}/",
+                "organization_details",
+                lambda soup: self._parse_organization_details(soup, slug),
             )
 
         except OpenSAFELYConnectionError:
@@ -375,72 +593,7 @@ class OpenSAFELYJobsClient:
             List of recent JobRequest objects
         """
         try:
-            soup = self._get_page("/")
-            job_requests = []
-
-            # Find job request entries - typically in a table or list
-            # Look for time elements and links that indicate job requests
-            rows = soup.find_all(["tr", "li", "div"], class_=re.compile(r"job|request|row", re.IGNORECASE))
-
-            for row in rows[:limit]:
-                try:
-                    # Extract job request details
-                    links = row.find_all("a")
-                    time_elem = row.find("time")
-
-                    identifier = ""
-                    workspace_name = ""
-                    project_name = ""
-                    status = JobStatus.UNKNOWN
-
-                    for link in links:
-                        href = link.get("href", "")
-                        text = link.get_text(strip=True)
-
-                        if "/job-requests/" in href or "/jobs/" in href:
-                            identifier = href.split("/")[-2] if href.endswith("/") else href.split("/")[-1]
-                        elif re.match(r"^/[^/]+/[^/]+/$", href):
-                            # This is likely a workspace link
-                            parts = href.strip("/").split("/")
-                            if len(parts) >= 2:
-                                project_name = parts[0]
-                                workspace_name = parts[-1]
-
-                    # Parse status from class names or text
-                    row_classes = " ".join(row.get("class", []))
-                    row_text = row.get_text(strip=True).lower()
-
-                    if "success" in row_classes or "succeeded" in row_text:
-                        status = JobStatus.SUCCEEDED
-                    elif "fail" in row_classes or "failed" in row_text:
-                        status = JobStatus.FAILED
-                    elif "running" in row_classes or "running" in row_text:
-                        status = JobStatus.RUNNING
-                    elif "pending" in row_classes or "pending" in row_text:
-                        status = JobStatus.PENDING
-
-                    # Parse timestamp
-                    created_at = None
-                    if time_elem:
-                        datetime_attr = time_elem.get("datetime")
-                        if datetime_attr:
-                            created_at = self._parse_datetime(datetime_attr)
-                        else:
-                            created_at = self._parse_datetime(time_elem.get_text(strip=True))
-
-                    if identifier or workspace_name:
-                        job_requests.append(JobRequest(
-                            identifier=identifier,
-                            sha="",
-                            status=status,
-                            created_at=created_at,
-                            workspace_name=workspace_name,
-                            project_name=project_name,
-                        ))
-
-                except Exception as e:
-                    logger.debug(f"Failed to parse job request row: {e}")
-                    continue
+            job_requests = self._get_records("/", "job_requests", self._parse_job_requests)
 
             # If we got no results, fall back to demo data
             if len(job_requests) == 0 and self.use_demo_fallback:
@@ -480,64 +633,10 @@ class OpenSAFELYJobsClient:
             Project object with workspaces
         """
         try:
-            soup = self._get_page(f"/{project_slug}/")
-
-            # Parse project name
-            name = project_slug.split("/")[-1]
-            h1 = soup.find("h1")
-            if h1:
-                name = h1.get_text(strip=True)
-
-            # Find status
-            status = ProjectStatus.ONGOING
-            status_text = soup.find(text=re.compile(r"status", re.IGNORECASE))
-            if status_text:
-                parent = status_text.find_parent()
-                if parent:
-                    for ps in ProjectStatus:
-                        if ps.value in parent.get_text().lower():
-                            status = ps
-                            break
-
-            # Find workspaces
-            workspaces = []
-            workspace_links = soup.find_all("a", href=re.compile(rf"^/{project_slug}/[^/]+/$"))
-
-            for link in workspace_links:
-                ws_name = link.get_text(strip=True)
-                ws_href = link.get("href", "")
-
-                if ws_name and "workspace" not in ws_href.lower():
-                    workspaces.append(Workspace(
-                        name=ws_name,
-                        project_name=name,
-                    ))
-
-            # Find member count
-            member_count = 0
-            members_text = soup.find(text=re.compile(r"member", re.IGNORECASE))
-            if members_text:
-                parent = members_text.find_parent()
-                if parent:
-                    member_count = self._parse_count(parent.get_text())
-
-            # Extract organization names
-            org_names = []
-            org_section = soup.find(text=re.compile(r"organisation|organization", re.IGNORECASE))
-            if org_section:
-                parent = org_section.find_parent()
-                if parent:
-                    org_links = parent.find_all("a")
-                    org_names = [l.get_text(strip=True) for l in org_links if l.get_text(strip=True)]
-
-            return Project(
-                name=name,
-                slug=project_slug,
-                status=status,
-                org_names=org_names,
-                member_count=member_count,
-                workspace_count=len(workspaces),
-                workspaces=workspaces,
+            return self._get_records(
+                f"/{project_slug}/",
+                "project_details",
+                lambda soup: self._parse_project_details(soup, project_slug),
             )
 
         except OpenSAFELYConnectionError:
@@ -649,8 +748,9 @@ class OpenSAFELYJobsClient:
         return list(self.BACKENDS.values())
 
     def clear_cache(self):
-        """Clear the internal cache."""
+        """Clear the internal cache (the on-disk page cache is kept)."""
         self._cache.clear()
+        self.page_cache.clear_memory()
 
 
 class OpenSAFELYDataLoader:
@@ -664,6 +764,18 @@ class OpenSAFELYDataLoader:
     DEFAULT_DATA_DIR = Path(__file__).parent.parent / "data"
     CSV_FILENAME = "opensafely_jobs_history.csv"
     METADATA_FILENAME = "opensafely_jobs_metadata.json"
+    MAPPING_FILENAME = "project_organization_mapping.json"
+
+    # Rows per streamed chunk, and the CSV size above which aggregations
+    # stream from disk instead of loading the full history into memory
+    DEFAULT_CHUNK_SIZE = 10_000
+    MAX_IN_MEMORY_BYTES = 256 * 1024 * 1024
+
+    EXPORT_FIELDS = [
+        "job_request_id", "status", "organization", "project", "project_url",
+        "workspace", "workspace_url", "user", "jobs_completed", "jobs_total",
+        "backend", "started_at", "started_at_iso",
+    ]
 
     def __init__(self, data_dir: Optional[Path] = None):
         """
@@ -675,6 +787,8 @@ class OpenSAFELYDataLoader:
         self.data_dir = Path(data_dir) if data_dir else self.DEFAULT_DATA_DIR
         self._jobs_cache: Optional[List[Dict[str, Any]]] = None
         self._metadata_cache: Optional[Dict[str, Any]] = None
+        self._org_table: Optional[ProjectOrganizationTable] = None
+        self._org_table_loaded = False
 
     @property
     def csv_path(self) -> Path:
@@ -684,11 +798,35 @@ class OpenSAFELYDataLoader:
     def metadata_path(self) -> Path:
         return self.data_dir / self.METADATA_FILENAME
 
+    @property
+    def mapping_path(self) -> Path:
+        return self.data_dir / self.MAPPING_FILENAME
+
     @property
     def has_data(self) -> bool:
         """Check if CSV data file exists."""
         return self.csv_path.exists()
 
+    @property
+    def has_organization_data(self) -> bool:
+        """Check if a project→organisation mapping with organisations is available."""
+        table = self.load_project_organizations()
+        return table is not None and table.has_organizations
+
+    def load_project_organizations(self) -> Optional[ProjectOrganizationTable]:
+        """
+        Load the project→organisation dimension table.
+
+        Built from the mapping written by scrape_project_organizations.py.
+
+        Returns:
+            ProjectOrganizationTable, or None if no mapping has been scraped
+        """
+        if not self._org_table_loaded:
+            self._org_table = ProjectOrganizationTable.load(self.mapping_path)
+            self._org_table_loaded = True
+        return self._org_table
+
     def load_metadata(self) -> Dict[str, Any]:
         """Load metadata about the scraped data."""
         if self._metadata_cache is not None:
@@ -732,6 +870,132 @@ class OpenSAFELYDataLoader:
                 pass
         return None
 
+    def _job_datetime(self, row: Dict[str, Any]) -> Optional[datetime]:
+        """Parse a row's start time from the ISO field, falling back to the text field."""
+        iso = row.get("started_at_iso", "")
+        if iso:
+            try:
+                return datetime.fromisoformat(iso.replace("Z", "+00:00"))
+            except ValueError:
+                pass
+        return self._parse_date_from_text(row.get("started_at", ""))
+
+    def _type_row(self, row: Dict[str, Any], table: Optional[ProjectOrganizationTable]) -> Dict[str, Any]:
+        """Convert a raw CSV row to typed columns and join the organisation dimension."""
+        # Convert numeric fields
+        row["jobs_completed"] = int(row.get("jobs_completed", 0) or 0)
+        row["jobs_total"] = int(row.get("jobs_total", 0) or 0)
+        row["started_at_dt"] = self._job_datetime(row)
+        # Join to the project/organisation dimension once, up front
+        # (the "organization" column actually contains project slugs)
+        if table is not None:
+            project_id = table.project_id(row.get("organization", ""))
+            row["project_id"] = project_id
+            row["org_ids"] = table.orgs_for_project(project_id)
+        else:
+            row["project_id"] = UNKNOWN_ID
+            row["org_ids"] = ()
+        return row
+
+    @property
+    def fits_in_memory(self) -> bool:
+        """Whether the CSV is small enough to load as a list (or already is)."""
+        if self._jobs_cache is not None:
+            return True
+        try:
+            return self.csv_path.stat().st_size <= self.MAX_IN_MEMORY_BYTES
+        except OSError:
+            return True
+
+    def iter_job_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        Stream typed job rows from the CSV in chunks.
+
+        Reads lazily from disk, so memory stays bounded by ``chunk_size``
+        however large the history is. Rows already loaded by ``load_jobs``
+        are served from memory instead.
+
+        Args:
+            chunk_size: Number of rows per chunk
+
+        Yields:
+            Lists of typed job row dictionaries
+        """
+        if self._jobs_cache is not None:
+            for start in range(0, len(self._jobs_cache), chunk_size):
+                yield self._jobs_cache[start:start + chunk_size]
+            return
+
+        if not self.csv_path.exists():
+            logger.warning(f"CSV file not found: {self.csv_path}")
+            return
+
+        table = self.load_project_organizations()
+        chunk: List[Dict[str, Any]] = []
+        with open(self.csv_path, "r", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                chunk.append(self._type_row(row, table))
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+        if chunk:
+            yield chunk
+
+    def iter_jobs(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Generator[Dict[str, Any], None, None]:
+        """
+        Stream typed job rows one at a time.
+
+        Args:
+            chunk_size: Number of rows read from disk per chunk
+
+        Yields:
+            Typed job row dictionaries
+        """
+        for chunk in self.iter_job_chunks(chunk_size):
+            yield from chunk
+
+    def _scan_chunks(self) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        Chunks for aggregation: from the cached list when the data fits, streamed otherwise.
+
+        Raises:
+            OpenSAFELYParseError: If the CSV cannot be read to the end; chunks
+                already yielded are then only part of the history
+        """
+        if self.fits_in_memory:
+            self.load_jobs()
+        try:
+            yield from self.iter_job_chunks()
+        except (OSError, csv.Error, UnicodeDecodeError, ValueError) as e:
+            logger.error(f"Failed to read jobs from CSV: {e}")
+            raise OpenSAFELYParseError(f"Failed to read jobs from {self.csv_path.name}: {e}") from e
+
+    def export_jobs_csv(self, dest: TextIO, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                        fieldnames: Optional[List[str]] = None) -> int:
+        """
+        Stream job rows (optionally filtered) to a CSV file object.
+
+        Args:
+            dest: Writable text file object
+            predicate: Optional row filter
+            fieldnames: Columns to write (defaults to the event log columns)
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            OpenSAFELYParseError: If the CSV cannot be read to the end
+        """
+        fieldnames = fieldnames or self.EXPORT_FIELDS
+        writer = csv.DictWriter(dest, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+        written = 0
+        for chunk in self._scan_chunks():
+            rows = [row for row in chunk if predicate(row)] if predicate else chunk
+            writer.writerows(rows)
+            written += len(rows)
+        return written
+
     def load_jobs(self) -> List[Dict[str, Any]]:
         """Load all jobs from the CSV file."""
         if self._jobs_cache is not None:
@@ -742,15 +1006,7 @@ class OpenSAFELYDataLoader:
             return []
 
         try:
-            jobs = []
-            with open(self.csv_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Convert numeric fields
-                    row["jobs_completed"] = int(row.get("jobs_completed", 0) or 0)
-                    row["jobs_total"] = int(row.get("jobs_total", 0) or 0)
-                    jobs.append(row)
-
+            jobs = list(self.iter_jobs())
             self._jobs_cache = jobs
             logger.info(f"Loaded {len(jobs)} jobs from CSV")
             return jobs
@@ -759,87 +1015,126 @@ class OpenSAFELYDataLoader:
             logger.error(f"Failed to load jobs from CSV: {e}")
             return []
 
+    @staticmethod
+    def _recency_key(job: Dict[str, Any]) -> datetime:
+        """Sort key for most-recent-first ordering (undated rows last)."""
+        dt = job.get("started_at_dt")
+        if dt is None:
+            return _OLDEST
+        # Treat naive text-parsed times as UTC so they compare with ISO times
+        return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
     def get_job_requests(self, limit: Optional[int] = None) -> List[JobRequest]:
         """
         Get job requests from the CSV data.
 
+        With a limit, the most recent rows are selected in a single
+        streaming pass holding only ``limit`` rows.
+
         Args:
             limit: Maximum number of jobs to return (most recent first)
 
         Returns:
             List of JobRequest objects
         """
-        jobs = self.load_jobs()
-
         # Sort by date (most recent first)
-        def parse_date(job):
-            # Try ISO field first, then fall back to text parsing
-            iso = job.get("started_at_iso", "")
-            if iso:
-                try:
-                    return datetime.fromisoformat(iso.replace("Z", "+00:00"))
-                except:
-                    pass
-            # Fall back to parsing the text field
-            text = job.get("started_at", "")
-            parsed = self._parse_date_from_text(text)
-            return parsed if parsed else datetime.min
-
-        sorted_jobs = sorted(jobs, key=parse_date, reverse=True)
-
         if limit:
-            sorted_jobs = sorted_jobs[:limit]
+            rows = self.load_jobs() if self.fits_in_memory else self.iter_jobs()
+            sorted_jobs = heapq.nlargest(limit, rows, key=self._recency_key)
+        else:
+            sorted_jobs = sorted(self.load_jobs(), key=self._recency_key, reverse=True)
 
         job_requests = []
         for job in sorted_jobs:
-            status = JobStatus.from_string(job.get("status", "unknown"))
-            # Parse date from ISO or text
-            created_at = None
-            iso = job.get("started_at_iso", "")
-            if iso:
-                try:
-                    created_at = datetime.fromisoformat(iso.replace("Z", "+00:00"))
-                except:
-                    pass
-            if not created_at:
-                created_at = self._parse_date_from_text(job.get("started_at", ""))
-
             jr = JobRequest(
                 identifier=job.get("job_request_id", ""),
                 sha="",
-                status=status,
+                status=JobStatus.from_string(job.get("status", "unknown")),
                 workspace_name=job.get("workspace", ""),
                 project_name=job.get("project", ""),
                 backend_name=job.get("backend", ""),
                 created_by=job.get("user", ""),
-                created_at=created_at,
+                created_at=job.get("started_at_dt"),
             )
             job_requests.append(jr)
 
         return job_requests
 
+    def _job_counts_by_project(self, table: ProjectOrganizationTable) -> List[int]:
+        """Count job requests per project id."""
+        counter = ProjectJobCounter(table)
+        for chunk in self._scan_chunks():
+            counter.update(chunk)
+        return counter.counts
+
+    def _aggregate_organizations(self, table: ProjectOrganizationTable) -> List[Organization]:
+        """Aggregate job history per real organisation via the dimension table."""
+        project_jobs = self._job_counts_by_project(table)
+        org_projects: List[List[int]] = [[] for _ in range(table.org_count)]
+        for project_id, job_count in enumerate(project_jobs):
+            if job_count:
+                for org_id in table.project_orgs[project_id]:
+                    org_projects[org_id].append(project_id)
+
+        organizations = []
+        for org_id, project_ids in enumerate(org_projects):
+            if not project_ids:
+                continue
+            organizations.append(Organization(
+                name=table.org_names[org_id],
+                slug=table.org_slugs[org_id],
+                project_count=len(project_ids),
+                projects=[
+                    Project(name=table.project_names[pid], slug=table.project_slugs[pid])
+                    for pid in project_ids
+                ],
+            ))
+
+        organizations.sort(key=lambda o: o.project_count, reverse=True)
+        return organizations
+
+    def get_organization_job_counts(self) -> Dict[str, int]:
+        """
+        Count job requests per real organisation.
+
+        A job for a project with several organisations counts towards each.
+
+        Returns:
+            Mapping of organisation name to job request count (empty without a mapping)
+        """
+        table = self.load_project_organizations()
+        if table is None or not table.has_organizations:
+            return {}
+        return count_jobs_by_organization(table, self._job_counts_by_project(table))
+
     def get_organizations_from_jobs(self) -> List[Organization]:
         """
-        Extract unique projects from job data.
+        Extract organisations from job data.
 
-        Note: The event log doesn't contain organization data, only project names.
-        This returns projects as "organizations" for compatibility with the dashboard.
+        When a project→organisation mapping is available (see
+        scripts/scrape_project_organizations.py), returns real organisations
+        with their project counts. Otherwise the event log has no
+        organisation data, so projects are returned as "organizations" for
+        compatibility with the dashboard.
 
         Returns:
-            List of Organization objects (actually projects) with workspace counts
+            List of Organization objects with project (or workspace) counts
         """
-        jobs = self.load_jobs()
+        table = self.load_project_organizations()
+        if table is not None and table.has_organizations:
+            return self._aggregate_organizations(table)
 
         # Count workspaces per project (the "organization" field contains project slugs)
         project_workspaces: Dict[str, set] = {}
-        for job in jobs:
-            project_slug = job.get("organization", "")  # This is actually project slug
-            workspace = job.get("workspace", "")
-            if project_slug:
-                if project_slug not in project_workspaces:
-                    project_workspaces[project_slug] = set()
-                if workspace:
-                    project_workspaces[project_slug].add(workspace)
+        for chunk in self._scan_chunks():
+            for job in chunk:
+                project_slug = job.get("organization", "")  # This is actually project slug
+                workspace = job.get("workspace", "")
+                if project_slug:
+                    if project_slug not in project_workspaces:
+                        project_workspaces[project_slug] = set()
+                    if workspace:
+                        project_workspaces[project_slug].add(workspace)
 
         # Return as "organizations" for dashboard compatibility
         organizations = []
@@ -858,109 +1153,40 @@ class OpenSAFELYDataLoader:
         """
         Get aggregate statistics from the CSV data.
 
+        Computed in one streaming pass, so histories larger than memory
+        are supported. If the CSV cannot be read to the end, the totals
+        cover the rows read so far and ``incomplete`` is True, with the
+        reason in ``error``.
+
         Returns:
             Dictionary with various statistics
         """
-        jobs = self.load_jobs()
         metadata = self.load_metadata()
 
-        if not jobs:
-            return {
+        aggregator = JobStatsAggregator(self.load_project_organizations())
+        error = None
+        try:
+            for chunk in self._scan_chunks():
+                aggregator.update(chunk)
+        except OpenSAFELYParseError as e:
+            error = str(e)
+
+        if aggregator.total_job_requests == 0:
+            stats = {
                 "total_jobs": 0,
                 "last_updated": metadata.get("last_updated_formatted", "Never"),
                 **metadata
             }
-
-        # Count by status
-        status_counts = {}
-        for job in jobs:
-            status = job.get("status", "unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
-
-        # Count by backend
-        backend_counts = {}
-        for job in jobs:
-            backend = job.get("backend", "unknown")
-            backend_counts[backend] = backend_counts.get(backend, 0) + 1
-
-        # Count by organization
-        org_counts = {}
-        for job in jobs:
-            org = job.get("organization", "unknown")
-            org_counts[org] = org_counts.get(org, 0) + 1
-
-        # Count unique projects
-        unique_projects = set(job.get("project", "") for job in jobs if job.get("project"))
-
-        # Count unique users
-        unique_users = set(job.get("user", "") for job in jobs if job.get("user"))
-
-        # Jobs by date (last 30 days worth)
-        jobs_by_date = {}
-        for job in jobs:
-            dt = None
-            iso = job.get("started_at_iso", "")
-            if iso:
-                try:
-                    dt = datetime.fromisoformat(iso.replace("Z", "+00:00"))
-                except:
-                    pass
-            if not dt:
-                dt = self._parse_date_from_text(job.get("started_at", ""))
-            if dt:
-                date_key = dt.strftime("%Y-%m-%d")
-                jobs_by_date[date_key] = jobs_by_date.get(date_key, 0) + 1
-
-        # Calculate REQUEST-level success rate
-        succeeded_requests = status_counts.get("succeeded", 0)
-        failed_requests = status_counts.get("failed", 0)
-        completed_requests = succeeded_requests + failed_requests
-        request_success_rate = (succeeded_requests / completed_requests * 100) if completed_requests > 0 else 0
-
-        # Calculate JOB-level statistics (individual jobs within requests)
-        total_individual_jobs = 0
-        jobs_in_succeeded_requests = 0
-        jobs_in_failed_requests = 0
-        for job in jobs:
-            job_count = int(job.get("jobs_total") or 0)
-            total_individual_jobs += job_count
-            status = job.get("status", "unknown")
-            if status == "succeeded":
-                jobs_in_succeeded_requests += job_count
-            elif status == "failed":
-                jobs_in_failed_requests += job_count
-
-        job_success_rate = (jobs_in_succeeded_requests / (jobs_in_succeeded_requests + jobs_in_failed_requests) * 100) if (jobs_in_succeeded_requests + jobs_in_failed_requests) > 0 else 0
-
-        return {
-            # Request-level metrics
-            "total_job_requests": len(jobs),
-            "requests_succeeded": succeeded_requests,
-            "requests_failed": failed_requests,
-            "request_success_rate": request_success_rate,
-            # Job-level metrics (individual jobs within requests)
-            "total_individual_jobs": total_individual_jobs,
-            "jobs_in_succeeded_requests": jobs_in_succeeded_requests,
-            "jobs_in_failed_requests": jobs_in_failed_requests,
-            "job_success_rate": job_success_rate,
-            # Legacy field for compatibility
-            "total_jobs": len(jobs),
-            "success_rate": request_success_rate,
-            # Other counts
-            "total_projects": len(unique_projects),
-            "total_organizations": len(org_counts),
-            "total_users": len(unique_users),
-            "jobs_running": status_counts.get("running", 0),
-            "jobs_pending": status_counts.get("pending", 0),
-            "status_counts": status_counts,
-            "backend_counts": backend_counts,
-            "org_counts": org_counts,
-            "jobs_by_date": dict(sorted(jobs_by_date.items())[-30:]),  # Last 30 days
-            "last_updated": metadata.get("last_updated_formatted", "Unknown"),
-            "last_updated_iso": metadata.get("last_updated"),
-        }
+        else:
+            stats = aggregator.result(metadata)
+        stats["incomplete"] = error is not None
+        if error is not None:
+            stats["error"] = error
+        return stats
 
     def clear_cache(self):
         """Clear cached data."""
         self._jobs_cache = None
         self._metadata_cache = None
+        self._org_table = None
+        self._org_table_loaded = False
@@ -0,0 +1,115 @@
+"""
+Project/organisation dimension table for OpenSAFELY job history.
+
+The event log only records project slugs. The mapping produced by
+``scripts/scrape_project_organizations.py`` links each project to one or
+more organisations; this module turns that mapping into an integer-keyed
+table so job rows can be joined to organisations once at load time and
+aggregated by id rather than by repeated string lookups.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, List, Dict, Tuple, Any
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_ID = -1
+
+
+@dataclass
+class ProjectOrganizationTable:
+    """
+    Integer-keyed project → organisation dimension table.
+
+    Projects and organisations are numbered densely from zero;
+    ``project_orgs[project_id]`` holds the organisation ids for a project.
+    """
+    project_slugs: List[str] = field(default_factory=list)
+    project_names: List[str] = field(default_factory=list)
+    org_slugs: List[str] = field(default_factory=list)
+    org_names: List[str] = field(default_factory=list)
+    project_orgs: List[Tuple[int, ...]] = field(default_factory=list)
+    _project_index: Dict[str, int] = field(default_factory=dict, repr=False)
+    _org_index: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    @property
+    def project_count(self) -> int:
+        return len(self.project_slugs)
+
+    @property
+    def org_count(self) -> int:
+        return len(self.org_slugs)
+
+    @property
+    def has_organizations(self) -> bool:
+        return self.org_count > 0
+
+    def project_id(self, project_slug: str) -> int:
+        """Return the id for a project slug, or UNKNOWN_ID."""
+        return self._project_index.get(project_slug, UNKNOWN_ID)
+
+    def org_id(self, org_slug: str) -> int:
+        """Return the id for an organisation slug, or UNKNOWN_ID."""
+        return self._org_index.get(org_slug, UNKNOWN_ID)
+
+    def orgs_for_project(self, project_id: int) -> Tuple[int, ...]:
+        """Return the organisation ids for a project id."""
+        if 0 <= project_id < len(self.project_orgs):
+            return self.project_orgs[project_id]
+        return ()
+
+    def _add_project(self, slug: str, name: Optional[str] = None) -> int:
+        pid = self._project_index.get(slug)
+        if pid is None:
+            pid = len(self.project_slugs)
+            self._project_index[slug] = pid
+            self.project_slugs.append(slug)
+            self.project_names.append(name or slug.replace("-", " ").title())
+            self.project_orgs.append(())
+        return pid
+
+    def _add_org(self, slug: str, name: str) -> int:
+        oid = self._org_index.get(slug)
+        if oid is None:
+            oid = len(self.org_slugs)
+            self._org_index[slug] = oid
+            self.org_slugs.append(slug)
+            self.org_names.append(name)
+        return oid
+
+    @classmethod
+    def from_mapping(cls, mapping: Dict[str, Any]) -> "ProjectOrganizationTable":
+        """
+        Build the table from a project_organization_mapping.json payload.
+
+        Organisations are identified by slug where available, otherwise
+        by name.
+        """
+        table = cls()
+        for project_slug, entry in sorted(mapping.get("projects", {}).items()):
+            pid = table._add_project(project_slug, entry.get("project_name"))
+            org_ids = []
+            for org in entry.get("organizations", []):
+                name = (org.get("name") or "").strip()
+                if not name:
+                    continue
+                oid = table._add_org(org.get("slug") or name, name)
+                if oid not in org_ids:
+                    org_ids.append(oid)
+            table.project_orgs[pid] = tuple(org_ids)
+        return table
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["ProjectOrganizationTable"]:
+        """Load the table from a mapping file, or None if unavailable."""
+        if not Path(path).exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls.from_mapping(json.load(f))
+        except Exception as e:
+            logger.error(f"Failed to load project organisation mapping: {e}")
+            return None
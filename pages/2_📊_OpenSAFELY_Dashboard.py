@@ -376,7 +376,8 @@ if data_source == "csv":
         **Key insight:** Failed requests average **14.7 jobs** while successful requests average **5.0 jobs**.
         This means larger batch jobs are more likely to have at least one failure, which marks the entire request as failed.
 
-        *Note: The event log shows Projects and Workspaces. Organization data requires additional scraping.*
+        *Note: The event log shows Projects and Workspaces. Organization data requires additional scraping
+        (`python scripts/scrape_project_organizations.py`).*
         """)
 elif data_source == "demo":
     st.warning("""
@@ -456,10 +457,13 @@ with tab1:
     # Key metrics row
     col1, col2, col3, col4 = st.columns(4)
 
+    # Without the project→organisation mapping the CSV only knows about projects
+    projects_as_orgs = data_source == "csv" and not get_data_loader().has_organization_data
+
     with col1:
         # Label depends on data source (CSV shows projects, live shows orgs)
-        label = "Projects" if data_source == "csv" else "Organizations"
-        help_text = "Unique research projects in the event log" if data_source == "csv" else "Number of organizations using OpenSAFELY"
+        label = "Projects" if projects_as_orgs else "Organizations"
+        help_text = "Unique research projects in the event log" if projects_as_orgs else "Number of organizations using OpenSAFELY"
         st.metric(
             label=label,
             value=len(organizations),
@@ -468,8 +472,8 @@ with tab1:
 
     with col2:
         total_workspaces = sum(o.project_count for o in organizations)
-        label = "Workspaces" if data_source == "csv" else "Total Projects"
-        help_text = "Total workspaces across all projects" if data_source == "csv" else "Total research projects across all organizations"
+        label = "Workspaces" if projects_as_orgs else "Total Projects"
+        help_text = "Total workspaces across all projects" if projects_as_orgs else "Total research projects across all organizations"
         st.metric(
             label=label,
             value=total_workspaces,
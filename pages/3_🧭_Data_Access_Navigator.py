@@ -15,10 +15,15 @@ _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if _PROJECT_ROOT not in sys.path:
     sys.path.insert(0, _PROJECT_ROOT)
 
-from data_access.loader import load_all_custodians, load_governance_bodies
-from data_access.navigator import rank_pathways
+from data_access.cache import RecommendationCache
+from data_access.registry import get_registry
 from data_access.models import ResearcherProfile, PathwayRecommendation
+from data_access.planner import plan_combinations
+from data_access.reports import REPORT_FORMATS, ReportGenerator
+from data_access.sensitivity import weight_sensitivity
+from data_access.timeline import simulate_recommendation_timelines
 from data_access.visualizations import (
+    FigureCache,
     create_pathway_sankey,
     create_comparison_radar,
     create_timeline_gantt,
@@ -37,19 +42,25 @@ st.set_page_config(
 )
 
 # ---------------------------------------------------------------------------
-# Load data (cached)
+# Load data (hot-reloaded registry snapshot)
 # ---------------------------------------------------------------------------
 
-@st.cache_data
-def cached_load_custodians():
-    return load_all_custodians()
+@st.cache_resource
+def get_recommendation_cache():
+    return RecommendationCache(maxsize=256)
 
-@st.cache_data
-def cached_load_governance():
-    return load_governance_bodies()
+@st.cache_resource
+def get_figure_cache():
+    return FigureCache(maxsize=64)
 
-custodians = cached_load_custodians()
-governance_bodies = cached_load_governance()
+@st.cache_resource
+def get_report_generator():
+    return ReportGenerator(maxsize=32)
+
+# Edits to data/custodians/*.json are picked up on the next rerun
+snapshot = get_registry().snapshot()
+custodians = snapshot.custodians
+governance_bodies = snapshot.governance_bodies
 
 # ---------------------------------------------------------------------------
 # Header
@@ -141,6 +152,20 @@ TIMELINE_OPTIONS = [
     "Within 3 months", "ASAP",
 ]
 
+# Timeline estimate the speed score is based on (None = typical weeks)
+TIMELINE_BASIS_OPTIONS = {
+    "Typical timeline": None,
+    "Simulated median (P50)": 50,
+    "Simulated likely (P80)": 80,
+    "Simulated worst case (P95)": 95,
+}
+
+REPORT_FORMAT_OPTIONS = {
+    "Markdown": "markdown",
+    "HTML": "html",
+    "CSV": "csv",
+}
+
 BUDGET_OPTIONS = [
     "Free/no budget",
     "Up to GBP 5,000",
@@ -202,7 +227,17 @@ with st.form("research_profile", border=True):
             options=TIMELINE_OPTIONS,
             value="Within 12 months",
         )
+        timeline_basis = st.selectbox(
+            "Judge speed on",
+            list(TIMELINE_BASIS_OPTIONS),
+            help="Simulated percentiles draw each phase from its published min/typical/max weeks; "
+                 "P80 means 4 in 5 simulated applications finish within that time.",
+        )
         budget_range = st.selectbox("Budget for data access", BUDGET_OPTIONS)
+        study_years = st.number_input(
+            "Study duration (years)", min_value=1, max_value=10, value=3,
+            help="Used to total annual fees in the cost comparison.",
+        )
     with col_p2:
         needs_extraction = st.checkbox(
             "I need data extracted/exported (not just TRE access)",
@@ -215,6 +250,11 @@ with st.form("research_profile", border=True):
             help="If ticked, we'll include Section 251 / CAG in the governance requirements (England & Wales) "
                  "or PBPP Tier 2 (Scotland).",
         )
+        report_label = st.selectbox(
+            "Downloadable report format",
+            list(REPORT_FORMAT_OPTIONS),
+            help="Only this format is generated for the download button below the results.",
+        )
 
     submitted = st.form_submit_button("Find My Pathways", type="primary", use_container_width=True)
 
@@ -245,12 +285,23 @@ if submitted:
     )
 
     # --- Run the scoring engine ---
-    recommendations = rank_pathways(profile, custodians, governance_bodies)
+    recommendations = get_recommendation_cache().rank(
+        profile, custodians, governance_bodies, version=snapshot.version,
+        timeline_percentile=TIMELINE_BASIS_OPTIONS[timeline_basis],
+    )
 
     # Store in session for AI advisory and cross-page use
     st.session_state["navigator_results"] = recommendations
     st.session_state["navigator_profile"] = profile
 
+    # Only the chosen report format is rendered, in the report worker while
+    # the rest of the page is built; the export section collects the result
+    report_format = REPORT_FORMAT_OPTIONS[report_label]
+    report_future = get_report_generator().submit(profile, recommendations, report_format)
+
+    # Figures are served from cached JSON while the recommendation set is unchanged
+    figures = get_figure_cache()
+
     # --- Metrics ---
     st.divider()
     top = recommendations[0] if recommendations else None
@@ -297,7 +348,68 @@ if submitted:
     # --- Tab: All Recommendations ---
     with tab_recs:
         # Score overview chart
-        st.plotly_chart(create_score_overview(recommendations), use_container_width=True)
+        st.plotly_chart(figures.figure(create_score_overview, recommendations), use_container_width=True)
+
+        # How robust is the ranking to the scoring weights?
+        sensitivity = weight_sensitivity(recommendations)
+        if sensitivity.pathways:
+            with st.expander(
+                f"Ranking stability: {top.custodian.short_name} stays top in "
+                f"{sensitivity.top_choice_stability:.0%} of {sensitivity.samples:,} weightings"
+            ):
+                st.caption(
+                    "Scoring weights are randomly perturbed around their defaults and the "
+                    "pathways re-ranked. A tipping point is the weight (others rescaled) at "
+                    "which a pathway would overtake the current top match."
+                )
+                import pandas as pd
+                st.dataframe(
+                    pd.DataFrame([
+                        {
+                            "Custodian": s.custodian.short_name,
+                            "Rank": s.base_rank,
+                            "Rank range": f"{s.best_rank}-{s.worst_rank}",
+                            "Top share": f"{s.top_share:.0%}",
+                            f"Top {sensitivity.top_k} share": f"{s.top_k_share:.0%}",
+                            "Tipping points": ", ".join(
+                                f"{dim.replace('_', ' ')} {weight:.2f}"
+                                for dim, weight in s.tipping_points.items()
+                                if weight is not None
+                            ) or "—",
+                        }
+                        for s in sensitivity.pathways[:8]
+                    ]),
+                    use_container_width=True,
+                    hide_index=True,
+                )
+
+        # Multi-custodian combinations, when no single pathway covers everything
+        plans = plan_combinations(profile, custodians, governance_bodies)
+        if plans and len(plans[0].custodians) > 1:
+            st.markdown("#### Combined Pathways")
+            st.caption(
+                "No single custodian covers all your data types in all your regions. These combinations "
+                "cover the most within your budget and timeline, applying to each in parallel."
+            )
+            for plan in plans:
+                names = " + ".join(c.short_name for c in plan.custodians)
+                fee = f"from £{plan.min_fee:,}" if plan.min_fee else "no listed fees"
+                with st.expander(
+                    f"{names} — {plan.coverage:.0%} coverage | ~{plan.estimated_weeks} weeks | {fee}"
+                ):
+                    gaps = plan.missing_data_types + plan.missing_regions + [
+                        f"{data_type} in {region}"
+                        for data_type, region in plan.missing_pairs
+                        if data_type not in plan.missing_data_types and region not in plan.missing_regions
+                    ]
+                    if gaps:
+                        st.markdown("**Not covered:** " + ", ".join(gaps))
+                    if plan.governance:
+                        st.markdown(
+                            "**Governance:** " + ", ".join(g.short_name for g in plan.governance)
+                        )
+                    if plan.unpriced:
+                        st.caption(f"Fees to confirm with: {', '.join(plan.unpriced)}")
 
         for idx, rec in enumerate(recommendations):
             score_emoji = "🟢" if rec.overall_score > 70 else ("🟡" if rec.overall_score > 40 else "🔴")
@@ -381,7 +493,7 @@ if submitted:
     with tab_visual:
         st.markdown("#### Pathway Flow")
         st.plotly_chart(
-            create_pathway_sankey(recommendations, data_needs),
+            figures.figure(create_pathway_sankey, recommendations, data_needs),
             use_container_width=True,
         )
 
@@ -396,7 +508,7 @@ if submitted:
         )
         if len(selected) >= 2:
             compare_recs = [r for r in recommendations if r.custodian.short_name in selected]
-            st.plotly_chart(create_comparison_radar(compare_recs), use_container_width=True)
+            st.plotly_chart(figures.figure(create_comparison_radar, compare_recs), use_container_width=True)
 
             # Comparison table
             st.markdown("#### Side-by-Side Comparison")
@@ -424,10 +536,40 @@ if submitted:
 
     # --- Tab: Timeline ---
     with tab_timeline:
-        st.plotly_chart(create_timeline_gantt(recommendations), use_container_width=True)
+        st.plotly_chart(figures.figure(create_timeline_gantt, recommendations), use_container_width=True)
+
+        # Monte Carlo completion times over each phase's min/typical/max range
+        top_recs = recommendations[:5]
+        if top_recs:
+            import pandas as pd
+            # Ranking by a simulated percentile already attached them
+            if all(rec.timeline_percentiles for rec in top_recs):
+                summaries = [rec.timeline_percentiles for rec in top_recs]
+            else:
+                simulated = simulate_recommendation_timelines(top_recs)
+                summaries = [simulated.summary(i) for i in range(len(top_recs))]
+            st.markdown("#### Simulated Completion Time")
+            st.caption(
+                "Percentiles of simulated pathways. "
+                "P80 means 4 in 5 simulated applications finish within that many weeks."
+            )
+            st.dataframe(
+                pd.DataFrame([
+                    {
+                        "Custodian": rec.custodian.short_name,
+                        "Typical (weeks)": rec.estimated_total_weeks,
+                        "P50": summary["p50"],
+                        "P80": summary["p80"],
+                        "P95": summary["p95"],
+                    }
+                    for rec, summary in zip(top_recs, summaries)
+                ]),
+                use_container_width=True,
+                hide_index=True,
+            )
 
         st.markdown("#### Detailed Timeline Breakdown")
-        for rec in recommendations[:5]:
+        for rec in top_recs:
             with st.expander(f"{rec.custodian.short_name} — ~{rec.estimated_total_weeks} weeks total"):
                 for phase in rec.custodian.timeline:
                     st.markdown(
@@ -443,7 +585,10 @@ if submitted:
 
     # --- Tab: Costs ---
     with tab_costs:
-        st.plotly_chart(create_cost_comparison(recommendations), use_container_width=True)
+        st.plotly_chart(
+            figures.figure(create_cost_comparison, recommendations, study_years, profile.researcher_type),
+            use_container_width=True,
+        )
 
         st.markdown("#### Cost Details")
         for rec in recommendations[:5]:
@@ -577,37 +722,13 @@ if submitted:
 
     # === Export ===
     st.divider()
-    export_lines = [
-        "# UK Health Data Access Navigator — Recommendations Report",
-        f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-        f"\n## Research Profile",
-        f"- **Researcher type:** {researcher_type}",
-        f"- **Institution country:** {institution_country}",
-        f"- **Study design:** {study_type}",
-        f"- **Data needs:** {', '.join(data_needs)}",
-        f"- **Geographic scope:** {', '.join(geographic_scope)}",
-        f"- **Timeline priority:** {timeline_priority}",
-        f"- **Budget:** {budget_range}",
-        f"\n## Ranked Recommendations\n",
-    ]
-    for idx, rec in enumerate(recommendations, 1):
-        export_lines.append(f"### {idx}. {rec.custodian.name} — {rec.overall_score:.0f}% match")
-        export_lines.append(f"- **Timeline:** ~{rec.estimated_total_weeks} weeks")
-        export_lines.append(f"- **Cost:** {rec.estimated_cost_range}")
-        export_lines.append(f"- **Access model:** {rec.custodian.access_model}")
-        export_lines.append(f"- **Website:** {rec.custodian.url}")
-        if rec.match_reasons:
-            export_lines.append("- **Why recommended:** " + "; ".join(rec.match_reasons[:3]))
-        if rec.concerns:
-            export_lines.append("- **Considerations:** " + "; ".join(rec.concerns[:3]))
-        export_lines.append("")
-
-    export_md = "\n".join(export_lines)
+    ext, mime = REPORT_FORMATS[report_format]
     st.download_button(
-        "Download Recommendations Report",
-        data=export_md,
-        file_name=f"data_access_recommendations_{datetime.now().strftime('%Y%m%d')}.md",
-        mime="text/markdown",
+        f"Download Report ({report_label})",
+        data=report_future.result().encode("utf-8"),
+        file_name=f"data_access_recommendations_{datetime.now().strftime('%Y%m%d')}.{ext}",
+        mime=mime,
+        use_container_width=True,
     )
 
 # ---------------------------------------------------------------------------
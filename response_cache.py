@@ -0,0 +1,215 @@
+"""Persistent response cache for the chat assistant.
+
+Completed answers are stored in a SQLite database shared by every session
+of the app, keyed on the model, temperature, a hash of the system messages
+and the normalised conversation actually sent. A starter question asked in
+one browser is therefore answered instantly in every other, while the same
+question later in a different conversation is not.
+
+Entries expire after ``ttl`` seconds, the least recently used are evicted
+beyond ``max_entries``, and lookups are counted so the hit rate survives
+restarts. Database errors are logged and treated as misses: the cache never
+breaks a chat.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = Path(".cache") / "responses.sqlite3"
+DEFAULT_TTL = 7 * 24 * 3600     # seconds
+DEFAULT_MAX_ENTRIES = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def _normalise(text: str) -> str:
+    return " ".join(text.split())
+
+
+def conversation_key(messages: Sequence[Dict[str, str]], model: str, temperature: float) -> str:
+    """Cache key for one API call.
+
+    System messages (prompt, Navigator summary, trimmed-history summary)
+    are hashed together; user and assistant turns are compared with
+    whitespace collapsed, and user turns case-insensitively.
+    """
+    system = hashlib.sha256(
+        "\0".join(m["content"] for m in messages if m["role"] == "system").encode("utf-8")
+    ).hexdigest()
+    turns = [
+        [m["role"], _normalise(m["content"]).casefold() if m["role"] == "user" else _normalise(m["content"])]
+        for m in messages if m["role"] != "system"
+    ]
+    payload = json.dumps(
+        {"model": model, "temperature": round(float(temperature), 2), "system": system, "turns": turns},
+        ensure_ascii=False, separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL, LRU eviction and hit-rate counters.
+
+    Safe to share between threads; each instance holds one connection.
+
+    Example:
+        >>> cache = ResponseCache(Path(".cache/responses.sqlite3"))
+        >>> key = conversation_key(messages, "gpt-4o", 0.3)
+        >>> cache.get(key) or cache.put(key, "gpt-4o", answer)
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = DEFAULT_PATH,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file; None keeps the cache in memory for this process
+            ttl: Seconds before an entry expires
+            max_entries: Entries kept before least-recently-used eviction
+        """
+        self.path = Path(path) if path else None
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            if self.path:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path) if self.path else ":memory:", check_same_thread=False)
+            if self.path:
+                conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Response cache unavailable at {self.path}: {e}")
+
+    def _count(self, name: str):
+        self._conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,),
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key``, or None if missing or expired."""
+        if self._conn is None:
+            return None
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT response, created FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and now - row[1] > self.ttl:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    row = None
+                if row is None:
+                    self.misses += 1
+                    self._count("misses")
+                    return None
+                self._conn.execute(
+                    "UPDATE responses SET last_used = ?, hits = hits + 1 WHERE key = ?", (now, key)
+                )
+                self.hits += 1
+                self._count("hits")
+                return row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+
+    def put(self, key: str, model: str, response: str) -> str:
+        """Store a response, expiring and evicting old entries; returns ``response``."""
+        if self._conn is None:
+            return response
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, model, response, created, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, model, response, now, now),
+                )
+                self._conn.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {e}")
+        return response
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        if self._conn is None:
+            return
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("DELETE FROM counters")
+        self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and hit rates, for this process and across restarts."""
+        session_total = self.hits + self.misses
+        stats: Dict[str, Any] = {
+            "entries": 0,
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / session_total if session_total else 0.0,
+            "lifetime_hits": 0,
+            "lifetime_misses": 0,
+            "lifetime_hit_rate": 0.0,
+        }
+        if self._conn is None:
+            return stats
+        try:
+            with self._lock:
+                stats["entries"] = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+                counters = dict(self._conn.execute("SELECT name, value FROM counters").fetchall())
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache stats failed: {e}")
+            return stats
+        hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+        stats.update(
+            lifetime_hits=hits,
+            lifetime_misses=misses,
+            lifetime_hit_rate=hits / (hits + misses) if hits + misses else 0.0,
+        )
+        return stats
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -12,6 +12,7 @@ Output:
     sail_data_use_register.csv - Complete data use register with project details
 """
 
+import csv
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
@@ -47,6 +48,34 @@ HEADERS = {
 
 BASE_URL = "https://saildatabank.com"
 REGISTER_URL = f"{BASE_URL}/data/data-use-register/"
+OUTPUT_FILE = 'sail_data_use_register.csv'
+
+# Labels looked for on project pages, and the column each maps to
+DETAIL_FIELD_PATTERNS = [
+    ('Lead Organisation', 'lead_organisation'),
+    ('Lead Applicant', 'lead_applicant'),
+    ('Principal Investigator', 'principal_investigator'),
+    ('Start Date', 'start_date'),
+    ('End Date', 'end_date'),
+    ('Status', 'status'),
+    ('Project Status', 'project_status'),
+    ('Datasets', 'datasets'),
+    ('Data Sources', 'data_sources'),
+    ('Research Summary', 'research_summary'),
+    ('Lay Summary', 'lay_summary'),
+    ('Public Benefit', 'public_benefit'),
+    ('Approval Date', 'approval_date'),
+    ('Project ID', 'project_id'),
+    ('IGRP', 'igrp_number'),
+]
+
+# Every column get_project_details can add to a project
+DETAIL_FIELDS = ['project_url', 'full_title'] + [key for _, key in DETAIL_FIELD_PATTERNS]
+
+
+def project_link(project):
+    """Return the detail-page URL for a register row, if any."""
+    return project.get('project_link') or project.get('title_link')
 
 
 class SAILScraper:
@@ -197,23 +226,7 @@ class SAILScraper:
             details['full_title'] = title.get_text(strip=True)
 
         # Look for common field patterns
-        field_patterns = [
-            ('Lead Organisation', 'lead_organisation'),
-            ('Lead Applicant', 'lead_applicant'),
-            ('Principal Investigator', 'principal_investigator'),
-            ('Start Date', 'start_date'),
-            ('End Date', 'end_date'),
-            ('Status', 'status'),
-            ('Project Status', 'project_status'),
-            ('Datasets', 'datasets'),
-            ('Data Sources', 'data_sources'),
-            ('Research Summary', 'research_summary'),
-            ('Lay Summary', 'lay_summary'),
-            ('Public Benefit', 'public_benefit'),
-            ('Approval Date', 'approval_date'),
-            ('Project ID', 'project_id'),
-            ('IGRP', 'igrp_number'),
-        ]
+        field_patterns = DETAIL_FIELD_PATTERNS
 
         # Method 1: Definition lists
         for dl in soup.find_all('dl'):
@@ -263,8 +276,25 @@ class SAILScraper:
 
         return details
 
-    def scrape_register(self, include_details=True, max_workers=5):
-        """Main scraping function."""
+    def output_fieldnames(self):
+        """CSV columns: register columns in first-seen order, then detail fields."""
+        fieldnames = {}
+        for proj in self.projects:
+            for key in proj:
+                fieldnames.setdefault(key, None)
+        for key in DETAIL_FIELDS:
+            fieldnames.setdefault(key, None)
+        return list(fieldnames)
+
+    def scrape_register(self, include_details=True, max_workers=5, stream_to=None):
+        """
+        Main scraping function.
+
+        Args:
+            include_details: Fetch each project's detail page
+            max_workers: Concurrent detail-page requests
+            stream_to: Optional CSV path; rows are written as their details complete
+        """
         logger.info("Starting SAIL Databank Data Use Register scraping...")
         logger.info(f"Target URL: {REGISTER_URL}")
 
@@ -289,39 +319,55 @@ class SAILScraper:
             logger.warning("No projects found. Please check sail_register_raw.html for page structure.")
             return pd.DataFrame()
 
-        # Get detailed info for each project
-        if include_details:
-            project_urls = [p.get('project_link') or p.get('title_link') for p in self.projects]
-            project_urls = [url for url in project_urls if url]
-
-            if project_urls:
-                logger.info(f"Fetching details for {len(project_urls)} projects...")
+        writer = None
+        stream_file = None
+        if stream_to:
+            stream_file = open(stream_to, 'w', newline='', encoding='utf-8-sig')
+            writer = csv.DictWriter(stream_file, fieldnames=self.output_fieldnames(), extrasaction='ignore')
+            writer.writeheader()
+
+        try:
+            # Index projects by detail URL so each result merges in O(1)
+            url_to_project = {}
+            for proj in self.projects:
+                url = project_link(proj) if include_details else None
+                if url and url not in url_to_project:
+                    url_to_project[url] = proj
+                elif writer:
+                    writer.writerow(proj)
+
+            # Get detailed info for each project
+            if url_to_project:
+                logger.info(f"Fetching details for {len(url_to_project)} projects...")
 
                 with ThreadPoolExecutor(max_workers=max_workers) as executor:
                     future_to_url = {executor.submit(self.get_project_details, url): url
-                                     for url in project_urls}
+                                     for url in url_to_project}
 
                     for i, future in enumerate(as_completed(future_to_url)):
                         url = future_to_url[future]
+                        proj = url_to_project[url]
                         try:
-                            details = future.result()
-                            # Find the project and update it
-                            for proj in self.projects:
-                                proj_url = proj.get('project_link') or proj.get('title_link')
-                                if proj_url == url:
-                                    proj.update(details)
-                                    break
+                            proj.update(future.result())
                         except Exception as e:
                             logger.warning(f"Error getting details for {url}: {e}")
 
+                        if writer:
+                            writer.writerow(proj)
+                            stream_file.flush()
+
                         if (i + 1) % 10 == 0:
-                            logger.info(f"Progress: {i + 1}/{len(project_urls)} projects")
+                            logger.info(f"Progress: {i + 1}/{len(url_to_project)} projects")
+        finally:
+            if stream_file:
+                stream_file.close()
+                logger.info(f"Streamed {len(self.projects)} records to {stream_to}")
 
         # Create DataFrame
         df = pd.DataFrame(self.projects)
         return df
 
-    def save_to_csv(self, df, filename='sail_data_use_register.csv'):
+    def save_to_csv(self, df, filename=OUTPUT_FILE):
         """Save DataFrame to CSV."""
         if df.empty:
             logger.warning("No data to save")
@@ -422,8 +468,9 @@ def main():
 
     scraper = SAILScraper()
 
-    # Try standard requests first
-    df = scraper.scrape_register(include_details=True)
+    # Try standard requests first (rows are written to the CSV as they complete)
+    df = scraper.scrape_register(include_details=True, stream_to=OUTPUT_FILE)
+    streamed = not df.empty
 
     # If no data found, try with Selenium or Playwright
     if df.empty:
@@ -452,9 +499,10 @@ def main():
         print("\nFirst 5 records:")
         print(df.head().to_string())
 
-        # Save to CSV
-        scraper.save_to_csv(df)
-        print(f"\nData saved to: sail_data_use_register.csv")
+        # Save to CSV (already written incrementally by the standard scraper)
+        if not streamed:
+            scraper.save_to_csv(df)
+        print(f"\nData saved to: {OUTPUT_FILE}")
     else:
         print("\nNo data could be extracted.")
         print("Please check sail_register_raw.html for the page structure.")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Compile the custodian and governance catalogue into one snapshot file.
+
+Validates data/custodians/*.json against data/custodian_schema.json and
+writes data/catalogue.snapshot.pickle, which the data_access loader reads
+in one go instead of parsing every JSON file. The loader ignores the
+snapshot as soon as any source file changes, so rebuilding is only needed
+to get the faster startup back.
+
+Usage:
+    python scripts/build_catalogue_snapshot.py
+    python scripts/build_catalogue_snapshot.py --output /tmp/catalogue.pickle
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_access.snapshot import SNAPSHOT_FILE, build_snapshot, jsonschema
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compile the catalogue snapshot")
+    parser.add_argument("--output", type=Path, default=SNAPSHOT_FILE, help="Snapshot file to write")
+    args = parser.parse_args()
+
+    if jsonschema is None:
+        print("jsonschema not installed; using the built-in schema subset validator")
+
+    snapshot, errors = build_snapshot(args.output)
+
+    for source, problems in errors.items():
+        print(f"INVALID {source}:")
+        for problem in problems:
+            print(f"  - {problem}")
+
+    print(
+        f"Wrote {args.output} with {len(snapshot.custodian_files)} custodians and "
+        f"{len(snapshot.governance_bodies)} governance bodies (hash {snapshot.source_hash[:12]})"
+    )
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,21 +5,31 @@ Scrape organization information for each OpenSAFELY project.
 The event log doesn't include organization names, only project slugs.
 This script visits each project page to extract the organization(s).
 
+Only projects missing from the existing mapping (or whose entry errored or
+is older than --max-age-days) are scraped, concurrently and rate-limited,
+and the results are merged into the existing file with periodic checkpoints.
+
 Usage:
     python scripts/scrape_project_organizations.py
+    python scripts/scrape_project_organizations.py --workers 8 --rate 4
+    python scripts/scrape_project_organizations.py --full
 
 Output:
     data/project_organization_mapping.json
 """
 
+import argparse
 import csv
 import json
 import logging
+import os
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set
 
 import requests
@@ -164,59 +174,184 @@ def scrape_project_organization(session: requests.Session, project_slug: str) ->
         }
 
 
-def main():
-    """Main scraping function."""
-    logger.info("Starting project organization scraper")
+class RateLimiter:
+    """Spaces out requests across worker threads to a fixed rate."""
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+_thread_local = threading.local()
+
+
+def get_session() -> requests.Session:
+    """Return a per-thread session (sessions are not safe to share across threads)."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update({
+            "User-Agent": USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        })
+        _thread_local.session = session
+    return session
+
+
+def load_existing_mapping(path: Path = OUTPUT_PATH) -> Dict:
+    """Load a previously saved mapping, or an empty one."""
+    if path.exists():
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                mapping = json.load(f)
+            mapping.setdefault("metadata", {})
+            mapping.setdefault("projects", {})
+            return mapping
+        except Exception as e:
+            logger.warning(f"Could not read existing mapping {path}: {e}")
+    return {"metadata": {}, "projects": {}}
+
+
+def is_stale(entry: Optional[Dict], max_age_days: float) -> bool:
+    """True if a mapping entry is missing, errored, or older than max_age_days."""
+    if not entry or entry.get("error"):
+        return True
+    scraped_at = entry.get("scraped_at")
+    if not scraped_at:
+        return True
+    try:
+        age = datetime.utcnow() - datetime.fromisoformat(scraped_at)
+    except ValueError:
+        return True
+    return age > timedelta(days=max_age_days)
+
+
+def select_projects_to_scrape(projects: Set[str], mapping: Dict, max_age_days: float,
+                              full: bool = False) -> List[str]:
+    """Return the project slugs that are missing from or stale in the mapping."""
+    if full:
+        return sorted(projects)
+    existing = mapping.get("projects", {})
+    return sorted(p for p in projects if is_stale(existing.get(p), max_age_days))
+
+
+def merge_result(existing: Optional[Dict], result: Dict) -> Dict:
+    """Merge a fresh scrape into the existing entry for the same project.
+
+    A failed re-scrape never discards organisations found earlier: the old
+    entry is kept and only the error and attempt time are recorded, so the
+    project is retried on the next run.
+    """
+    if result.get("error") and existing and existing.get("organizations"):
+        merged = {k: v for k, v in existing.items() if k not in ("error", "error_at")}
+        merged["error"] = result["error"]
+        merged["error_at"] = result.get("scraped_at")
+        return merged
+    return result
+
+
+def update_metadata(mapping: Dict, total_projects: int):
+    """Recompute summary counts on the mapping."""
+    with_orgs = sum(1 for p in mapping["projects"].values() if p.get("organizations"))
+    mapping["metadata"].update({
+        "scraped_at": datetime.utcnow().isoformat(),
+        "total_projects": total_projects,
+        "source": "jobs.opensafely.org project pages",
+        "projects_with_organizations": with_orgs,
+        "projects_without_organizations": len(mapping["projects"]) - with_orgs,
+    })
 
-    # Get unique projects
-    projects = get_unique_projects()
-    if not projects:
-        logger.error("No projects found to scrape")
-        return
 
-    # Setup session
-    session = requests.Session()
-    session.headers.update({
-        "User-Agent": USER_AGENT,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    })
+def save_mapping(mapping: Dict, path: Path = OUTPUT_PATH):
+    """Write the mapping atomically so an interrupted run never truncates it."""
+    path.parent.mkdir(exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(mapping, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
 
-    # Scrape each project
-    mapping = {
-        "metadata": {
-            "scraped_at": datetime.utcnow().isoformat(),
-            "total_projects": len(projects),
-            "source": "jobs.opensafely.org project pages",
-        },
-        "projects": {}
-    }
 
-    for i, project_slug in enumerate(sorted(projects), 1):
-        logger.info(f"Scraping {i}/{len(projects)}: {project_slug}")
+def scrape_projects(slugs: List[str], mapping: Dict, workers: int, rate: float,
+                    checkpoint_every: int, total_projects: int, output_path: Path = OUTPUT_PATH):
+    """Scrape slugs concurrently, merging results into mapping as they complete."""
+    limiter = RateLimiter(rate)
 
-        result = scrape_project_organization(session, project_slug)
-        mapping["projects"][project_slug] = result
+    def task(project_slug: str) -> Dict:
+        limiter.wait()
+        return scrape_project_organization(get_session(), project_slug)
 
-        # Rate limiting - be nice to the server
-        if i < len(projects):
-            time.sleep(0.5)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(task, slug): slug for slug in slugs}
+        for i, future in enumerate(as_completed(futures), 1):
+            slug = futures[future]
+            try:
+                mapping["projects"][slug] = merge_result(mapping["projects"].get(slug), future.result())
+            except Exception as e:
+                logger.error(f"Unexpected error scraping {slug}: {e}")
 
-        # Progress update every 20 projects
-        if i % 20 == 0:
-            logger.info(f"Progress: {i}/{len(projects)} projects scraped")
+            if i % 20 == 0 or i == len(slugs):
+                logger.info(f"Progress: {i}/{len(slugs)} projects scraped")
 
-    # Count results
-    with_orgs = sum(1 for p in mapping["projects"].values() if p.get("organizations"))
-    mapping["metadata"]["projects_with_organizations"] = with_orgs
-    mapping["metadata"]["projects_without_organizations"] = len(projects) - with_orgs
+            if checkpoint_every and i % checkpoint_every == 0 and i < len(slugs):
+                update_metadata(mapping, total_projects)
+                save_mapping(mapping, output_path)
+                logger.info(f"Checkpoint saved ({i}/{len(slugs)})")
 
-    # Save output
-    DATA_DIR.mkdir(exist_ok=True)
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(mapping, f, indent=2, ensure_ascii=False)
 
+def main():
+    """Main scraping function."""
+    parser = argparse.ArgumentParser(description="Map OpenSAFELY projects to organisations")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent requests (default: 4)")
+    parser.add_argument("--rate", type=float, default=2.0,
+                        help="Maximum requests per second across all workers (default: 2)")
+    parser.add_argument("--max-age-days", type=float, default=30,
+                        help="Re-scrape entries older than this many days (default: 30)")
+    parser.add_argument("--checkpoint-every", type=int, default=25,
+                        help="Save progress after this many projects (default: 25, 0 to disable)")
+    parser.add_argument("--full", action="store_true", help="Re-scrape every project, ignoring the existing mapping")
+    args = parser.parse_args()
+
+    logger.info("Starting project organization scraper")
+
+    # Get unique projects
+    projects = get_unique_projects()
+    if not projects:
+        logger.error("No projects found to scrape")
+        return
+
+    mapping = load_existing_mapping()
+    to_scrape = select_projects_to_scrape(projects, mapping, args.max_age_days, full=args.full)
+    logger.info(
+        f"{len(to_scrape)} of {len(projects)} projects need scraping "
+        f"({len(mapping['projects'])} already mapped)"
+    )
+
+    if to_scrape:
+        scrape_projects(
+            to_scrape,
+            mapping,
+            workers=max(1, args.workers),
+            rate=args.rate,
+            checkpoint_every=args.checkpoint_every,
+            total_projects=len(projects),
+        )
+
+    update_metadata(mapping, len(projects))
+    save_mapping(mapping)
+
+    with_orgs = mapping["metadata"]["projects_with_organizations"]
     logger.info(f"Saved mapping to {OUTPUT_PATH}")
-    logger.info(f"Projects with organizations: {with_orgs}/{len(projects)}")
+    logger.info(f"Projects with organizations: {with_orgs}/{len(mapping['projects'])}")
 
     # Print summary of unique organizations found
     all_orgs = set()
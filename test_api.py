@@ -0,0 +1,118 @@
+"""Smoke test for the headless recommender API (data_access/api.py)."""
+import sys
+sys.path.insert(0, ".")
+
+import asyncio
+import json
+
+from data_access.api import RecommenderAPI
+
+api = RecommenderAPI()
+
+
+async def call(method, path, body=None, query=b""):
+    payload = b"" if body is None else (body if isinstance(body, bytes) else json.dumps(body).encode())
+    response = {}
+
+    async def receive():
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+        else:
+            response["body"] = json.loads(message["body"])
+
+    await api({"type": "http", "method": method, "path": path, "query_string": query}, receive, send)
+    return response["status"], response["body"]
+
+
+def request(*args, **kwargs):
+    return asyncio.run(call(*args, **kwargs))
+
+
+PROFILE = {
+    "researcher_type": "Academic researcher",
+    "data_needs": ["Primary care (GP records)", "Hospital episodes (HES/inpatient)"],
+    "geographic_scope": ["England"],
+    "study_type": "Observational/epidemiological",
+    "timeline_priority": "Within 6 months",
+    "budget_range": "Free/no budget",
+}
+
+# --- Catalogue ---
+print("=== Catalogue endpoints ===")
+status, health = request("GET", "/health")
+assert status == 200 and health["custodians"] > 0, health
+status, custodians = request("GET", "/custodians")
+assert status == 200 and len(custodians) == health["custodians"]
+status, one = request("GET", f"/custodians/{custodians[0]['id']}")
+assert status == 200 and one["id"] == custodians[0]["id"]
+assert request("GET", "/custodians/no-such-custodian")[0] == 404
+status, welsh = request("GET", "/custodians", query=b"region=Wales")
+assert status == 200 and 0 < len(welsh) <= len(custodians)
+assert request("GET", "/governance")[0] == 200
+assert request("GET", "/nowhere")[0] == 404
+assert request("GET", "/rank")[0] == 405
+print(f"  {len(custodians)} custodians, {len(welsh)} in Wales")
+
+# --- Ranking ---
+print("\n=== POST /rank ===")
+status, ranked = request("POST", "/rank", {"profile": PROFILE, "top_k": 3})
+assert status == 200 and ranked["count"] == 3, ranked
+assert all("match_reasons" in r for r in ranked["recommendations"])
+status, terse = request("POST", "/rank", {"profile": PROFILE, "top_k": 3, "explain": False})
+assert status == 200 and all("match_reasons" not in r for r in terse["recommendations"])
+assert [r["custodian_id"] for r in terse["recommendations"]] == [r["custodian_id"] for r in ranked["recommendations"]]
+print("  top 3:", [r["custodian_id"] for r in ranked["recommendations"]])
+
+
+async def concurrent():
+    body = {"profile": {**PROFILE, "budget_range": "Under £5,000"}, "top_k": 2}
+    return await asyncio.gather(*[call("POST", "/rank", body) for _ in range(5)])
+
+misses = api.recommendations.misses
+results = asyncio.run(concurrent())
+assert len({json.dumps(r) for r in results}) == 1
+assert api.recommendations.misses == misses + 1, "identical in-flight requests should share one ranking"
+
+# A new registry version drops the responses cached for the old one
+assert request("GET", "/health")[1]["responses_cached"] == 3
+api.registry.refresh(force=True)
+status, reranked = request("POST", "/rank", {"profile": PROFILE, "top_k": 3})
+assert status == 200 and reranked["version"] == ranked["version"] + 1
+assert reranked["recommendations"] == ranked["recommendations"]
+assert request("GET", "/health")[1]["responses_cached"] == 1
+
+# --- Validation errors ---
+print("\n=== 400 paths ===")
+bad_requests = {
+    "invalid JSON": b"{",
+    "non-object body": b"[]",
+    "missing fields": {"profile": {"researcher_type": "Academic researcher"}},
+    "unknown field": {"profile": {**PROFILE, "bogus": 1}},
+    "list study_type": {"profile": {**PROFILE, "study_type": ["Observational/epidemiological"]}},
+    "null researcher_type": {"profile": {**PROFILE, "researcher_type": None}},
+    "numeric budget_range": {"profile": {**PROFILE, "budget_range": 5000}},
+    "string data_needs": {"profile": {**PROFILE, "data_needs": "Primary care (GP records)"}},
+    "string boolean flag": {"profile": {**PROFILE, "needs_section_251": "false"}},
+    "integer boolean flag": {"profile": {**PROFILE, "needs_repeat_access": 1}},
+    "string explain": {"profile": PROFILE, "explain": "false"},
+    "string top_k": {"profile": PROFILE, "top_k": "3"},
+    "fractional top_k": {"profile": PROFILE, "top_k": 2.5},
+    "boolean min_score": {"profile": PROFILE, "min_score": True},
+    "percentile out of range": {"profile": PROFILE, "timeline_percentile": 100},
+    "infinite top_k": {"profile": PROFILE, "top_k": float("inf")},
+    "NaN min_score": {"profile": PROFILE, "min_score": float("nan")},
+    "negative infinite percentile": {"profile": PROFILE, "timeline_percentile": float("-inf")},
+}
+for label, body in bad_requests.items():
+    status, error = request("POST", "/rank", body)
+    assert status == 400, (label, status, error)
+    assert "error" in error
+    print(f"  {label}: {error['error']}")
+
+status, _ = request("POST", "/rank", {"profile": {**PROFILE, "needs_section_251": True}, "explain": False})
+assert status == 200
+
+print("\nAll tests passed!")
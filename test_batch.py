@@ -0,0 +1,77 @@
+"""Smoke test for batch ranking of many profiles (data_access/navigator.py)."""
+import sys
+sys.path.insert(0, ".")
+
+import random
+
+from data_access.features import compile_features
+from data_access.loader import load_all_custodians, load_governance_bodies
+from data_access.models import ResearcherProfile
+from data_access.navigator import (
+    _BUDGET_MAP,
+    _URGENCY_MAP,
+    governance_resolver,
+    rank_pathways,
+    rank_pathways_batch,
+)
+
+custodians = load_all_custodians()
+governance = load_governance_bodies()
+data_types = sorted({t for c in custodians for t in c.data_types})
+regions = ["England", "Wales", "Scotland", "Northern Ireland"]
+rng = random.Random(7)
+
+profiles = [
+    ResearcherProfile(
+        researcher_type=rng.choice(["Academic researcher", "NHS analyst", "Industry (pharma/biotech)"]),
+        institution_country="England",
+        ethics_status="Approved",
+        funding_status="Funded (grant)",
+        data_needs=rng.sample(data_types, rng.randint(1, 4)),
+        geographic_scope=rng.sample(regions, rng.randint(1, 3)),
+        population_size="100,000-1M",
+        study_type=rng.choice(["Observational/epidemiological", "Clinical trial", "AI/ML development"]),
+        timeline_priority=rng.choice(list(_URGENCY_MAP)),
+        budget_range=rng.choice(list(_BUDGET_MAP)),
+        needs_data_extraction=rng.random() < 0.3,
+        needs_section_251=rng.random() < 0.5,
+    )
+    for _ in range(40)
+]
+
+
+def summary(recs):
+    return [
+        (r.custodian.id, r.overall_score, r.dimension_scores, r.estimated_total_weeks,
+         [g.id for g in r.required_governance], r.timeline_percentiles, r.match_reasons, r.concerns)
+        for r in recs
+    ]
+
+
+# --- Batch matches one profile at a time ---
+print("=== rank_pathways_batch matches rank_pathways ===")
+single = [summary(rank_pathways(p, custodians, governance)) for p in profiles]
+batch = rank_pathways_batch(profiles, custodians, governance)
+assert len(batch) == len(profiles)
+assert [summary(recs) for recs in batch] == single
+
+features = compile_features(custodians)
+resolver = governance_resolver(governance)
+assert [summary(recs) for recs in rank_pathways_batch(profiles, features, resolver)] == single
+for kwargs in (dict(top_k=3), dict(min_score=60), dict(top_k=5, min_score=40), dict(timeline_percentile=80)):
+    expected = [summary(rank_pathways(p, custodians, governance, **kwargs)) for p in profiles[:10]]
+    got = rank_pathways_batch(profiles[:10], custodians, governance, **kwargs)
+    assert [summary(recs) for recs in got] == expected, kwargs
+print(f"  {len(profiles)} profiles, {sum(map(len, batch))} recommendations")
+
+# --- Process pool ---
+print("\n=== processes=2 ===")
+pooled = rank_pathways_batch(profiles, custodians, governance, processes=2)
+assert [summary(recs) for recs in pooled] == single, "order and content survive the pool"
+top = rank_pathways_batch(profiles[:5], custodians, governance, processes=2, top_k=2)
+assert [summary(recs) for recs in top] == [summary(rank_pathways(p, custodians, governance, top_k=2))
+                                           for p in profiles[:5]]
+assert rank_pathways_batch([], custodians, governance) == []
+assert rank_pathways_batch([], custodians, governance, processes=2) == []
+
+print("\nAll tests passed!")
@@ -0,0 +1,86 @@
+"""Smoke test for the token-budgeted prompt builder (chat_context.py)."""
+import sys
+sys.path.insert(0, ".")
+
+from chat_context import MESSAGE_OVERHEAD, ContextBuilder, count_tokens
+
+SYSTEM = "You are a helpful assistant for UK health data access. " * 20
+
+
+def chat(turns, words=60):
+    history = []
+    for i in range(turns):
+        history.append({"role": "user", "content": f"Question {i}: " + "how do I access data " * words})
+        history.append({"role": "assistant", "content": f"Answer {i}: " + "apply to the custodian " * words})
+    return history
+
+
+# --- Fitting the budget ---
+print("=== Prompts fit the budget ===")
+builder = ContextBuilder(budget=2000, summary_tokens=200, keep_recent=2)
+history = chat(20)
+for budget in (1000, 1500, 2000, 4000, 100_000):
+    context = builder.build(history, SYSTEM, budget=budget)
+    assert context.tokens <= budget and not context.over_budget, (budget, context.tokens)
+    assert context.tokens == sum(builder.message_tokens(m) for m in context.messages)
+    assert context.messages[0]["content"] == SYSTEM
+    assert context.messages[-2:] == history[-2:], "the newest messages are always sent"
+    assert context.messages[len(context.messages) - (len(history) - context.trimmed):] == history[context.trimmed:]
+    print(f"  budget {budget:>6}: {context.tokens} tokens, {context.trimmed} trimmed, "
+          f"summary {'yes' if context.summary else 'no'}")
+
+everything = builder.build(history, SYSTEM, budget=100_000)
+assert everything.trimmed == 0 and everything.summary is None
+assert len(everything.messages) == len(history) + 1
+
+# Recent messages beyond the budget are still sent, and flagged
+tight = builder.build(history, SYSTEM, budget=300)
+assert tight.over_budget and tight.messages[-2:] == history[-2:] and tight.summary is None
+
+# --- Summary of trimmed turns ---
+print("\n=== Summaries list earlier questions or are left out ===")
+context = builder.build(history, SYSTEM, budget=1500)
+assert context.trimmed and context.summary.startswith(f"Summary of {context.trimmed} earlier messages")
+assert "- Question" in context.summary and count_tokens(context.summary) <= builder.summary_tokens
+assert context.messages[1] == {"role": "system", "content": context.summary}
+
+# Long questions are shortened to fit a small allowance rather than dropped
+small = ContextBuilder(summary_tokens=50, keep_recent=2)
+context = small.build(history, SYSTEM, budget=1500)
+assert context.summary is not None and "- Question" in context.summary, context.summary
+assert count_tokens(context.summary) <= 50
+
+# With no room for even one question, no bare header is sent
+for summary_tokens in (20, 25):
+    context = ContextBuilder(summary_tokens=summary_tokens, keep_recent=2).build(history, SYSTEM, budget=1500)
+    assert context.trimmed and context.summary is None, context.summary
+    assert all("earlier messages omitted" not in m["content"] for m in context.messages)
+    assert len(context.messages) == 1 + len(history) - context.trimmed
+
+# Only assistant turns dropped: nothing to summarise
+assistant_only = [{"role": "assistant", "content": "note " * 400}] + chat(1, words=5)
+context = builder.build(assistant_only, SYSTEM, budget=800)
+assert context.trimmed == 1 and context.summary is None
+
+# --- Caching ---
+print("\n=== Prefix and per-message counts are cached ===")
+cached = ContextBuilder()
+short = chat(3)
+cached.build(short, SYSTEM, navigator="Top pathways: CPRD")
+stats = cached.stats()
+assert stats["prefixes"] == 1 and stats["counted_messages"] == len(short) + 2
+follow_up = [{"role": "user", "content": "And for Wales?"}, {"role": "assistant", "content": "Use SAIL."}]
+cached.build(short + follow_up, SYSTEM, navigator="Top pathways: CPRD")
+assert cached.stats()["prefixes"] == 1
+assert cached.stats()["counted_messages"] == stats["counted_messages"] + 2, "only new messages are counted"
+messages, tokens = cached.prefix(SYSTEM, "Top pathways: CPRD")
+assert [m["role"] for m in messages] == ["system", "system"]
+assert tokens == 2 * MESSAGE_OVERHEAD + count_tokens(SYSTEM) + count_tokens("Top pathways: CPRD")
+messages.append({"role": "user", "content": "mutated"})
+assert len(cached.prefix(SYSTEM, "Top pathways: CPRD")[0]) == 2, "callers get a copy"
+
+bounded = ContextBuilder(maxsize=10)
+bounded.build(history, SYSTEM)
+assert bounded.stats()["counted_messages"] == 10
+
+print("\nAll tests passed!")
@@ -0,0 +1,86 @@
+"""Smoke test for fee parsing and total-cost-of-access pricing (data_access/costs.py)."""
+import sys
+sys.path.insert(0, ".")
+
+import numpy as np
+
+from data_access.costs import PER_DATASET, PER_MONTH, PER_YEAR, CostModel, parse_fee_text
+from data_access.features import compile_features
+from data_access.loader import load_all_custodians
+
+# --- Fee text parsing ---
+print("=== parse_fee_text ===")
+cases = {
+    # text: (minimum, maximum, free, free_for)
+    "GBP 3,000 - 9,000": (3000, 9000, False, None),
+    "£3000-9000": (3000, 9000, False, None),
+    "£500 to £1,200": (500, 1200, False, None),
+    "50,000+": (50000, None, False, None),
+    "From £2,500": (2500, None, False, None),
+    "Up to 5,000": (0, 5000, False, None),
+    "Up to £5k": (0, 5000, False, None),
+    "Maximum £1.5m": (0, 1_500_000, False, None),
+    "Tier 2: 12,000": (12000, 12000, False, None),
+    "Band 3 - £4,000": (4000, 4000, False, None),
+    "2024 fee: GBP 1,500": (1500, 1500, False, None),
+    "Fees from 2025 will be 800": (800, 800, False, None),
+    "500 per dataset": (500, 500, False, None),
+    "Free": (None, None, True, None),
+    "": (None, None, True, None),
+    "Varies by SDE": (None, None, False, None),
+    "Free for academic; industry via partnership fees": (None, None, False, "academic"),
+    "Free for academics; £5,000 for industry": (5000, 5000, False, "academics"),
+}
+for text, expected in cases.items():
+    fee = parse_fee_text(text)
+    got = (fee.minimum, fee.maximum, fee.free, fee.free_for)
+    assert got == expected, (text, got, expected)
+    print(f"  {text!r:55} -> {got}")
+
+assert parse_fee_text("£1,000 per year").basis == PER_YEAR
+assert parse_fee_text("£200 monthly").basis == PER_MONTH
+assert parse_fee_text("£300 each dataset").basis == PER_DATASET
+assert parse_fee_text("USD 1,000").currency == "USD"
+
+# --- Conditional free-for fees ---
+print("\n=== Free-for conditions apply per researcher type ===")
+partnership = parse_fee_text("Free for academic; industry via partnership fees")
+assert partnership.waived_for("Academic researcher")
+assert not partnership.waived_for("Industry/commercial")
+assert not partnership.waived_for(None)
+assert partnership.bounds("Academic researcher") == (0, 0)
+assert partnership.bounds("Industry/commercial") == (0, None), "industry pays an unpriced fee"
+assert not parse_fee_text("Free for approved research").waived_for("Academic researcher")
+
+model = CostModel.parse(
+    application_fee="Free for academic researchers",
+    tre_fee="Free for academic; industry via partnership fees",
+    annual_access_fee="£1,000 per year",
+)
+assert model.conditional
+assert model.total_cost(2, researcher_type="Academic researcher") == (2000, 2000)
+assert model.total_cost(2, researcher_type="Industry/commercial") == (2000, None)
+assert CostModel.parse("£100", free_for=["Academic researcher"]).total_cost(
+    3, researcher_type="Academic researcher") == (0, 0)
+assert CostModel.parse("£100", annual_access_fee="£10 per year").total_cost(0) == (100, 100)
+
+# --- Vectorised totals match the per-custodian model ---
+print("\n=== CustodianFeatures.total_cost matches CostModel.total_cost ===")
+custodians = load_all_custodians()
+features = compile_features(custodians)
+for researcher_type in (None, "Academic researcher", "Industry/commercial", "NHS analyst"):
+    for years in (0, 1, 3.5):
+        totals = features.total_cost(years, 2, researcher_type)
+        for row, c in enumerate(custodians):
+            if c.costs is None:
+                continue
+            low, high = c.costs.total_cost(years, 2, researcher_type)
+            assert totals[row, 0] == low, (c.id, researcher_type, years)
+            assert (np.isinf(totals[row, 1]) and high is None) or totals[row, 1] == high, (c.id, researcher_type)
+
+genomics = next(c for c in custodians if c.id == "genomics_england")
+assert genomics.costs.total_cost(1, researcher_type="Academic researcher") == (0, 0)
+assert genomics.costs.total_cost(1, researcher_type="Industry/commercial")[1] is None
+print("  Genomics England for industry:", genomics.costs.total_cost(1, researcher_type="Industry/commercial"))
+
+print("\nAll tests passed!")
@@ -0,0 +1,88 @@
+"""Smoke test for lazily rendered recommendation explanations (data_access/navigator.py)."""
+import sys
+sys.path.insert(0, ".")
+
+import pickle
+from dataclasses import replace
+
+from data_access import navigator
+from data_access.loader import load_all_custodians, load_governance_bodies
+from data_access.models import PathwayRecommendation, ResearcherProfile
+from data_access.navigator import _explain, explain_recommendation, rank_pathways
+
+custodians = load_all_custodians()
+governance = load_governance_bodies()
+profile = ResearcherProfile(
+    researcher_type="Academic researcher",
+    institution_country="England",
+    ethics_status="Approved",
+    funding_status="Funded (grant)",
+    data_needs=["Primary care (GP records)", "Genomic data"],
+    geographic_scope=["England", "Scotland"],
+    population_size="100,000-1M",
+    study_type="Observational/epidemiological",
+    timeline_priority="ASAP",
+    budget_range="Free/no budget",
+    needs_data_extraction=True,
+    needs_section_251=True,
+)
+
+explained = []
+_original = navigator._explain
+navigator._explain = lambda p, c, *args: explained.append(c.id) or _original(p, c, *args)
+
+# --- Nothing is rendered until read ---
+print("=== Explanations render on first access ===")
+recs = rank_pathways(profile, custodians, governance)
+assert not explained, "ranking renders no text"
+reasons = recs[0].match_reasons
+assert explained == [recs[0].custodian.id]
+assert recs[0].concerns is recs[0].concerns and explained == [recs[0].custodian.id], "both lists come from one call"
+assert recs[1].concerns is not None and explained == [recs[0].custodian.id, recs[1].custodian.id]
+assert reasons is recs[0].match_reasons
+assert all(rec.profile is profile and rec.explainer is explain_recommendation for rec in recs)
+
+# --- Rendered text matches eager rendering ---
+print("\n=== Lazy text matches eager rendering ===")
+for rec in recs:
+    expected_reasons, expected_concerns = _original(profile, rec.custodian)
+    if rec.required_governance:
+        expected_reasons.append("Governance route: " + ", ".join(g.short_name for g in rec.required_governance))
+    assert (rec.match_reasons, rec.concerns) == (expected_reasons, expected_concerns), rec.custodian.id
+assert any("TRE-only" in c for rec in recs for c in rec.concerns)
+assert len(explained) == len(recs)
+
+# Simulated percentiles feed the speed reasons
+p80 = rank_pathways(profile, custodians, governance, timeline_percentile=80)
+for rec in p80:
+    weeks = rec.timeline_percentiles["p80"]
+    assert (rec.match_reasons, rec.concerns) == explain_recommendation(rec)
+    assert _original(profile, rec.custodian, weeks, "P80")[1] == rec.concerns
+
+# --- Explicit values, copies and pickling ---
+print("\n=== Explicit lists, replace() and pickling ===")
+rec = recs[2]
+given = PathwayRecommendation(
+    custodian=rec.custodian, overall_score=50.0, dimension_scores={},
+    match_reasons=["given"], concerns=None, estimated_total_weeks=1, estimated_cost_range="",
+    profile=profile, explainer=explain_recommendation,
+)
+assert given.match_reasons == ["given"] and given.concerns == _original(profile, rec.custodian)[1]
+empty = PathwayRecommendation(
+    custodian=rec.custodian, overall_score=50.0, dimension_scores={},
+    match_reasons=None, concerns=None, estimated_total_weeks=1, estimated_cost_range="",
+)
+assert empty.match_reasons == [] and empty.concerns == [], "no explainer renders nothing"
+
+fresh = rank_pathways(profile, custodians, governance, top_k=1)[0]
+count = len(explained)
+copy = replace(fresh)
+assert len(explained) == count + 1, "replace() reads the fields, rendering them once"
+assert copy.match_reasons == fresh.match_reasons and len(explained) == count + 1
+restored = pickle.loads(pickle.dumps(rank_pathways(profile, custodians, governance, top_k=1)[0]))
+assert (restored.match_reasons, restored.concerns) == (fresh.match_reasons, fresh.concerns)
+print(f"  {len(explained)} explanations rendered")
+
+navigator._explain = _original
+
+print("\nAll tests passed!")
@@ -0,0 +1,79 @@
+"""Smoke test for governance route resolution (data_access/navigator.py)."""
+import sys
+sys.path.insert(0, ".")
+
+from data_access.features import compile_features
+from data_access.loader import load_all_custodians, load_governance_bodies
+from data_access.models import ResearcherProfile
+from data_access.navigator import GovernanceResolver, rank_pathways
+
+custodians = load_all_custodians()
+governance = load_governance_bodies()
+features = compile_features(custodians)
+
+profile = ResearcherProfile(
+    researcher_type="Academic researcher",
+    institution_country="Scotland",
+    ethics_status="Approved",
+    funding_status="Funded (grant)",
+    data_needs=["Primary care (GP records)", "Hospital episodes (HES/inpatient)"],
+    geographic_scope=["England", "Scotland"],
+    population_size="100,000-1M",
+    study_type="Observational/epidemiological",
+    timeline_priority="Within 6 months",
+    budget_range="Free/no budget",
+    needs_section_251=True,
+)
+
+
+class CountingResolver(GovernanceResolver):
+    def __init__(self, bodies):
+        super().__init__(bodies)
+        self.resolved = []
+
+    def resolve(self, custodian, needs_section_251):
+        self.resolved.append((custodian.id, needs_section_251))
+        return super().resolve(custodian, needs_section_251)
+
+
+# --- Only surviving custodians are routed ---
+print("=== rank_pathways routes only the custodians that make the cut ===")
+resolver = CountingResolver(governance)
+top = rank_pathways(profile, features, resolver, top_k=3)
+assert sorted(resolver.resolved) == sorted((r.custodian.id, True) for r in top), resolver.resolved
+print("  routed:", [cid for cid, _ in resolver.resolved])
+
+# Routes are resolved once per row and flag, then looked up
+rank_pathways(profile, features, resolver, top_k=3)
+assert len(resolver.resolved) == 3
+everything = rank_pathways(profile, features, resolver)
+assert len(resolver.resolved) == len(custodians)
+
+# Lazy routes match eager resolution for every row and flag
+fresh = GovernanceResolver(governance)
+table = resolver.routes_for(features)
+for flag in (False, True):
+    for row, custodian in enumerate(custodians):
+        assert table[flag][row] == fresh.resolve(custodian, flag), (custodian.id, flag)
+assert len(resolver.resolved) == 2 * len(custodians)
+for rec in everything:
+    assert rec.required_governance == fresh.resolve(rec.custodian, True)
+
+# A simulated-timeline ranking routes every custodian for its flag
+resolver = CountingResolver(governance)
+rank_pathways(profile, features, resolver, top_k=3, timeline_percentile=80)
+assert sorted(resolver.resolved) == sorted((c.id, True) for c in custodians)
+
+# --- Section 251 / PBPP tier selection ---
+print("\n=== Section 251 adds CAG and picks the PBPP tier ===")
+for custodian in custodians:
+    with_251 = {b.id for b in fresh.resolve(custodian, True)}
+    without = {b.id for b in fresh.resolve(custodian, False)}
+    assert "cag" not in without or "cag" in custodian.related_governance_bodies
+    if {"England", "Wales"} & set(custodian.regions) and "cag" in fresh.body_map:
+        assert "cag" in with_251, custodian.id
+    if "Scotland" in custodian.regions:
+        assert "pbpp_tier2" in with_251 and "pbpp_tier1" not in with_251, custodian.id
+        assert "pbpp_tier2" not in without, custodian.id
+
+print("\nAll tests passed!")
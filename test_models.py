@@ -0,0 +1,104 @@
+"""Smoke test for the frozen catalogue models (data_access/models.py)."""
+import sys
+sys.path.insert(0, ".")
+
+import pickle
+from dataclasses import FrozenInstanceError, replace
+
+from data_access.loader import load_all_custodians, load_governance_bodies
+from data_access.models import (
+    CostEstimate,
+    DataCustodian,
+    GovernanceBody,
+    GovernanceTier,
+    ResearcherProfile,
+    TimelineEstimate,
+)
+
+custodians = load_all_custodians()
+governance = load_governance_bodies()
+
+
+def custodian(**overrides):
+    fields = dict(
+        id="test", name="Test", short_name="Test", description="", url="",
+        regions=["England"],
+        data_types=["Primary care (GP records)"],
+        timeline=[TimelineEstimate("Application", 2, 4, 8), TimelineEstimate("Review", 1, 3, 6)],
+        costs=CostEstimate(application_fee="£1,500", annual_access_fee="£500", free_for=["NHS analyst"]),
+    )
+    fields.update(overrides)
+    return DataCustodian(**fields)
+
+
+# --- Immutability ---
+print("=== Models are frozen ===")
+c = custodian()
+profile = ResearcherProfile(
+    researcher_type="Academic researcher",
+    institution_country="England",
+    ethics_status="Approved",
+    funding_status="Funded (grant)",
+    data_needs=["Primary care (GP records)"],
+    geographic_scope=["England"],
+    population_size="100,000-1M",
+    study_type="Observational/epidemiological",
+    timeline_priority="Not urgent",
+    budget_range="Free/no budget",
+)
+body = GovernanceBody(id="g", name="G", short_name="G", description="",
+                      nations=["Scotland"], tiers=[GovernanceTier("Tier 1", "", 10)])
+for obj, name, value in (
+    (c, "short_name", "Renamed"),
+    (c, "total_typical_weeks", 0),
+    (c.timeline[0], "typical_weeks", 1),
+    (c.costs, "application_fee", None),
+    (profile, "budget_range", "GBP 100,000+"),
+    (body, "tiers", ()),
+    (custodians[0], "regions", ()),
+    (governance[0], "name", "Renamed"),
+):
+    try:
+        setattr(obj, name, value)
+        raise AssertionError(f"{type(obj).__name__}.{name} is writable")
+    except FrozenInstanceError:
+        pass
+
+# List inputs are stored as tuples
+assert c.regions == ("England",) and isinstance(c.timeline, tuple)
+assert c.costs.free_for == ("NHS analyst",)
+assert profile.data_needs == ("Primary care (GP records)",) and profile.geographic_scope == ("England",)
+assert body.nations == ("Scotland",) and isinstance(body.tiers, tuple)
+assert all(isinstance(x.data_types, tuple) and isinstance(x.timeline, tuple) for x in custodians)
+if sys.version_info >= (3, 11):
+    assert not hasattr(c, "__dict__") and not hasattr(profile, "__dict__"), "slotted"
+
+# --- Derived fields ---
+print("\n=== Derived fields ===")
+assert (c.total_min_weeks, c.total_typical_weeks, c.total_max_weeks) == (3, 7, 14)
+assert c.cost_summary == "£1,500 | £500/yr | Free for: NHS analyst"
+assert custodian(costs=None).cost_summary == "Not specified"
+assert custodian(costs=CostEstimate()).cost_summary == "Contact custodian"
+assert c.costs.min_application_fee == 1500 and not c.costs.application_fee_free
+assert CostEstimate(application_fee="Free").application_fee_free
+longer = replace(c, timeline=c.timeline + (TimelineEstimate("Provisioning", 1, 2, 3),))
+assert longer.total_typical_weeks == 9, "replace() recomputes derived fields"
+for loaded in custodians:
+    assert loaded.total_typical_weeks == sum(t.typical_weeks for t in loaded.timeline)
+
+# --- Hashing, equality and pickling ---
+print("\n=== Hashable, comparable and picklable ===")
+assert c == custodian() and hash(c) == hash(custodian())
+assert c != custodian(short_name="Other") and len({c, custodian(), longer}) == 2
+assert profile == replace(profile) and hash(profile) == hash(replace(profile))
+assert len({*custodians, *custodians}) == len(custodians)
+assert len({*governance}) == len(governance)
+for obj in (c, profile, body, custodians[0], governance[0]):
+    copy = pickle.loads(pickle.dumps(obj))
+    assert copy == obj and hash(copy) == hash(obj), type(obj).__name__
+copy = pickle.loads(pickle.dumps(custodians[0]))
+assert copy.total_typical_weeks == custodians[0].total_typical_weeks
+assert copy.costs is None or copy.costs.model is not None
+print(f"  {len(custodians)} custodians, {len(governance)} governance bodies hash and pickle")
+
+print("\nAll tests passed!")
@@ -112,4 +112,25 @@ for r in results4[:5]:
     gov_names = [g.short_name for g in r.required_governance]
     print(f"  {r.overall_score:.0f}% - {r.custodian.short_name} (~{r.estimated_total_weeks}wk, {r.estimated_cost_range}) Gov: {gov_names}")
 
+# --- Test: vectorised scores agree with the per-dimension scorers ---
+print("\n=== Test 5: vectorised scores match scalar scorers ===")
+from data_access.navigator import (
+    _score_data_fit, _score_geography, _score_eligibility,
+    _score_speed, _score_cost, _score_study_design,
+)
+
+for profile in (profile1, profile2, profile3, profile4):
+    for r in rank_pathways(profile, custodians, governance):
+        c = r.custodian
+        expected = [
+            _score_data_fit(profile.data_needs, c.data_types)[0],
+            _score_geography(profile.geographic_scope, c.regions)[0],
+            _score_eligibility(profile.researcher_type, c.eligible_researchers)[0],
+            _score_speed(profile.timeline_priority, c.timeline)[0],
+            _score_cost(profile.budget_range, c.costs)[0],
+            _score_study_design(profile.study_type, c.access_model)[0],
+        ]
+        assert list(r.dimension_scores.values()) == expected, (c.id, r.dimension_scores, expected)
+print(f"  {len(custodians)} custodians x 4 profiles agree")
+
 print("\nAll tests passed!")
@@ -0,0 +1,214 @@
+"""Smoke test for the OpenSAFELY jobs client, caches and scrapers."""
+import sys
+sys.path.insert(0, ".")
+sys.path.insert(0, "scripts")
+
+import csv
+import io
+import json
+import tempfile
+from pathlib import Path
+
+import requests
+
+import scrape_project_organizations as org_scraper
+from opensafely_jobs.aggregators import JobStatsAggregator, ProjectJobCounter, count_jobs_by_organization
+from opensafely_jobs.cache import PageCache
+from opensafely_jobs.client import OpenSAFELYDataLoader, OpenSAFELYJobsClient, OpenSAFELYParseError
+from opensafely_jobs.dimensions import UNKNOWN_ID, ProjectOrganizationTable
+
+# --- Project organisation scraper: incremental merge ---
+print("=== Scraper merge keeps good data on failed re-scrapes ===")
+good = {
+    "project_slug": "p1",
+    "organizations": [{"name": "University of Oxford", "slug": "oxford"}],
+    "scraped_at": "2024-01-01T00:00:00",
+}
+failed = {"project_slug": "p1", "organizations": [], "error": "timeout", "scraped_at": "2024-06-01T00:00:00"}
+fresh = {"project_slug": "p1", "organizations": [{"name": "LSHTM", "slug": "lshtm"}], "scraped_at": "2024-07-01T00:00:00"}
+
+merged = org_scraper.merge_result(good, failed)
+assert merged["organizations"] == good["organizations"]
+assert merged["scraped_at"] == good["scraped_at"], "last successful scrape time is kept"
+assert merged["error"] == "timeout" and merged["error_at"] == failed["scraped_at"]
+assert org_scraper.is_stale(merged, max_age_days=365 * 100), "errored entries are retried"
+assert org_scraper.merge_result(merged, fresh) == fresh, "a successful scrape replaces the entry"
+assert org_scraper.merge_result(None, failed) == failed
+assert org_scraper.merge_result({"organizations": []}, failed) == failed
+
+results = {"p1": failed, "p2": fresh}
+original = org_scraper.scrape_project_organization
+org_scraper.scrape_project_organization = lambda session, slug: results[slug]
+try:
+    mapping = {"metadata": {}, "projects": {"p1": good}}
+    with tempfile.TemporaryDirectory() as tmp:
+        org_scraper.scrape_projects(["p1", "p2"], mapping, workers=2, rate=0, checkpoint_every=0,
+                                    total_projects=2, output_path=Path(tmp) / "mapping.json")
+finally:
+    org_scraper.scrape_project_organization = original
+assert mapping["projects"]["p1"]["organizations"] == good["organizations"]
+assert mapping["projects"]["p1"]["error"] == "timeout"
+assert mapping["projects"]["p2"] == fresh
+print("  failed re-scrape kept", len(mapping["projects"]["p1"]["organizations"]), "organisation(s)")
+
+# --- Conditional GET page cache ---
+print("\n=== PageCache revalidates with conditional GETs ===")
+
+
+class FakeResponse:
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class FakeSession(requests.Session):
+    """Serves one page, answering 304 when the client's ETag is current."""
+
+    def __init__(self):
+        super().__init__()
+        self.text, self.etag, self.requests = "<a href='/org-a/'>Org A</a>", '"v1"', []
+
+    def get(self, url, timeout=None, headers=None):
+        self.requests.append(dict(headers or {}))
+        if (headers or {}).get("If-None-Match") == self.etag:
+            return FakeResponse(304)
+        return FakeResponse(200, self.text, {"ETag": self.etag, "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+
+parses = []
+
+
+def parser(soup):
+    parses.append(1)
+    return [a["href"] for a in soup.find_all("a")]
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    session = FakeSession()
+    client = OpenSAFELYJobsClient(session=session, cache_dir=Path(tmp))
+    assert client._get_records("/orgs/", "links", parser) == ["/org-a/"]
+    assert session.requests[0] == {}, "first fetch is unconditional"
+
+    records = client._get_records("/orgs/", "links", parser)
+    assert session.requests[1]["If-None-Match"] == '"v1"'
+    assert session.requests[1]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert records == ["/org-a/"] and len(parses) == 1, "a 304 reuses the parsed records"
+    records.append("mutated")
+    assert client._get_records("/orgs/", "links", parser) == ["/org-a/"], "callers get copies"
+
+    session.text, session.etag = "<a href='/org-b/'>Org B</a>", '"v2"'
+    assert client._get_records("/orgs/", "links", parser) == ["/org-b/"] and len(parses) == 2
+
+    # A fresh process reads pages and parsed records back from disk
+    offline = OpenSAFELYJobsClient(page_cache=PageCache(Path(tmp)), offline=True)
+    assert offline._get_records("/orgs/", "links", parser) == ["/org-b/"] and len(parses) == 2
+    try:
+        offline._fetch("/never-fetched/")
+        raise AssertionError("offline mode must not hit the network")
+    except Exception as e:
+        assert "offline" in str(e)
+print(f"  {len(session.requests)} requests, {len(parses)} parses")
+
+# --- Project/organisation dimension join ---
+print("\n=== Dimension table joins job rows to organisations ===")
+mapping = {
+    "metadata": {},
+    "projects": {
+        "covid-study": {"project_name": "COVID Study", "organizations": [
+            {"name": "University of Oxford", "slug": "oxford"}, {"name": "LSHTM", "slug": "lshtm"},
+            {"name": "University of Oxford", "slug": "oxford"}]},
+        "diabetes": {"organizations": [{"name": "LSHTM", "slug": "lshtm"}, {"name": " "}]},
+        "orphan": {"organizations": []},
+    },
+}
+table = ProjectOrganizationTable.from_mapping(mapping)
+assert table.project_count == 3 and table.org_count == 2
+covid = table.project_id("covid-study")
+assert [table.org_names[o] for o in table.orgs_for_project(covid)] == ["University of Oxford", "LSHTM"]
+assert table.project_names[table.project_id("diabetes")] == "Diabetes"
+assert table.project_id("missing") == UNKNOWN_ID and table.orgs_for_project(UNKNOWN_ID) == ()
+counts = [0] * table.project_count
+counts[covid], counts[table.project_id("diabetes")] = 3, 2
+assert count_jobs_by_organization(table, counts) == {"LSHTM": 5, "University of Oxford": 3}
+
+# --- Streaming loader ---
+print("\n=== Streaming CSV loader ===")
+FIELDS = OpenSAFELYDataLoader.EXPORT_FIELDS
+ROWS = 10_500  # more than one default chunk
+
+
+def job_row(i, jobs_total=None):
+    return {
+        "job_request_id": str(i),
+        "status": ("succeeded", "failed", "running")[i % 3],
+        "organization": ("covid-study", "diabetes", "orphan", "unmapped")[i % 4],
+        "project": f"Project {i % 7}",
+        "workspace": f"ws-{i % 11}",
+        "user": f"user{i % 5}",
+        "jobs_completed": "1",
+        "jobs_total": str(i % 4) if jobs_total is None else jobs_total,
+        "backend": "tpp" if i % 2 else "emis",
+        "started_at": "",
+        "started_at_iso": f"2024-01-{i % 28 + 1:02d}T10:00:00Z",
+    }
+
+
+def write_history(data_dir, rows):
+    with open(data_dir / OpenSAFELYDataLoader.CSV_FILENAME, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(data_dir / OpenSAFELYDataLoader.MAPPING_FILENAME, "w", encoding="utf-8") as f:
+        json.dump(mapping, f)
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    data_dir = Path(tmp)
+    write_history(data_dir, [job_row(i) for i in range(ROWS)])
+
+    in_memory = OpenSAFELYDataLoader(data_dir)
+    streamed = OpenSAFELYDataLoader(data_dir)
+    streamed.MAX_IN_MEMORY_BYTES = 0
+    stats = in_memory.get_stats()
+    assert stats == streamed.get_stats(), "streaming and in-memory stats agree"
+    assert streamed._jobs_cache is None and in_memory._jobs_cache is not None
+    assert stats["total_job_requests"] == ROWS and stats["incomplete"] is False
+    assert stats["total_individual_jobs"] == sum(i % 4 for i in range(ROWS))
+    expected_orgs = {"LSHTM": len(range(0, ROWS, 4)) + len(range(1, ROWS, 4)), "University of Oxford": len(range(0, ROWS, 4))}
+    assert stats["organization_job_counts"] == expected_orgs
+    assert streamed.get_organization_job_counts() == expected_orgs
+    assert [len(chunk) for chunk in streamed.iter_job_chunks(4000)] == [4000, 4000, 2500]
+
+    latest = streamed.get_job_requests(limit=3)
+    assert [jr.created_at.day for jr in latest] == [28, 28, 28]
+    buffer = io.StringIO()
+    assert streamed.export_jobs_csv(buffer, predicate=lambda row: row["status"] == "failed") == len(range(1, ROWS, 3))
+
+    counter = ProjectJobCounter(table)
+    counter.update(in_memory.load_jobs())
+    aggregator = JobStatsAggregator(table)
+    aggregator.update(in_memory.load_jobs())
+    assert aggregator.project_counter.counts == counter.counts
+
+    # A row that fails mid-stream is reported, never silently truncated
+    write_history(data_dir, [job_row(i) for i in range(ROWS)] + [job_row(ROWS, jobs_total="many")])
+    for limit in (None, 0):
+        broken = OpenSAFELYDataLoader(data_dir)
+        if limit is not None:
+            broken.MAX_IN_MEMORY_BYTES = limit
+        try:
+            broken.export_jobs_csv(io.StringIO())
+            raise AssertionError("a partial export must raise")
+        except OpenSAFELYParseError as e:
+            assert "many" in str(e)
+        partial = broken.get_stats()
+        assert partial["incomplete"] is True and "many" in partial["error"]
+        assert 0 < partial["total_job_requests"] <= ROWS
+print(f"  {stats['total_job_requests']} rows, organisations: {stats['organization_job_counts']}")
+
+print("\nAll tests passed!")
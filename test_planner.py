@@ -0,0 +1,142 @@
+"""Smoke test for the multi-custodian combination planner (data_access/planner.py)."""
+import sys
+sys.path.insert(0, ".")
+
+import itertools
+import random
+
+from data_access.features import FEE_NUMERIC, compile_features
+from data_access.loader import load_all_custodians, load_governance_bodies
+from data_access.models import DataCustodian, ResearcherProfile, TimelineEstimate
+from data_access.navigator import _BUDGET_MAP, _URGENCY_MAP, governance_resolver
+from data_access.planner import plan_combinations
+
+custodians = load_all_custodians()
+governance = load_governance_bodies()
+
+
+def profile(data_needs, geographic_scope, **overrides):
+    fields = dict(
+        researcher_type="Academic researcher",
+        institution_country="England",
+        ethics_status="Approved",
+        funding_status="Funded (grant)",
+        data_needs=data_needs,
+        geographic_scope=geographic_scope,
+        population_size="100,000-1M",
+        study_type="Observational/epidemiological",
+        timeline_priority="Not urgent",
+        budget_range="GBP 100,000+",
+    )
+    fields.update(overrides)
+    return ResearcherProfile(**fields)
+
+
+def custodian(cid, data_types, regions, weeks=10):
+    return DataCustodian(
+        id=cid, name=cid, short_name=cid, description="", url="",
+        data_types=tuple(data_types), regions=tuple(regions),
+        timeline=(TimelineEstimate("Application", weeks, weeks, weeks),),
+    )
+
+
+# --- Coverage is per (data type, region) pair ---
+print("=== Pairs, not separate unions ===")
+GP, HES = "Primary care (GP records)", "Hospital episodes (HES/inpatient)"
+england_gp = custodian("england_gp", [GP], ["England"])
+wales_hes = custodian("wales_hes", [HES], ["Wales"])
+wales_all = custodian("wales_all", [GP, HES], ["Wales"])
+england_hes = custodian("england_hes", [HES], ["England"])
+both = profile([GP, HES], ["England", "Wales"])
+
+partial = plan_combinations(both, [england_gp, wales_hes], [])[0]
+assert {c.id for c in partial.custodians} == {"england_gp", "wales_hes"}
+assert not partial.missing_data_types and not partial.missing_regions, "each type and region appears somewhere"
+assert sorted(partial.missing_pairs) == sorted([(GP, "Wales"), (HES, "England")])
+assert partial.coverage == 0.5
+
+full = plan_combinations(both, [england_gp, wales_hes, wales_all, england_hes], [])[0]
+assert {c.id for c in full.custodians} == {"england_gp", "wales_all", "england_hes"}
+assert full.coverage == 1.0 and not full.missing_pairs
+
+uk_wide = custodian("uk_wide", [GP], ["UK-wide"])
+plan = plan_combinations(profile([GP], ["Scotland", "Wales"]), [uk_wide], [])[0]
+assert plan.coverage == 1.0, "UK-wide custodians cover every region"
+plan = plan_combinations(profile([GP, HES], []), [england_gp, wales_hes], [])[0]
+assert plan.coverage == 1.0 and not plan.missing_pairs, "without regions, data types alone count"
+assert plan_combinations(both, [custodian("elsewhere", [GP], ["Scotland"])], []) == []
+print("  England GP + Welsh HES covers", f"{partial.coverage:.0%}", "missing", partial.missing_pairs)
+
+# --- A UK-wide scope can be met nation by nation ---
+print("\n=== UK-wide scope ===")
+NATIONS = ["England", "Wales", "Scotland", "Northern Ireland"]
+nation_gp = [custodian(f"{n.lower()}_gp", [GP], [n]) for n in NATIONS]
+uk_study = profile([GP], ["UK-wide"])
+plan = plan_combinations(uk_study, nation_gp, [], max_custodians=4)[0]
+assert {c.id for c in plan.custodians} == {c.id for c in nation_gp}
+assert plan.coverage == 1.0 and plan.covered_regions == NATIONS and not plan.missing_pairs
+three = plan_combinations(uk_study, nation_gp[:3], [], max_custodians=4)[0]
+assert three.missing_pairs == [(GP, "Northern Ireland")] and three.coverage == 0.75
+assert plan_combinations(uk_study, nation_gp, [], max_custodians=3)[0].coverage == 0.75
+best = plan_combinations(profile([GP], ["UK-wide", "Wales"]), nation_gp + [uk_wide], [])[0]
+assert [c.id for c in best.custodians] == ["uk_wide"], "one UK-wide custodian beats four nations"
+assert best.covered_regions == NATIONS
+print("  four nations cover", f"{plan.coverage:.0%}", "three cover", f"{three.coverage:.0%}")
+
+# --- Optimality against brute force on the catalogue ---
+print("\n=== Branch-and-bound matches exhaustive search ===")
+features = compile_features(custodians)
+resolver = governance_resolver(governance)
+data_types = sorted({t for c in custodians for t in c.data_types})
+regions = ["England", "Wales", "Scotland", "Northern Ireland"]
+rng = random.Random(3)
+
+
+def covers(c, data_type, region):
+    return data_type.lower() in {t.lower() for t in c.data_types} and (region in c.regions or "UK-wide" in c.regions)
+
+
+checked = 0
+for _ in range(60):
+    p = profile(
+        rng.sample(data_types, rng.randint(1, 4)),
+        rng.sample(regions, rng.randint(1, 3)),
+        researcher_type=rng.choice(["Academic researcher", "NHS analyst", "Industry (pharma/biotech)"]),
+        budget_range=rng.choice(list(_BUDGET_MAP)),
+        timeline_priority=rng.choice(list(_URGENCY_MAP)),
+        needs_section_251=rng.random() < 0.3,
+    )
+    routes = resolver.routes_for(features)[bool(p.needs_section_251)]
+    budget, weeks_cap = _BUDGET_MAP[p.budget_range], _URGENCY_MAP[p.timeline_priority]
+    eligible = features.eligibility_open | features.eligibility_vector(p.researcher_type)
+    pairs = [(t, r) for t in dict.fromkeys(p.data_needs) for r in p.geographic_scope]
+
+    feasible = []
+    for row, c in enumerate(custodians):
+        held = frozenset(pair for pair in pairs if covers(c, *pair))
+        fee = int(features.min_fees[row]) if features.fee_codes[row] == FEE_NUMERIC else 0
+        weeks = c.total_typical_weeks + sum(g.tiers[0].typical_weeks for g in routes[row] if g.tiers)
+        if held and eligible[row] and fee <= budget and weeks <= weeks_cap:
+            feasible.append((held, fee))
+
+    best = None
+    for size in (1, 2, 3):
+        for combo in itertools.combinations(feasible, size):
+            fee = sum(f for _, f in combo)
+            if fee <= budget:
+                key = (-len(frozenset().union(*(h for h, _ in combo))), size, fee)
+                best = key if best is None or key < best else best
+
+    plans = plan_combinations(p, custodians, governance)
+    got = None
+    if plans:
+        top = plans[0]
+        got = (-(len(pairs) - len(top.missing_pairs)), len(top.custodians), top.min_fee)
+        assert top.coverage == 1 - len(top.missing_pairs) / len(pairs)
+        assert top.min_fee <= budget and top.estimated_weeks <= weeks_cap
+        assert len(top.custodians) <= 3
+    assert got == best, (p.data_needs, p.geographic_scope, got, best)
+    checked += bool(plans)
+print(f"  {checked} non-empty plans verified")
+
+print("\nAll tests passed!")
@@ -0,0 +1,107 @@
+"""Smoke test for memoised recommendations (data_access/cache.py)."""
+import sys
+sys.path.insert(0, ".")
+
+from dataclasses import replace
+
+from data_access import cache as recommendation_cache
+from data_access.cache import RecommendationCache, profile_fingerprint
+from data_access.loader import load_all_custodians, load_governance_bodies
+from data_access.models import ResearcherProfile
+from data_access.navigator import rank_pathways
+
+custodians = load_all_custodians()
+governance = load_governance_bodies()
+profile = ResearcherProfile(
+    researcher_type="Academic researcher",
+    institution_country="England",
+    ethics_status="Approved",
+    funding_status="Funded (grant)",
+    data_needs=["Primary care (GP records)", "Hospital episodes (HES/inpatient)"],
+    geographic_scope=["England", "Wales"],
+    population_size="100,000-1M",
+    study_type="Observational/epidemiological",
+    timeline_priority="Within 6 months",
+    budget_range="Free/no budget",
+)
+
+ranked = []
+_rank = recommendation_cache.rank_pathways
+recommendation_cache.rank_pathways = lambda *args, **kwargs: ranked.append(1) or _rank(*args, **kwargs)
+
+# --- Canonical profile keys ---
+print("=== profile_fingerprint ===")
+key = profile_fingerprint(profile)
+same = (
+    replace(profile, data_needs=["hospital episodes (hes/inpatient)", "Primary care (GP records)"]),
+    replace(profile, geographic_scope=["Wales", "England", "Wales"]),
+    replace(profile, institution_country="Scotland", ethics_status="Pending", funding_status="Unfunded"),
+    replace(profile, population_size="<10,000", needs_repeat_access=True),
+)
+assert all(profile_fingerprint(p) == key for p in same), "ignored fields and list order do not matter"
+different = (
+    replace(profile, researcher_type="NHS analyst"),
+    replace(profile, data_needs=["Primary care (GP records)"]),
+    replace(profile, geographic_scope=["England"]),
+    replace(profile, study_type="Clinical trial"),
+    replace(profile, timeline_priority="ASAP"),
+    replace(profile, budget_range="GBP 100,000+"),
+    replace(profile, needs_data_extraction=True),
+    replace(profile, needs_section_251=True),
+)
+assert len({key, *map(profile_fingerprint, different)}) == len(different) + 1, "ranking inputs change the key"
+
+# --- Hits, misses and eviction ---
+print("\n=== RecommendationCache ===")
+cache = RecommendationCache(maxsize=2)
+first = cache.rank(profile, custodians, governance, version=1)
+assert len(ranked) == 1 and cache.stats()["misses"] == 1
+assert [r.custodian.id for r in first] == [r.custodian.id for r in rank_pathways(profile, custodians, governance)]
+for p in same:
+    assert cache.rank(p, custodians, governance, version=1) == first
+assert len(ranked) == 1 and cache.stats()["hits"] == len(same)
+
+returned = cache.rank(profile, custodians, governance, version=1)
+returned.clear()
+assert cache.rank(profile, custodians, governance, version=1) == first, "callers get a copy of the list"
+
+# Each caller gets its own recommendations: sessions never share mutable state
+mine, theirs = (cache.rank(profile, custodians, governance, version=1) for _ in range(2))
+assert all(a is not b and a.custodian is b.custodian for a, b in zip(mine, theirs))
+mine[0].dimension_scores["data_fit"] = -1
+mine[0].match_reasons.append("edited")
+assert theirs[0].dimension_scores == first[0].dimension_scores
+assert "edited" not in theirs[0].match_reasons and "edited" not in first[0].match_reasons
+stored = next(iter(cache._entries.values()))
+assert all(rec.__dict__.get("_match_reasons") is None for rec in stored), "cached instances are never rendered"
+copied = mine[0].copy()
+assert copied.match_reasons == mine[0].match_reasons and copied.match_reasons is not mine[0].match_reasons
+
+# top_k, min_score and timeline_percentile are part of the key
+top3 = cache.rank(profile, custodians, governance, top_k=3, version=1)
+assert len(top3) == 3 and len(ranked) == 2
+assert cache.rank(profile, custodians, governance, min_score=50, version=1) == [r for r in first if r.overall_score >= 50]
+assert len(ranked) == 3 and len(cache) == 2
+cache.rank(profile, custodians, governance, version=1)
+assert len(ranked) == 4, "the least recently used entry was evicted"
+
+# A new data version drops every entry
+hits = cache.stats()["hits"]
+cache.rank(profile, custodians, governance, version=2)
+assert len(ranked) == 5 and len(cache) == 1 and cache.stats()["version"] == 2
+cache.rank(profile, custodians, governance, version=2)
+assert cache.stats()["hits"] == hits + 1
+
+# Without an explicit version the loader's data fingerprint is used
+cache.clear()
+assert len(cache) == 0 and cache.stats()["version"] is None
+cache.rank(profile, custodians, governance)
+cache.rank(profile, custodians, governance)
+assert cache.stats()["version"] is not None and len(ranked) == 6
+stats = cache.stats()
+assert abs(stats["hit_rate"] - stats["hits"] / (stats["hits"] + stats["misses"])) < 1e-12
+print("  stats:", {k: v for k, v in stats.items() if k != "version"})
+
+recommendation_cache.rank_pathways = _rank
+
+print("\nAll tests passed!")
@@ -0,0 +1,102 @@
+"""Smoke test for recommendation reports (data_access/reports.py)."""
+import sys
+sys.path.insert(0, ".")
+
+import csv
+import io
+import threading
+import time
+from datetime import datetime
+
+from data_access import reports
+from data_access.loader import load_all_custodians, load_governance_bodies
+from data_access.models import ResearcherProfile
+from data_access.navigator import rank_pathways
+from data_access.reports import REPORT_FORMATS, ReportGenerator, render_report
+
+custodians = load_all_custodians()
+governance = load_governance_bodies()
+profile = ResearcherProfile(
+    researcher_type="Industry/commercial",
+    institution_country="England",
+    ethics_status="Approved",
+    funding_status="Funded (industry)",
+    data_needs=["Genomic data", "Hospital episodes (HES/inpatient)"],
+    geographic_scope=["England"],
+    population_size="10,000-100,000",
+    study_type="Genomic/GWAS",
+    timeline_priority="Within 12 months",
+    budget_range="£5,000-£20,000",
+)
+recs = rank_pathways(profile, custodians, governance, top_k=5)
+generated = datetime(2025, 1, 2, 3, 4)
+
+# --- Rendering ---
+print("=== render_report ===")
+markdown = render_report(profile, recs, "markdown", generated)
+assert markdown.startswith("# UK Health Data Access Navigator")
+assert "Generated: 2025-01-02 03:04" in markdown
+assert all(rec.custodian.name in markdown for rec in recs)
+
+html = render_report(profile, recs, "html", generated)
+assert html.startswith("<!DOCTYPE html>") and html.rstrip().endswith("</html>")
+assert html.count("<tr>") == len(recs) + 1
+
+rows = list(csv.reader(io.StringIO(render_report(profile, recs, "csv", generated))))
+assert len(rows) == len(recs) + 1
+assert [r[1] for r in rows[1:]] == [rec.custodian.id for rec in recs]
+
+try:
+    render_report(profile, recs, "pdf")
+except ValueError:
+    pass
+else:
+    raise AssertionError("unknown formats are rejected")
+print("  rendered", ", ".join(REPORT_FORMATS))
+
+# --- Background generator ---
+print("\n=== ReportGenerator ===")
+generator = ReportGenerator(maxsize=2)
+futures = {fmt: generator.submit(profile, recs, fmt) for fmt in REPORT_FORMATS}
+assert all(f.result(timeout=10) for f in futures.values())
+assert generator.stats()["misses"] == 3 and len(generator) == 2, "LRU keeps maxsize entries"
+assert generator.submit(profile, recs, "html") is futures["html"], "cached renders are shared"
+assert generator.get(profile, list(recs), "csv") == futures["csv"].result()
+assert generator.stats()["hits"] == 2
+
+# A render that raises is not cached, so the next request retries
+release = threading.Event()
+original = reports.render_report
+calls = []
+
+def flaky(*args):
+    calls.append(args)
+    release.wait(5)
+    if len(calls) == 1:
+        raise RuntimeError("boom")
+    return original(*args)
+
+reports.render_report = flaky
+try:
+    failing = generator.submit(profile, recs[:2], "markdown")
+    assert generator.submit(profile, recs[:2], "markdown") is failing, "in-flight renders are shared"
+    release.set()
+    try:
+        failing.result(timeout=10)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("the first render should fail")
+    # The failed entry is dropped by a done-callback, which may run just after result() returns
+    for _ in range(100):
+        if generator.submit(profile, recs[:2], "markdown") is not failing:
+            break
+        time.sleep(0.01)
+    retried = generator.get(profile, recs[:2], "markdown", timeout=10)
+finally:
+    reports.render_report = original
+assert len(calls) == 2 and retried.startswith("# UK Health")
+generator.shutdown()
+print("  stats:", generator.stats())
+
+print("\nAll tests passed!")
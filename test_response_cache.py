@@ -0,0 +1,103 @@
+"""Smoke test for the persistent response cache (response_cache.py)."""
+import sys
+sys.path.insert(0, ".")
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import response_cache
+from response_cache import ResponseCache, conversation_key
+
+clock = [1_000_000.0]
+_time = response_cache.time.time
+response_cache.time.time = lambda: clock[0]
+
+
+def tick(seconds=1.0):
+    clock[0] += seconds
+
+
+def conversation(question, system="You are helpful."):
+    return [{"role": "system", "content": system}, {"role": "user", "content": question}]
+
+
+# --- Keys ---
+print("=== Conversation keys ===")
+key = conversation_key(conversation("How do I access CPRD?"), "gpt-4o", 0.3)
+assert key == conversation_key(conversation("  how do I   ACCESS cprd?\n"), "gpt-4o", 0.3), "user turns are normalised"
+assert key == conversation_key(conversation("How do I access CPRD?"), "gpt-4o", 0.300001)
+assert key != conversation_key(conversation("How do I access CPRD?"), "gpt-4o-mini", 0.3)
+assert key != conversation_key(conversation("How do I access CPRD?"), "gpt-4o", 0.7)
+assert key != conversation_key(conversation("How do I access CPRD?", system="Navigator: SAIL"), "gpt-4o", 0.3)
+answered = conversation("Hi") + [{"role": "assistant", "content": "Use CPRD"}]
+assert conversation_key(answered, "gpt-4o", 0.3) != conversation_key(
+    conversation("Hi") + [{"role": "assistant", "content": "use cprd"}], "gpt-4o", 0.3
+), "assistant turns keep their case"
+
+# --- TTL expiry ---
+print("\n=== Entries expire after the TTL ===")
+cache = ResponseCache(None, ttl=60, max_entries=10)
+assert cache.get(key) is None
+assert cache.put(key, "gpt-4o", "Apply via the ERAP.") == "Apply via the ERAP."
+tick(59)
+assert cache.get(key) == "Apply via the ERAP."
+tick(2)
+assert cache.get(key) is None and cache.stats()["entries"] == 0, "expired on read"
+cache.put("a", "gpt-4o", "A")
+tick(61)
+cache.put("b", "gpt-4o", "B")
+assert cache.stats()["entries"] == 1, "expired on write"
+
+# --- LRU eviction ---
+print("\n=== Least recently used entries are evicted ===")
+cache = ResponseCache(None, ttl=3600, max_entries=3)
+for name in "abc":
+    cache.put(name, "gpt-4o", name.upper())
+    tick()
+assert cache.get("a") == "A"
+tick()
+cache.put("d", "gpt-4o", "D")
+assert cache.get("b") is None, "b was least recently used"
+assert [cache.get(name) for name in "acd"] == ["A", "C", "D"]
+assert cache.stats()["entries"] == 3
+
+# --- Counters and persistence ---
+print("\n=== Hit rates survive a restart ===")
+tmp = Path(tempfile.mkdtemp())
+path = tmp / "nested" / "responses.sqlite3"
+cache = ResponseCache(path)
+cache.get(key)
+cache.put(key, "gpt-4o", "Answer")
+cache.get(key)
+cache.get(key)
+stats = cache.stats()
+assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+assert abs(stats["hit_rate"] - 2 / 3) < 1e-9
+cache.close()
+
+reopened = ResponseCache(path)
+assert reopened.get(key) == "Answer"
+stats = reopened.stats()
+assert (stats["hits"], stats["misses"]) == (1, 0), "session counters start afresh"
+assert (stats["lifetime_hits"], stats["lifetime_misses"]) == (3, 1)
+assert stats["lifetime_hit_rate"] == 0.75
+reopened.clear()
+stats = reopened.stats()
+assert stats["entries"] == 0 and stats["lifetime_hits"] == 0 and stats["hits"] == 0
+reopened.close()
+print(f"  {path.name}: {stats}")
+
+# --- Unavailable database ---
+print("\n=== An unusable path disables the cache ===")
+blocker = tmp / "file"
+blocker.write_text("not a directory")
+broken = ResponseCache(blocker / "responses.sqlite3")
+assert broken.get(key) is None and broken.put(key, "gpt-4o", "Answer") == "Answer"
+assert broken.stats()["entries"] == 0
+broken.clear()
+
+shutil.rmtree(tmp)
+response_cache.time.time = _time
+
+print("\nAll tests passed!")
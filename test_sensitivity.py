@@ -0,0 +1,86 @@
+"""Smoke test for weight sensitivity analysis (data_access/sensitivity.py)."""
+import sys
+sys.path.insert(0, ".")
+
+import numpy as np
+
+from data_access.loader import load_all_custodians, load_governance_bodies
+from data_access.models import ResearcherProfile
+from data_access.navigator import DIMENSIONS, WEIGHTS, rank_pathways
+from data_access.sensitivity import grid_weights, weight_sensitivity
+
+custodians = load_all_custodians()
+governance = load_governance_bodies()
+profile = ResearcherProfile(
+    researcher_type="Academic researcher",
+    institution_country="England",
+    ethics_status="Approved",
+    funding_status="Funded (grant)",
+    data_needs=["Primary care (GP records)", "Hospital episodes (HES/inpatient)"],
+    geographic_scope=["England", "Wales"],
+    population_size="100,000-1M",
+    study_type="Observational/epidemiological",
+    timeline_priority="Within 6 months",
+    budget_range="Free/no budget",
+)
+recs = rank_pathways(profile, custodians, governance, top_k=8)
+scores = np.array([[r.dimension_scores[dim] for dim in DIMENSIONS] for r in recs])
+base = np.array([WEIGHTS[dim] for dim in DIMENSIONS])
+base = base / base.sum()
+
+
+def overall_at(d, t):
+    """Scores with weight ``d`` set to ``t`` and the others rescaled proportionally."""
+    weights = base * (1 - t) / (1 - base[d])
+    weights[d] = t
+    return scores @ weights
+
+
+# --- Sampling ---
+print("=== Weight samples ===")
+report = weight_sensitivity(recs, samples=500)
+assert report.samples == 500 and np.allclose(report.weights.sum(axis=1), 1)
+assert np.array_equal(report.weights, weight_sensitivity(recs, samples=500).weights), "seeded"
+grid = grid_weights(base, steps=3)
+assert grid.shape == (3 ** len(DIMENSIONS), len(DIMENSIONS)) and np.allclose(grid.sum(axis=1), 1)
+assert weight_sensitivity(recs, method="grid").samples == len(grid)
+assert [p.base_rank for p in report.pathways] == list(range(1, len(recs) + 1))
+assert all(p.best_rank <= p.mean_rank <= p.worst_rank for p in report.pathways)
+assert abs(sum(p.top_share for p in report.pathways) - 1) < 1e-9, "exactly one pathway leads each sample"
+assert 0 <= report.top_choice_stability <= 1
+tight = weight_sensitivity(recs, concentration=1e6, samples=200)
+assert all(p.mean_rank == p.base_rank for p in tight.pathways), "near-default weights keep the ranking"
+print(f"  top choice kept first in {report.top_choice_stability:.0%} of samples")
+
+# --- Tipping points agree with brute force ---
+print("\n=== Tipping points ===")
+checked = 0
+for i, pathway in enumerate(report.pathways[1:], start=1):
+    for d, dim in enumerate(DIMENSIONS):
+        t = pathway.tipping_points[dim]
+        if t is None:
+            continue
+        at = overall_at(d, t)
+        assert abs(at[i] - at[0]) < 0.05, (pathway.custodian.id, dim, at[i], at[0])
+        beyond = min(max(t + (0.01 if t > base[d] else -0.01), 0), 1)
+        assert overall_at(d, beyond)[i] > overall_at(d, beyond)[0], (pathway.custodian.id, dim)
+        checked += 1
+assert checked, "the fixture should have at least one tipping point"
+print(f"  {checked} tipping points verified")
+
+# --- Degenerate weights ---
+print("\n=== All weight on one dimension ===")
+only_fit = {dim: 1.0 if dim == "data_fit" else 0.0 for dim in DIMENSIONS}
+degenerate = weight_sensitivity(recs, weights=only_fit, samples=50)
+assert all(p.tipping_points["data_fit"] is None for p in degenerate.pathways)
+assert all(np.isfinite(list(filter(None, p.tipping_points.values()))).all() for p in degenerate.pathways)
+
+for bad in ({dim: 0.0 for dim in DIMENSIONS}, {**WEIGHTS, "data_fit": -1.0}):
+    try:
+        weight_sensitivity(recs, weights=bad)
+        raise AssertionError("invalid weights must be rejected")
+    except ValueError:
+        pass
+assert weight_sensitivity([]).pathways == []
+
+print("\nAll tests passed!")
@@ -0,0 +1,115 @@
+"""Smoke test for the catalogue snapshot and the hot-reloading registry."""
+import sys
+sys.path.insert(0, ".")
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from data_access import loader, snapshot as snapshots
+from data_access.registry import CustodianRegistry
+from data_access.snapshot import build_snapshot, load_snapshot
+
+tmp = Path(tempfile.mkdtemp())
+custodians_dir = tmp / "custodians"
+shutil.copytree(loader._CUSTODIANS_DIR, custodians_dir)
+governance_file = tmp / "governance_bodies.json"
+shutil.copy(loader._GOVERNANCE_FILE, governance_file)
+snapshot_file = tmp / "catalogue.snapshot.pickle"
+sources = dict(custodians_dir=custodians_dir, governance_file=governance_file)
+names = sorted(fp.name for fp in custodians_dir.glob("*.json"))
+
+unpickled = []
+_loads = snapshots.pickle.loads
+snapshots.pickle.loads = lambda data: unpickled.append(1) or _loads(data)
+rehashed = []
+_hash = snapshots._content_hash
+snapshots._content_hash = lambda contents: rehashed.append(1) or _hash(contents)
+
+
+def bump(fp, seconds=10):
+    st = fp.stat()
+    os.utime(fp, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+# --- Snapshot build, memoisation and invalidation ---
+print("=== Snapshot ===")
+built, errors = build_snapshot(snapshot_file, **sources)
+assert not errors and len(built.custodian_files) == len(names)
+snapshots._LOADED.clear()
+rehashed.clear()
+
+first = load_snapshot(snapshot_file, **sources)
+assert first is not None and len(unpickled) == 1
+assert load_snapshot(snapshot_file, **sources) is first and len(unpickled) == 1, "unpickled once per pickle state"
+assert not rehashed, "unchanged sources are checked by stat only"
+
+# Touching a file without editing it rehashes once, then stores the new state
+bump(custodians_dir / names[0])
+assert load_snapshot(snapshot_file, **sources) is first and len(rehashed) == 1
+assert load_snapshot(snapshot_file, **sources) is first and len(rehashed) == 1
+snapshots._LOADED.clear()
+assert load_snapshot(snapshot_file, **sources) is not None and len(rehashed) == 1, "new states were persisted"
+
+# Editing, adding or removing a source invalidates it
+target = custodians_dir / names[0]
+original = target.read_text(encoding="utf-8")
+data = json.loads(original)
+target.write_text(json.dumps({**data, "description": data["description"] + " Edited."}), encoding="utf-8")
+bump(target)
+assert load_snapshot(snapshot_file, **sources) is None
+target.write_text(original, encoding="utf-8")
+bump(target, 20)
+assert load_snapshot(snapshot_file, **sources) is not None, "restored content matches the hash again"
+(custodians_dir / "extra.json").write_text(original, encoding="utf-8")
+assert load_snapshot(snapshot_file, **sources) is None
+(custodians_dir / "extra.json").unlink()
+assert load_snapshot(snapshot_file, **sources) is not None
+snapshot_file.write_bytes(b"not a pickle")
+assert load_snapshot(snapshot_file, **sources) is None
+print(f"  unpickled {len(unpickled)}x, rehashed {len(rehashed)}x")
+
+# --- Every load path applies the schema ---
+print("\n=== Schema validation on every path ===")
+invalid = {**data, "id": "broken", "regions": "England"}
+(custodians_dir / "broken.json").write_text(json.dumps(invalid), encoding="utf-8")
+_, errors = build_snapshot(snapshot_file, **sources)
+assert "custodians/broken.json" in errors
+assert loader._load_custodian_file(custodians_dir / "broken.json") is None
+assert loader._load_custodian_file(target).id == data["id"]
+(custodians_dir / "broken.json").unlink()
+
+# --- Hot-reloading registry ---
+print("\n=== Registry ===")
+registry = CustodianRegistry(check_interval=0, **sources)
+v1 = registry.snapshot()
+assert v1.version == 1 and [c.id for c in v1.custodians] == [c.id for c in first.custodians]
+assert registry.snapshot() is v1, "no change, no new snapshot"
+
+target.write_text(json.dumps({**data, "short_name": "Renamed"}), encoding="utf-8")
+bump(target, 30)
+v2 = registry.snapshot()
+assert v2.version == 2 and v2.custodian(data["id"]).short_name == "Renamed"
+untouched = [c for c in v1.custodians if c.id != data["id"]]
+assert all(v2.custodian(c.id) is c for c in untouched), "unchanged files are not reparsed"
+
+# An edit that breaks the schema keeps the last good parse
+target.write_text(json.dumps({**data, "short_name": "Broken", "regions": "England"}), encoding="utf-8")
+bump(target, 40)
+assert registry.snapshot().custodian(data["id"]).short_name == "Renamed"
+
+(custodians_dir / "new.json").write_text(json.dumps({**data, "id": "new_custodian"}), encoding="utf-8")
+assert registry.snapshot().custodian("new_custodian") is not None
+(custodians_dir / "new.json").unlink()
+latest = registry.snapshot()
+assert latest.custodian("new_custodian") is None and len(latest.custodians) == len(names)
+assert registry.refresh(force=True).version == latest.version + 1
+print(f"  version {registry.version}, {len(latest.custodians)} custodians")
+
+snapshots.pickle.loads = _loads
+snapshots._content_hash = _hash
+shutil.rmtree(tmp)
+
+print("\nAll tests passed!")
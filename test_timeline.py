@@ -0,0 +1,86 @@
+"""Smoke test for Monte Carlo pathway timelines (data_access/timeline.py)."""
+import sys
+sys.path.insert(0, ".")
+
+import numpy as np
+
+from data_access.loader import load_all_custodians, load_governance_bodies
+from data_access.models import DataCustodian, GovernanceBody, GovernanceTier, ResearcherProfile, TimelineEstimate
+from data_access.navigator import rank_pathways
+from data_access.timeline import simulate_timelines
+
+custodians = load_all_custodians()
+governance = load_governance_bodies()
+
+
+def custodian(*phases):
+    return DataCustodian(
+        id="test", name="Test", short_name="Test", description="", url="",
+        timeline=tuple(TimelineEstimate(f"Phase {i}", *p) for i, p in enumerate(phases)),
+    )
+
+
+# --- Analytic means and fixed phases ---
+print("=== Means match the triangular and PERT formulas ===")
+skewed = custodian((2, 4, 20), (1, 1, 1))
+triangular = simulate_timelines([(skewed, ())], draws=200_000)
+pert = simulate_timelines([(skewed, ())], draws=200_000, distribution="pert")
+assert abs(triangular.mean[0] - ((2 + 4 + 20) / 3 + 1)) < 0.05, triangular.mean
+assert abs(pert.mean[0] - ((2 + 4 * 4 + 20) / 6 + 1)) < 0.05, pert.mean
+assert pert.percentile(95)[0] < triangular.percentile(95)[0], "PERT puts less weight on the tails"
+print("  triangular", triangular.summary(0), "pert", pert.summary(0))
+
+fixed = simulate_timelines([(custodian((3, 3, 3), (5, 5, 5)), ()), (custodian(), ())], draws=10)
+assert fixed.values.tolist() == [[8, 8, 8], [20, 20, 20]], "no spread and no timeline are deterministic"
+
+tiered = GovernanceBody(id="g", name="G", short_name="G", description="",
+                        tiers=(GovernanceTier("Tier 1", "", typical_weeks=10),))
+assert simulate_timelines([(custodian((3, 3, 3)), (tiered,))], draws=10).values[0, 0] == 13
+spread = simulate_timelines([(custodian((3, 3, 3)), (tiered,))], tier_spread=(0.5, 2.0), distribution="pert")
+assert 8 < spread.percentile(50)[0] < spread.percentile(95)[0] < 23
+
+# --- Catalogue-wide properties ---
+print("\n=== Percentiles, determinism and distributions ===")
+pathways = [(c, governance[:2]) for c in custodians]
+for distribution in ("triangular", "pert"):
+    first = simulate_timelines(pathways, distribution=distribution, draws=20_000)
+    assert np.array_equal(first.values, simulate_timelines(pathways, distribution=distribution, draws=20_000).values)
+    assert not np.array_equal(first.values, simulate_timelines(pathways, distribution=distribution,
+                                                               draws=20_000, seed=1).values)
+    assert (np.diff(first.values, axis=1) >= 0).all(), "percentiles are ordered"
+    for (c, route), row in zip(pathways, first.values):
+        low = sum(min(t.min_weeks, t.typical_weeks) for t in c.timeline)
+        high = sum(max(t.max_weeks, t.typical_weeks) for t in c.timeline)
+        tiers = sum(b.tiers[0].typical_weeks for b in route if b.tiers)
+        if c.timeline:
+            assert low + tiers - 1e-3 <= row[0] and row[-1] <= high + tiers + 1e-3, (c.id, row)
+    print(f"  {distribution}: P50 median {np.median(first.percentile(50)):.1f} weeks")
+
+try:
+    simulate_timelines(pathways, distribution="normal")
+    raise AssertionError("unknown distributions are rejected")
+except ValueError:
+    pass
+
+# --- Ranking by a simulated percentile ---
+print("\n=== rank_pathways(timeline_percentile=...) ===")
+profile = ResearcherProfile(
+    researcher_type="Academic researcher",
+    institution_country="England",
+    ethics_status="Approved",
+    funding_status="Funded (grant)",
+    data_needs=["Primary care (GP records)"],
+    geographic_scope=["England"],
+    population_size="100,000-1M",
+    study_type="Observational/epidemiological",
+    timeline_priority="ASAP",
+    budget_range="Free/no budget",
+)
+typical = rank_pathways(profile, custodians, governance)
+assert all(r.timeline_percentiles is None and r.speed_basis is None for r in typical)
+p80 = rank_pathways(profile, custodians, governance, timeline_percentile=80)
+assert all(r.speed_basis == "P80" and r.timeline_percentiles for r in p80)
+assert {r.custodian.id for r in p80} == {r.custodian.id for r in typical}
+print("  top under P80:", [r.custodian.id for r in p80[:3]])
+
+print("\nAll tests passed!")
@@ -0,0 +1,114 @@
+"""Smoke test for the Navigator figures and their cache (data_access/visualizations.py)."""
+import sys
+sys.path.insert(0, ".")
+
+import json
+from dataclasses import replace
+
+from data_access.loader import load_all_custodians, load_governance_bodies
+from data_access.models import ResearcherProfile
+from data_access.navigator import rank_pathways
+from data_access.visualizations import (
+    FigureCache,
+    create_cost_comparison,
+    create_pathway_sankey,
+    create_score_overview,
+    create_timeline_gantt,
+)
+
+custodians = load_all_custodians()
+governance = load_governance_bodies()
+profile = ResearcherProfile(
+    researcher_type="Academic researcher",
+    institution_country="England",
+    ethics_status="Approved",
+    funding_status="Funded (grant)",
+    data_needs=["Primary care (GP records)", "Hospital episodes (HES/inpatient)"],
+    geographic_scope=["England", "Wales"],
+    population_size="100,000-1M",
+    study_type="Observational/epidemiological",
+    timeline_priority="Within 6 months",
+    budget_range="Free/no budget",
+)
+recs = rank_pathways(profile, custodians, governance)
+
+# --- FigureCache keys ---
+print("=== FigureCache ===")
+cache = FigureCache(maxsize=3)
+first = cache.to_json(create_score_overview, recs)
+assert cache.stats()["misses"] == 1
+assert cache.to_json(create_score_overview, list(recs)) is first, "equal recommendation sets share an entry"
+assert cache.stats()["hits"] == 1
+
+cache.to_json(create_cost_comparison, recs, 2, "Academic researcher")
+cache.to_json(create_cost_comparison, recs, 3, "Academic researcher")
+assert cache.stats()["misses"] == 3, "builder name and extra arguments are part of the key"
+
+cache.to_json(create_score_overview, recs[:3])
+assert len(cache) == 3 and cache.stats()["misses"] == 4, "a different recommendation set misses"
+
+# A changed score or custodian changes the digest
+rescored = [replace(recs[0], overall_score=recs[0].overall_score - 1)] + recs[1:]
+misses = cache.stats()["misses"]
+cache.to_json(create_score_overview, rescored)
+assert cache.stats()["misses"] == misses + 1
+
+# Least recently used entries are evicted first
+assert len(cache) == 3
+cache.to_json(create_score_overview, recs)
+assert cache.stats()["misses"] == misses + 2, "the oldest entry was evicted"
+
+figure = cache.figure(create_score_overview, recs)
+assert json.loads(figure.to_json()) == json.loads(create_score_overview(recs).to_json())
+cache.clear()
+assert len(cache) == 0
+print("  stats:", cache.stats())
+
+# --- Gantt: one trace per phase name ---
+print("\n=== Timeline Gantt ===")
+gantt = create_timeline_gantt(recs)
+groups = {p.phase for r in recs for p in r.custodian.timeline}
+if any(g.tiers and g.tiers[0].typical_weeks for r in recs for g in r.required_governance):
+    groups.add("Governance")
+assert {t.name for t in gantt.data} == groups and len(gantt.data) == len(groups)
+assert gantt.layout.barmode == "overlay"
+
+bars = {}
+for trace in gantt.data:
+    for name, weeks, base in zip(trace.y, trace.x, trace.base):
+        bars.setdefault(name, []).append((int(base), int(weeks)))
+for rec in recs:
+    segments = sorted(bars.get(rec.custodian.short_name, []))
+    ends = [base + weeks for base, weeks in segments]
+    assert [base for base, _ in segments] == [0] + ends[:-1], "segments are contiguous from week 0"
+    assert (ends[-1] if ends else 0) == rec.estimated_total_weeks, rec.custodian.id
+shown = [r.custodian.short_name for r in recs if r.custodian.short_name in bars]
+assert list(gantt.layout.yaxis.categoryarray) == list(dict.fromkeys(shown))
+assert len(create_timeline_gantt([]).data) == 0
+print(f"  {len(recs)} pathways in {len(gantt.data)} traces")
+
+# --- Sankey: needs -> custodians -> access models ---
+print("\n=== Pathway Sankey ===")
+sankey = create_pathway_sankey(recs, profile.data_needs).data[0]
+labels = list(sankey.node.label)
+models = sorted({r.custodian.access_model for r in recs})
+assert len(labels) == len(profile.data_needs) + len(recs) + len(models)
+links = list(zip(sankey.link.source.tolist(), sankey.link.target.tolist(), sankey.link.value.tolist()))
+expected = [
+    (n, len(profile.data_needs) + c, max(rec.overall_score / 10, 1))
+    for n, need in enumerate(profile.data_needs)
+    for c, rec in enumerate(recs)
+    if need.lower() in {t.lower() for t in rec.custodian.data_types}
+] + [
+    (len(profile.data_needs) + c, len(profile.data_needs) + len(recs) + models.index(rec.custodian.access_model),
+     max(rec.overall_score / 10, 1))
+    for c, rec in enumerate(recs)
+]
+assert [(s, t) for s, t, _ in links] == [(s, t) for s, t, _ in expected]
+assert all(abs(v - e) < 1e-4 for (_, _, v), (_, _, e) in zip(links, expected))
+assert len(sankey.link.color) == len(links)
+empty = create_pathway_sankey([], profile.data_needs).data[0]
+assert len(empty.link.source) == 0 and list(empty.node.label) == [n.split("(")[0].strip() for n in profile.data_needs]
+print(f"  {len(links)} links")
+
+print("\nAll tests passed!")